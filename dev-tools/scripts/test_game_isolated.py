@@ -73,7 +73,7 @@ def test_imports():
 		'core.achievements_idle',
 		'core.premium_shop',
 		'core.engagement_system',
-		'utils.db_fixed',
+		'utils.db',
 		'utils.performance',
 		'ui.main_screen'
 	]
@@ -27,7 +27,7 @@ def test_basic_imports():
 		from core.achievements_idle import IdleAchievementManager
 		print("OK - IdleAchievementManager importado")
 		
-		from utils.db_fixed import DatabaseManager
+		from utils.db import DatabaseManager
 		print("OK - DatabaseManager importado")
 		
 		return True
@@ -27,6 +27,11 @@ class GameState:
 		"""Inicializa el estado del juego."""
 		self.save_manager = get_save_manager()
 
+		# Monedas (propiedad coins) y observadores de cambios en monedas/mejoras;
+		# se crean primero porque los subsistemas pueden leer coins al inicializarse
+		self._coins = 0
+		self._change_listeners: list = []
+
 		# Sistema de recursos múltiples
 		self.resource_manager = ResourceManager()
 
@@ -113,7 +118,6 @@ class GameState:
 		}
 
 		# Estado principal del juego (mantenido para compatibilidad)
-		self.coins = 0
 		self.total_clicks = 0
 		self.multiplier = 1.0
 		self.total_playtime = 0
@@ -130,6 +134,10 @@ class GameState:
 		# Estado de la aplicación
 		self.game_running = False
 
+		# Contador de cambios en las estadísticas (las pantallas lo comparan
+		# para saltarse refrescos cuando nada ha cambiado)
+		self.stats_version = 0
+
 		# Sistema de optimización de performance
 		from utils.performance import get_performance_optimizer
 
@@ -180,6 +188,40 @@ class GameState:
 		# Verificar sistemas de datos disponibles
 		logging.info(f"Juego inicializado: {self.coins} monedas, {self.total_clicks} clics totales")
 
+	@property
+	def coins(self) -> int:
+		"""Monedas actuales del jugador."""
+		return self._coins
+
+	@coins.setter
+	def coins(self, value: int) -> None:
+		if value != self._coins:
+			self._coins = value
+			self._notify_change()
+
+	def add_change_listener(self, callback) -> None:
+		"""Registra un callback sin argumentos para cambios de monedas o mejoras.
+
+		Args:
+			callback: Función a llamar tras cada cambio
+		"""
+		if callback not in self._change_listeners:
+			self._change_listeners.append(callback)
+
+	def remove_change_listener(self, callback) -> None:
+		"""Elimina un callback registrado con add_change_listener.
+
+		Args:
+			callback: Función registrada previamente
+		"""
+		if callback in self._change_listeners:
+			self._change_listeners.remove(callback)
+
+	def _notify_change(self) -> None:
+		"""Avisa a los observadores registrados de un cambio de estado."""
+		for callback in tuple(self._change_listeners):
+			callback()
+
 	def _setup_inventory_bridge(self):
 		"""
 		Configura un bridge entre el sistema viejo (Inventory) y el nuevo (EquipmentManager).
@@ -466,6 +508,7 @@ class GameState:
 		self.total_clicks += 1
 		self.session_clicks += 1
 		self.session_coins += coins_earned
+		self.stats_version += 1
 
 		# Incrementar estadísticas
 		self.save_manager.increment_stat("clicks_today", 1)
@@ -509,6 +552,9 @@ class GameState:
 		# Recolectar producción de edificios
 		produced = self.building_manager.collect_all_production()
 
+		if produced:
+			self.stats_version += 1
+
 		# Actualizar lifetime coins si se produjeron monedas
 		if ResourceType.COINS in produced:
 			self.lifetime_coins += produced[ResourceType.COINS]
@@ -592,6 +638,7 @@ class GameState:
 
 		self.coins -= amount
 		self.resource_manager.subtract_resource(ResourceType.COINS, amount)
+		self.stats_version += 1
 		return True
 
 	def on_building_purchased(self, building_type, new_count: int) -> None:
@@ -630,6 +677,7 @@ class GameState:
 		except Exception as e:
 			logging.debug(f"Upgrade achievement check error: {e}")
 
+		self._notify_change()
 		logging.debug("Mejora comprada: %s, total upgrades: %d", upgrade_type, total_upgrades)
 
 	def get_game_stats(self) -> dict[str, Any]:
@@ -922,6 +970,7 @@ class GameState:
 		# Resetear mejoras
 		for upgrade in self.upgrade_manager.upgrades.values():
 			upgrade.level = 0
+		self.upgrade_manager.invalidate_modifiers()
 
 		# Resetear bonificaciones temporales
 		self.bonus_multiplier = 1.0
@@ -265,6 +265,7 @@ class PrestigeManager:
 			if hasattr(game_state, 'upgrade_manager'):
 				for upgrade_type, upgrade in game_state.upgrade_manager.upgrades.items():
 					upgrade.level = 0
+				game_state.upgrade_manager.invalidate_modifiers()
 			
 			# NO resetear logros - se mantienen
 			
@@ -14,7 +14,7 @@ import logging
 import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, List, Optional, Set, Tuple, Any
 
 from core.resources import ResourceType, ResourceManager
 
@@ -205,6 +205,9 @@ class TalentManager:
 		# Callback para cuando se actualiza un talento
 		self.on_talent_updated_callback = None
 
+		# Resumen memoizado de niveles (se invalida al cambiar cualquier nivel)
+		self._summary: Optional[Tuple[int, int, Dict[TalentBranch, int]]] = None
+
 		# Inicializar información de talentos
 		self._initialize_talent_info()
 
@@ -583,6 +586,7 @@ class TalentManager:
 		if talent.upgrade():
 			self.talent_points -= cost
 			self.total_points_spent += cost
+			self._summary = None
 
 			# Verificar logros relacionados con talentos
 			self._check_talent_achievements()
@@ -678,10 +682,32 @@ class TalentManager:
 
 		self.talent_points += points_returned
 		self.total_points_spent = 0
+		self._summary = None
 
 		logging.info(f"Talentos reiniciados. {points_returned} puntos devueltos")
 		return points_returned
 
+	def summarize(self) -> Tuple[int, int, Dict[TalentBranch, int]]:
+		"""Resume los niveles de talentos en una sola pasada.
+
+		El resultado se memoiza hasta la siguiente mejora o reinicio.
+
+		Returns:
+			Tupla (niveles totales, talentos desbloqueados, niveles por rama)
+		"""
+		if self._summary is None:
+			total = 0
+			unlocked = 0
+			per_branch = dict.fromkeys(TalentBranch, 0)
+			for talent in self.talents.values():
+				level = talent.level
+				total += level
+				if level > 0:
+					unlocked += 1
+				per_branch[talent.info.branch] += level
+			self._summary = (total, unlocked, per_branch)
+		return self._summary
+
 	def set_talent_updated_callback(self, callback) -> None:
 		"""Establece callback para cuando se actualiza un talento"""
 		self.on_talent_updated_callback = callback
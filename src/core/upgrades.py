@@ -7,8 +7,9 @@ Inspirado en Cookie Clicker y Adventure Capitalist.
 """
 
 import logging
+from bisect import bisect_right
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 from core.resources import ResourceType, ResourceManager
 
@@ -58,6 +59,22 @@ class UpgradeInfo:
 	prerequisite_level: int = 1      # Nivel de jugador requerido
 	prerequisite_upgrades: list[UpgradeType] | None = None  # Mejoras prerequisito
 	emoji: str = "⚡"
+	# Costo por nivel precalculado (solo con nivel máximo; ver __post_init__)
+	cost_table: tuple[int, ...] = field(init=False, repr=False, default=())
+	# Costo acumulado: cost_prefix[n] = suma de los costos de los niveles 0..n-1
+	cost_prefix: tuple[int, ...] = field(init=False, repr=False, default=())
+	
+	def __post_init__(self):
+		"""Precalcula el costo de cada nivel para evitar potencias en tiempo de juego."""
+		if self.max_level > 0:
+			self.cost_table = tuple(
+				int(self.base_cost * (self.cost_scaling ** level))
+				for level in range(self.max_level)
+			)
+			prefix = [0]
+			for cost in self.cost_table:
+				prefix.append(prefix[-1] + cost)
+			self.cost_prefix = tuple(prefix)
 
 
 class Upgrade:
@@ -73,6 +90,11 @@ class Upgrade:
 		self.upgrade_type = upgrade_type
 		self.level = level
 		self.last_purchase_time = 0.0
+		
+		# Costo memorizado y nivel para el que se calculó (el costo solo
+		# depende del nivel, así que un cambio de nivel lo invalida)
+		self._cost_level = -1
+		self._cost: int | float = 0
 	
 	def get_current_cost(self, info: UpgradeInfo) -> int | float:
 		"""Calcula el costo actual de la siguiente mejora.
@@ -83,10 +105,19 @@ class Upgrade:
 		Returns:
 			Costo actual para subir al siguiente nivel
 		"""
-		if info.max_level > 0 and self.level >= info.max_level:
-			return float('inf')  # No se puede mejorar más
-		
-		return int(info.base_cost * (info.cost_scaling ** self.level))
+		level = self.level
+		if level == self._cost_level:
+			return self._cost
+		
+		if info.max_level > 0:
+			# Tabla precalculada; fuera de ella no se puede mejorar más
+			cost = info.cost_table[level] if level < info.max_level else float('inf')
+		else:
+			cost = int(info.base_cost * (info.cost_scaling ** level))
+		
+		self._cost_level = level
+		self._cost = cost
+		return cost
 	
 	def get_total_effect(self, info: UpgradeInfo) -> float:
 		"""Calcula el efecto total acumulado de esta mejora.
@@ -153,6 +184,21 @@ class UpgradeManager:
 		self._initialize_upgrade_info()
 		self._initialize_upgrades()
 		
+		# Mejoras agrupadas por categoría (la información es fija tras inicializar)
+		self._by_category: dict[UpgradeCategory, list[UpgradeType]] = {}
+		for upgrade_type, info in self.upgrade_info.items():
+			self._by_category.setdefault(info.category, []).append(upgrade_type)
+		
+		# Multiplicador de costo de edificios y nivel de la mejora con el que se
+		# calculó (se recalcula solo cuando ese nivel cambia)
+		self._cost_reduction_level = -1
+		self._building_cost_multiplier = 1.0
+		
+		# Multiplicadores derivados de todas las mejoras, calculados bajo demanda
+		# y descartados cuando cambian los niveles (ver invalidate_modifiers)
+		self._click_multiplier: float | None = None
+		self._building_multiplier: float | None = None
+		
 		logging.info("Gestor de mejoras inicializado")
 	
 	def _initialize_upgrade_info(self):
@@ -301,12 +347,58 @@ class UpgradeManager:
 			category: Categoría de mejoras
 			
 		Returns:
-			Lista de tipos de mejora en esa categoría
+			Lista de tipos de mejora en esa categoría (precalculada, no modificar)
+		"""
+		return self._by_category.get(category, [])
+	
+	def get_costs_range(self, upgrade_type: UpgradeType, lo: int, hi: int) -> list[int]:
+		"""Obtiene el costo de cada nivel en el rango [lo, hi) de una sola vez.
+		
+		Pensado para funciones como "comprar máximo" o un planificador de costos.
+		
+		Args:
+			upgrade_type: Tipo de mejora
+			lo: Primer nivel (incluido)
+			hi: Último nivel (excluido); se recorta al nivel máximo si lo hay
+			
+		Returns:
+			Lista con el costo de cada nivel
 		"""
-		return [
-			upgrade_type for upgrade_type, info in self.upgrade_info.items()
-			if info.category == category
-		]
+		info = self.upgrade_info[upgrade_type]
+		if info.cost_table:
+			return list(info.cost_table[lo:hi])
+		return [int(info.base_cost * (info.cost_scaling ** level)) for level in range(lo, hi)]
+	
+	def get_max_affordable(self, upgrade_type: UpgradeType, budget: float) -> int:
+		"""Calcula cuántos niveles seguidos se pueden comprar con un presupuesto.
+		
+		Con nivel máximo usa la tabla de costos acumulados y una búsqueda
+		binaria, sin recorrer nivel a nivel.
+		
+		Args:
+			upgrade_type: Tipo de mejora
+			budget: Recursos disponibles
+			
+		Returns:
+			Número de niveles comprables desde el nivel actual
+		"""
+		info = self.upgrade_info[upgrade_type]
+		level = self.upgrades[upgrade_type].level
+		
+		if info.cost_prefix:
+			if level >= info.max_level:
+				return 0
+			prefix = info.cost_prefix
+			return bisect_right(prefix, prefix[level] + budget) - 1 - level
+		
+		# Sin nivel máximo: el costo crece geométricamente, pocas iteraciones
+		count = 0
+		cost = info.base_cost * (info.cost_scaling ** level)
+		while 0 < int(cost) <= budget:
+			budget -= int(cost)
+			count += 1
+			cost *= info.cost_scaling
+		return count
 	
 	def get_available_upgrades(self, player_level: int = 1) -> list[UpgradeType]:
 		"""Obtiene lista de mejoras disponibles para el nivel del jugador.
@@ -346,6 +438,8 @@ class UpgradeManager:
 		upgrade = self.upgrades[upgrade_type]
 		info = self.upgrade_info[upgrade_type]
 		success = upgrade.upgrade(info, self.resource_manager)
+		if success:
+			self.invalidate_modifiers()
 		
 		# Si la compra fue exitosa, llamar hook del game state
 		if success and game_state:
@@ -370,7 +464,26 @@ class UpgradeManager:
 		info = self.upgrade_info[upgrade_type]
 		return upgrade.get_total_effect(info)
 	
+	def invalidate_modifiers(self) -> None:
+		"""Descarta los multiplicadores cacheados.
+		
+		Debe llamarse siempre que se modifiquen niveles de mejoras fuera de
+		purchase_upgrade/load_save_data (p. ej. al resetear por prestigio).
+		"""
+		self._click_multiplier = None
+		self._building_multiplier = None
+	
 	def get_click_multiplier(self) -> float:
+		"""Obtiene el multiplicador total para clics (cacheado hasta que cambien las mejoras).
+		
+		Returns:
+			Multiplicador de ingresos por clic
+		"""
+		if self._click_multiplier is None:
+			self._click_multiplier = self._compute_click_multiplier()
+		return self._click_multiplier
+	
+	def _compute_click_multiplier(self) -> float:
 		"""Calcula el multiplicador total para clics.
 		
 		Returns:
@@ -392,6 +505,16 @@ class UpgradeManager:
 		return click_bonus * global_bonus * avg_critical
 	
 	def get_building_multiplier(self) -> float:
+		"""Obtiene el multiplicador total para edificios (cacheado hasta que cambien las mejoras).
+		
+		Returns:
+			Multiplicador de ingresos de edificios
+		"""
+		if self._building_multiplier is None:
+			self._building_multiplier = self._compute_building_multiplier()
+		return self._building_multiplier
+	
+	def _compute_building_multiplier(self) -> float:
 		"""Calcula el multiplicador total para edificios.
 		
 		Returns:
@@ -414,8 +537,12 @@ class UpgradeManager:
 		Returns:
 			Multiplicador de reducción de costos (< 1.0 es mejor)
 		"""
-		cost_reduction = self.get_total_effect(UpgradeType.BUILDING_COST_REDUCTION)
-		return max(0.1, 1.0 - cost_reduction)  # Mínimo 10% del costo original
+		upgrade = self.upgrades[UpgradeType.BUILDING_COST_REDUCTION]
+		if upgrade.level != self._cost_reduction_level:
+			self._cost_reduction_level = upgrade.level
+			cost_reduction = upgrade.get_total_effect(self.upgrade_info[UpgradeType.BUILDING_COST_REDUCTION])
+			self._building_cost_multiplier = max(0.1, 1.0 - cost_reduction)  # Mínimo 10% del costo original
+		return self._building_cost_multiplier
 	
 	def get_upgrade_stats(self) -> dict[str, Any]:
 		"""Obtiene estadísticas generales de mejoras.
@@ -428,8 +555,11 @@ class UpgradeManager:
 		
 		for upgrade_type, upgrade in self.upgrades.items():
 			info = self.upgrade_info[upgrade_type]
-			for level in range(upgrade.level):
-				total_spent += int(info.base_cost * (info.cost_scaling ** level))
+			if info.cost_table:
+				total_spent += sum(info.cost_table[:upgrade.level])
+			else:
+				for level in range(upgrade.level):
+					total_spent += int(info.base_cost * (info.cost_scaling ** level))
 		
 		return {
 			'total_upgrades': total_upgrades,
@@ -471,4 +601,5 @@ class UpgradeManager:
 				except ValueError:
 					logging.warning("Tipo de mejora desconocido: %s", upgrade_type_str)
 		
+		self.invalidate_modifiers()
 		logging.info("Datos de mejoras cargados")
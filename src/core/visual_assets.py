@@ -9,11 +9,15 @@ Inspirado en los mejores idle clickers del mercado.
 import logging
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Texturas de fondo ya decodificadas, compartidas por todas las instancias
+# del gestor (clave: ruta del archivo)
+_background_textures: Dict[str, Any] = {}
+
 
 class BackgroundType(Enum):
     """Tipos de fondos disponibles en el juego."""
@@ -216,6 +220,28 @@ class VisualAssetManager:
         """Obtiene la ruta completa de un fondo."""
         return str(self.background_path / f"{background_type.value}.png")
     
+    def get_background_texture(self, background_type: BackgroundType) -> Optional[Any]:
+        """Obtiene la textura de un fondo, decodificándola solo la primera vez.
+
+        Las tarjetas que comparten fondo reciben la misma textura, así que no
+        se repite la carga de disco ni la subida a la GPU.
+        """
+        path = self.get_background_path(background_type)
+        if path not in _background_textures:
+            from kivy.core.image import Image as CoreImage  # Solo se necesita Kivy aquí
+
+            try:
+                _background_textures[path] = CoreImage(path).texture
+            except Exception as e:
+                logger.warning(f"No se pudo cargar la textura de fondo {path}: {e}")
+                _background_textures[path] = None
+        return _background_textures[path]
+
+    def preload_background_textures(self) -> None:
+        """Carga de una vez las texturas de fondo de todos los mundos."""
+        for theme in self.world_themes.values():
+            self.get_background_texture(theme.background)
+
     def get_effect_path(self, effect_type: EffectType) -> str:
         """Obtiene la ruta completa de un efecto."""
         return str(self.effects_path / f"{effect_type.value}.png")
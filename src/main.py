@@ -29,12 +29,12 @@ from ui.screens.settings_screen import SettingsScreen
 from ui.screens.combat_screen import CombatScreen
 from ui.screens.equipment_screen import EquipmentScreen
 from ui.screens.exploration_screen import ExplorationScreen
-from ui.upgrades_screen import UpgradesScreen
 
 # Imports de la nueva interfaz premium
 from ui.integrated_ui_system import IntegratedUIManager, get_ui_manager
 from ui.screens.enhanced_combat_screen import EnhancedCombatScreen
 from ui.world_selection_screen import WorldSelectionScreen
+from utils.db import get_database
 
 
 def setup_logging():
@@ -202,9 +202,13 @@ class GameApp(App):
 			# Pantallas de progresión
 			from core.game import get_game_state
 
-			self.navigation_manager.register_screen(
-				"upgrades", lambda name: UpgradesScreen(name=name)
-			)
+			# El módulo de mejoras se importa al crear la pantalla, no al arrancar
+			def create_upgrades_screen(name):
+				from ui.upgrades_screen import UpgradesScreen
+
+				return UpgradesScreen(name=name)
+
+			self.navigation_manager.register_screen("upgrades", create_upgrades_screen)
 
 			# Pantalla de prestigio
 			from ui.screens.prestige_screen_simple import PrestigeScreen
@@ -261,10 +265,8 @@ class GameApp(App):
 
 			# Crear instancia temporal para acceder a la configuración por defecto
 			temp_settings = SettingsScreen()
-			current_settings = temp_settings.current_settings
-
 			# Verificar si debug mode está activado en configuración
-			debug_enabled = current_settings.get("debug", {}).get("mode_enabled", False)
+			debug_enabled = temp_settings.settings.debug.mode_enabled
 
 			if debug_enabled:
 				# Activar debug mode en TabNavigator (NO en NavigationManager)
@@ -319,6 +321,16 @@ class GameApp(App):
 		# Programar verificación de inicialización
 		Clock.schedule_once(self._check_initialization, 1.0)
 
+		# Volcar periódicamente las escrituras agrupadas de la base de datos
+		Clock.schedule_interval(self._flush_database, 3.0)
+
+	def _flush_database(self, dt=None):
+		"""Escribe en disco las estadísticas y datos del jugador pendientes."""
+		try:
+			get_database().flush()
+		except Exception as e:
+			logging.error(f"Error flushing database: {e}")
+
 	def _check_initialization(self, dt):
 		"""Verifica que la inicialización fue exitosa."""
 		if not self.is_initialized:
@@ -330,6 +342,7 @@ class GameApp(App):
 		"""Callback ejecutado cuando la app se cierra."""
 		try:
 			logging.info("GameApp stopping...")
+			self._flush_database()
 			logging.info("GameApp stopped successfully")
 
 		except Exception as e:
@@ -339,6 +352,7 @@ class GameApp(App):
 		"""Callback para cuando la app se pausa (móvil)."""
 		try:
 			logging.info("Game paused")
+			self._flush_database()  # En móvil la app puede morir estando en pausa
 			return True
 
 		except Exception as e:
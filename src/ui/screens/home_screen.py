@@ -508,7 +508,7 @@ class HomeScreen(Screen):
 			halign="left",
 			valign="center",
 		)
-		name_label.bind(texture_size=name_label.setter("text_size"))
+		name_label.bind(size=name_label.setter("text_size"))
 
 		# Descripción con producción actual
 		production_per_sec = building.get_total_production_per_second(info)
@@ -521,7 +521,7 @@ class HomeScreen(Screen):
 			halign="left",
 			valign="center",
 		)
-		desc_label.bind(texture_size=desc_label.setter("text_size"))
+		desc_label.bind(size=desc_label.setter("text_size"))
 
 		info_layout.add_widget(name_label)
 		info_layout.add_widget(desc_label)
@@ -308,8 +308,13 @@ class PremiumShopScreen(Screen):
 			(PremiumItemType.COSMETIC, "✨ Cosméticos")
 		]
 		
+		# Agrupar el catálogo por tipo en una sola pasada
+		items_by_type: dict[PremiumItemType, list] = {}
+		for item in self.game_state.premium_shop.catalog:
+			items_by_type.setdefault(item.item_type, []).append(item)
+		
 		for item_type, title in categories:
-			items = self.game_state.premium_shop.get_catalog_by_type(item_type)
+			items = items_by_type.get(item_type)
 			if items:
 				section = self._create_category_section(title, items)
 				self.content_layout.add_widget(section)
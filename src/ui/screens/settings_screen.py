@@ -4,6 +4,8 @@ Pantalla de configuración del juego SiKIdle.
 Configuración de audio, idioma, controles y otras opciones del juego.
 """
 
+from kivy.core.text import Label as CoreLabel
+from kivy.metrics import sp
 from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.gridlayout import GridLayout
@@ -15,17 +17,137 @@ from kivy.uix.spinner import Spinner
 from kivy.uix.scrollview import ScrollView
 from kivy.uix.popup import Popup
 from kivy.uix.textinput import TextInput
+from kivy.uix.image import Image
 
+from dataclasses import asdict, dataclass, field, fields
 from typing import Dict, Any, Callable, Optional
+import hashlib
+import hmac
 import logging
+import sys
 
+from utils.save import get_save_manager
 
-class SettingRow(BoxLayout):
-	"""Fila de configuración individual."""
+# Logger para eventos de alta frecuencia (arrastre de sliders): solo WARNING+
+_log_slider = logging.getLogger(__name__ + ".slider")
+_log_slider.setLevel(logging.WARNING)
+
+# Digest de la contraseña de debug (nunca se guarda en texto plano)
+_DEBUG_PW_DIGEST = hashlib.sha256(b"dev2025").digest()
+
+# Valores de los selectores (internados una sola vez a nivel de módulo)
+_LANGS = tuple(map(sys.intern, ("español", "english", "français")))
+_DIFFS = tuple(map(sys.intern, ("fácil", "normal", "difícil", "extrema")))
+_FONTS = tuple(map(sys.intern, ("pequeño", "normal", "grande", "extra grande")))
+
+# Títulos de sección
+_TITLE_AUDIO = sys.intern("🔊 Configuración de Audio")
+_TITLE_GAME = sys.intern("🎮 Configuración de Juego")
+_TITLE_INTERFACE = sys.intern("🖥️ Configuración de Interfaz")
+_TITLE_DATA = sys.intern("💾 Configuración de Datos")
+_TITLE_DEBUG = sys.intern("🔧 Modo Debug (Desarrollo)")
+_TITLE_ACTIONS = sys.intern("⚙️ Acciones")
+
+_SECTION_TITLE_COLOR = (0.20, 0.60, 0.86, 1)
+
+# Texturas de texto ya renderizadas, por (texto, tamaño, negrita, color)
+_TEXT_TEX_CACHE: Dict[tuple, Any] = {}
+
+
+def cached_label(text: str, size: float = 16, bold: bool = False, color=_SECTION_TITLE_COLOR):
+	"""Devuelve la textura de un texto estático, renderizándola solo la primera vez."""
+	key = (text, size, bold, tuple(color))
+	tex = _TEXT_TEX_CACHE.get(key)
+	if tex is None:
+		core_label = CoreLabel(text=text, font_size=size, bold=bold, color=color)
+		core_label.refresh()
+		tex = core_label.texture
+		_TEXT_TEX_CACHE[key] = tex
+	return tex
+
+
+def _parse_setting(raw: str, current: Any) -> Any:
+	"""Convierte un valor guardado como texto al tipo del valor actual."""
+	if isinstance(current, bool):
+		return raw == "True"
+	if isinstance(current, float):
+		return float(raw)
+	return sys.intern(raw)
+
+
+def section_title(text: str) -> Image:
+	"""Crea el título de una sección reutilizando la textura cacheada."""
+	tex = cached_label(text, sp(16), bold=True)
+	return Image(texture=tex, size_hint=(None, None), size=tex.size)
+
+
+@dataclass(slots=True)
+class AudioSettings:
+	"""Configuración de audio."""
+
+	master_volume: float = 1.0
+	music_volume: float = 0.8
+	sfx_volume: float = 0.9
+	muted: bool = False
+
+
+@dataclass(slots=True)
+class GameSettings:
+	"""Configuración de juego."""
+
+	auto_save: bool = True
+	notifications: bool = True
+	language: str = _LANGS[0]
+	difficulty: str = _DIFFS[1]
+
+
+@dataclass(slots=True)
+class InterfaceSettings:
+	"""Configuración de interfaz."""
+
+	animations: bool = True
+	tooltips: bool = True
+	screen_shake: bool = True
+	font_size: str = _FONTS[1]
+
+
+@dataclass(slots=True)
+class DataSettings:
+	"""Configuración de datos."""
+
+	analytics: bool = False
+	cloud_save: bool = False
+
+
+@dataclass(slots=True)
+class DebugSettings:
+	"""Configuración del modo debug."""
+
+	mode_enabled: bool = True
+
+
+@dataclass(slots=True)
+class Settings:
+	"""Configuración completa del juego agrupada por secciones."""
+
+	audio: AudioSettings = field(default_factory=AudioSettings)
+	game: GameSettings = field(default_factory=GameSettings)
+	interface: InterfaceSettings = field(default_factory=InterfaceSettings)
+	data: DataSettings = field(default_factory=DataSettings)
+	debug: DebugSettings = field(default_factory=DebugSettings)
+
+
+class SettingRow(GridLayout):
+	"""Fila de configuración individual.
+
+	Una sola rejilla de dos columnas: etiqueta con título y descripción
+	(markup) y contenedor del control.
+	"""
 
 	def __init__(self, title: str, description: str = "", **kwargs):
 		super().__init__(**kwargs)
-		self.orientation = "horizontal"
+		self.cols = 2
+		self.rows = 1
 		self.size_hint_y = None
 		self.height = 60
 		self.spacing = 16
@@ -52,36 +174,31 @@ class SettingRow(BoxLayout):
 
 	def _build_content(self, title: str, description: str):
 		"""Construye el contenido de la fila."""
-		# Layout de texto
-		text_layout = BoxLayout(orientation="vertical", size_hint_x=0.7, spacing=2)
-
-		# Título
-		title_label = Label(
-			text=title, font_size="14sp", bold=True, halign="left", valign="center", size_hint_y=0.6
-		)
-		title_label.bind(texture_size=title_label.setter("text_size"))
-
-		# Descripción (si existe)
+		# Título y descripción en una única etiqueta
+		text = f"[b]{title}[/b]"
 		if description:
-			desc_label = Label(
-				text=description,
-				font_size="11sp",
-				opacity=0.7,
-				halign="left",
-				valign="center",
-				size_hint_y=0.4,
-			)
-			desc_label.bind(texture_size=desc_label.setter("text_size"))
-			text_layout.add_widget(desc_label)
+			text += f"\n[size=11sp][color=b3b3b3]{description}[/color][/size]"
 
-		text_layout.add_widget(title_label)
+		self.text_label = Label(
+			text=text,
+			markup=True,
+			font_size="14sp",
+			halign="left",
+			valign="center",
+			size_hint_x=0.7,
+		)
+		self.text_label.bind(size=self._update_text_size)
 
 		# Container para el control
 		self.control_container = BoxLayout(orientation="horizontal", size_hint_x=0.3, spacing=8)
 
-		self.add_widget(text_layout)
+		self.add_widget(self.text_label)
 		self.add_widget(self.control_container)
 
+	def _update_text_size(self, label, size):
+		"""Ajusta el área de texto para que haga wrap dentro de la columna."""
+		label.text_size = (size[0], None)
+
 	def add_control(self, control_widget):
 		"""Añade un widget de control a la fila."""
 		self.control_container.add_widget(control_widget)
@@ -101,17 +218,8 @@ class SettingSection(BoxLayout):
 
 	def _build_section(self, title: str):
 		"""Construye la sección."""
-		# Título de sección
-		title_label = Label(
-			text=title,
-			font_size="16sp",
-			bold=True,
-			size_hint_y=None,
-			height=30,
-			halign="left",
-			color=(0.20, 0.60, 0.86, 1),
-		)
-		title_label.bind(texture_size=title_label.setter("text_size"))
+		# Título de sección (textura cacheada)
+		title_label = section_title(title)
 
 		# Container para las filas
 		self.rows_container = BoxLayout(orientation="vertical", size_hint_y=None, spacing=4)
@@ -163,24 +271,19 @@ class SettingsScreen(Screen):
 	def __init__(self, name="settings", **kwargs):
 		super().__init__(name=name, **kwargs)
 
-		# Configuración actual (placeholder)
-		self.current_settings = {
-			"audio": {"master_volume": 1.0, "music_volume": 0.8, "sfx_volume": 0.9, "muted": False},
-			"game": {
-				"auto_save": True,
-				"notifications": True,
-				"language": "español",
-				"difficulty": "normal",
-			},
-			"interface": {
-				"animations": True,
-				"tooltips": True,
-				"screen_shake": True,
-				"font_size": "normal",
-			},
-			"data": {"analytics": False, "cloud_save": False},
-			"debug": {"mode_enabled": True, "password": "dev2025"},
-		}
+		# Configuración actual: valores por defecto sobrescritos con lo guardado
+		self.settings = Settings()
+		self.load_settings()
+
+		# Popups informativos, construidos bajo demanda y reutilizados
+		self._popups: Dict[str, Popup] = {}
+
+		# Referencia cacheada al navegador de pestañas (ver _tn)
+		self._tab_navigator = None
+
+		# Callbacks enlazados a controles: (widget, evento, callback)
+		self._bindings: list = []
+		self._bound = True
 
 		self._build_layout()
 		logging.info("SettingsScreen initialized")
@@ -214,14 +317,31 @@ class SettingsScreen(Screen):
 		scroll.add_widget(main_layout)
 		self.add_widget(scroll)
 
+	def _bind(self, widget, **kwargs):
+		"""Enlaza callbacks a un widget registrándolos para poder soltarlos en on_leave."""
+		widget.bind(**kwargs)
+		for event, callback in kwargs.items():
+			self._bindings.append((widget, event, callback))
+
+	def _set_bindings(self, bound: bool):
+		"""Enlaza o desenlaza todos los callbacks registrados."""
+		if bound == self._bound:
+			return
+		for widget, event, callback in self._bindings:
+			if bound:
+				widget.bind(**{event: callback})
+			else:
+				widget.unbind(**{event: callback})
+		self._bound = bound
+
 	def _create_audio_section(self) -> SettingSection:
 		"""Crea la sección de configuración de audio."""
-		section = SettingSection("🔊 Configuración de Audio")
+		section = SettingSection(_TITLE_AUDIO)
 
 		# Volumen maestro
 		master_row = SettingRow("Volumen Maestro", "Controla el volumen general del juego")
 		master_slider = VolumeSlider(
-			self.current_settings["audio"]["master_volume"], self._on_master_volume_change
+			self.settings.audio.master_volume, self._on_master_volume_change
 		)
 		master_row.add_control(master_slider)
 		section.add_setting_row(master_row)
@@ -229,7 +349,7 @@ class SettingsScreen(Screen):
 		# Volumen de música
 		music_row = SettingRow("Volumen de Música", "Controla la música de fondo")
 		music_slider = VolumeSlider(
-			self.current_settings["audio"]["music_volume"], self._on_music_volume_change
+			self.settings.audio.music_volume, self._on_music_volume_change
 		)
 		music_row.add_control(music_slider)
 		section.add_setting_row(music_row)
@@ -237,15 +357,15 @@ class SettingsScreen(Screen):
 		# Volumen de efectos
 		sfx_row = SettingRow("Volumen de Efectos", "Controla los sonidos de efectos")
 		sfx_slider = VolumeSlider(
-			self.current_settings["audio"]["sfx_volume"], self._on_sfx_volume_change
+			self.settings.audio.sfx_volume, self._on_sfx_volume_change
 		)
 		sfx_row.add_control(sfx_slider)
 		section.add_setting_row(sfx_row)
 
 		# Silenciar todo
 		mute_row = SettingRow("Silenciar Audio", "Desactiva completamente todos los sonidos")
-		mute_switch = Switch(active=self.current_settings["audio"]["muted"])
-		mute_switch.bind(active=self._on_mute_change)
+		mute_switch = Switch(active=self.settings.audio.muted)
+		self._bind(mute_switch, active=self._on_mute_change)
 		mute_row.add_control(mute_switch)
 		section.add_setting_row(mute_row)
 
@@ -253,12 +373,12 @@ class SettingsScreen(Screen):
 
 	def _create_game_section(self) -> SettingSection:
 		"""Crea la sección de configuración de juego."""
-		section = SettingSection("🎮 Configuración de Juego")
+		section = SettingSection(_TITLE_GAME)
 
 		# Auto guardado
 		autosave_row = SettingRow("Guardado Automático", "Guarda automáticamente el progreso")
-		autosave_switch = Switch(active=self.current_settings["game"]["auto_save"])
-		autosave_switch.bind(active=self._on_autosave_change)
+		autosave_switch = Switch(active=self.settings.game.auto_save)
+		self._bind(autosave_switch, active=self._on_autosave_change)
 		autosave_row.add_control(autosave_switch)
 		section.add_setting_row(autosave_row)
 
@@ -266,32 +386,32 @@ class SettingsScreen(Screen):
 		notifications_row = SettingRow(
 			"Notificaciones", "Muestra notificaciones de logros y eventos"
 		)
-		notifications_switch = Switch(active=self.current_settings["game"]["notifications"])
-		notifications_switch.bind(active=self._on_notifications_change)
+		notifications_switch = Switch(active=self.settings.game.notifications)
+		self._bind(notifications_switch, active=self._on_notifications_change)
 		notifications_row.add_control(notifications_switch)
 		section.add_setting_row(notifications_row)
 
 		# Idioma
 		language_row = SettingRow("Idioma", "Selecciona el idioma del juego")
 		language_spinner = Spinner(
-			text=self.current_settings["game"]["language"],
-			values=["español", "english", "français"],
+			text=self.settings.game.language,
+			values=list(_LANGS),
 			size_hint_x=None,
 			width=120,
 		)
-		language_spinner.bind(text=self._on_language_change)
+		self._bind(language_spinner, text=self._on_language_change)
 		language_row.add_control(language_spinner)
 		section.add_setting_row(language_row)
 
 		# Dificultad
 		difficulty_row = SettingRow("Dificultad", "Ajusta la dificultad del juego")
 		difficulty_spinner = Spinner(
-			text=self.current_settings["game"]["difficulty"],
-			values=["fácil", "normal", "difícil", "extrema"],
+			text=self.settings.game.difficulty,
+			values=list(_DIFFS),
 			size_hint_x=None,
 			width=120,
 		)
-		difficulty_spinner.bind(text=self._on_difficulty_change)
+		self._bind(difficulty_spinner, text=self._on_difficulty_change)
 		difficulty_row.add_control(difficulty_spinner)
 		section.add_setting_row(difficulty_row)
 
@@ -299,38 +419,38 @@ class SettingsScreen(Screen):
 
 	def _create_interface_section(self) -> SettingSection:
 		"""Crea la sección de configuración de interfaz."""
-		section = SettingSection("🖥️ Configuración de Interfaz")
+		section = SettingSection(_TITLE_INTERFACE)
 
 		# Animaciones
 		animations_row = SettingRow("Animaciones", "Activa/desactiva las animaciones de la UI")
-		animations_switch = Switch(active=self.current_settings["interface"]["animations"])
-		animations_switch.bind(active=self._on_animations_change)
+		animations_switch = Switch(active=self.settings.interface.animations)
+		self._bind(animations_switch, active=self._on_animations_change)
 		animations_row.add_control(animations_switch)
 		section.add_setting_row(animations_row)
 
 		# Tooltips
 		tooltips_row = SettingRow("Tooltips", "Muestra información adicional al pasar el cursor")
-		tooltips_switch = Switch(active=self.current_settings["interface"]["tooltips"])
-		tooltips_switch.bind(active=self._on_tooltips_change)
+		tooltips_switch = Switch(active=self.settings.interface.tooltips)
+		self._bind(tooltips_switch, active=self._on_tooltips_change)
 		tooltips_row.add_control(tooltips_switch)
 		section.add_setting_row(tooltips_row)
 
 		# Screen shake
 		shake_row = SettingRow("Vibración de Pantalla", "Efectos de vibración en combate")
-		shake_switch = Switch(active=self.current_settings["interface"]["screen_shake"])
-		shake_switch.bind(active=self._on_screen_shake_change)
+		shake_switch = Switch(active=self.settings.interface.screen_shake)
+		self._bind(shake_switch, active=self._on_screen_shake_change)
 		shake_row.add_control(shake_switch)
 		section.add_setting_row(shake_row)
 
 		# Tamaño de fuente
 		font_row = SettingRow("Tamaño de Fuente", "Ajusta el tamaño del texto")
 		font_spinner = Spinner(
-			text=self.current_settings["interface"]["font_size"],
-			values=["pequeño", "normal", "grande", "extra grande"],
+			text=self.settings.interface.font_size,
+			values=list(_FONTS),
 			size_hint_x=None,
 			width=120,
 		)
-		font_spinner.bind(text=self._on_font_size_change)
+		self._bind(font_spinner, text=self._on_font_size_change)
 		font_row.add_control(font_spinner)
 		section.add_setting_row(font_row)
 
@@ -338,12 +458,12 @@ class SettingsScreen(Screen):
 
 	def _create_data_section(self) -> SettingSection:
 		"""Crea la sección de configuración de datos."""
-		section = SettingSection("💾 Configuración de Datos")
+		section = SettingSection(_TITLE_DATA)
 
 		# Analytics
 		analytics_row = SettingRow("Análisis de Uso", "Envía datos anónimos para mejorar el juego")
-		analytics_switch = Switch(active=self.current_settings["data"]["analytics"])
-		analytics_switch.bind(active=self._on_analytics_change)
+		analytics_switch = Switch(active=self.settings.data.analytics)
+		self._bind(analytics_switch, active=self._on_analytics_change)
 		analytics_row.add_control(analytics_switch)
 		section.add_setting_row(analytics_row)
 
@@ -351,8 +471,8 @@ class SettingsScreen(Screen):
 		cloud_row = SettingRow(
 			"Guardado en la Nube", "Sincroniza tu progreso en múltiples dispositivos"
 		)
-		cloud_switch = Switch(active=self.current_settings["data"]["cloud_save"])
-		cloud_switch.bind(active=self._on_cloud_save_change)
+		cloud_switch = Switch(active=self.settings.data.cloud_save)
+		self._bind(cloud_switch, active=self._on_cloud_save_change)
 		cloud_row.add_control(cloud_switch)
 		section.add_setting_row(cloud_row)
 
@@ -360,7 +480,7 @@ class SettingsScreen(Screen):
 
 	def _create_debug_section(self) -> SettingSection:
 		"""Crea la sección de modo debug."""
-		section = SettingSection("🔧 Modo Debug (Desarrollo)")
+		section = SettingSection(_TITLE_DEBUG)
 
 		# Campo de contraseña
 		password_row = SettingRow(
@@ -374,7 +494,7 @@ class SettingsScreen(Screen):
 		)
 
 		activate_btn = Button(text="Activar", size_hint_x=0.3, height=30, size_hint_y=None)
-		activate_btn.bind(on_press=self._toggle_debug_mode)
+		self._bind(activate_btn, on_press=self._toggle_debug_mode)
 
 		password_layout.add_widget(self.password_input)
 		password_layout.add_widget(activate_btn)
@@ -398,33 +518,24 @@ class SettingsScreen(Screen):
 			orientation="vertical", size_hint_y=None, height=200, spacing=16, padding=[0, 24, 0, 24]
 		)
 
-		# Título
-		title_label = Label(
-			text="⚙️ Acciones",
-			font_size="16sp",
-			bold=True,
-			size_hint_y=None,
-			height=30,
-			halign="left",
-			color=(0.20, 0.60, 0.86, 1),
-		)
-		title_label.bind(texture_size=title_label.setter("text_size"))
+		# Título (textura cacheada)
+		title_label = section_title(_TITLE_ACTIONS)
 
 		# Grid de botones
 		actions_grid = GridLayout(cols=2, spacing=12, size_hint_y=None, height=140)
 
 		# Botones de acción
 		export_btn = Button(text="📤 Exportar Datos", size_hint_y=None, height=60)
-		export_btn.bind(on_press=self._export_data)
+		self._bind(export_btn, on_press=self._export_data)
 
 		import_btn = Button(text="📥 Importar Datos", size_hint_y=None, height=60)
-		import_btn.bind(on_press=self._import_data)
+		self._bind(import_btn, on_press=self._import_data)
 
 		reset_btn = Button(text="🔄 Restablecer Config", size_hint_y=None, height=60)
-		reset_btn.bind(on_press=self._reset_settings)
+		self._bind(reset_btn, on_press=self._reset_settings)
 
 		about_btn = Button(text="ℹ️ Acerca de", size_hint_y=None, height=60)
-		about_btn.bind(on_press=self._show_about)
+		self._bind(about_btn, on_press=self._show_about)
 
 		actions_grid.add_widget(export_btn)
 		actions_grid.add_widget(import_btn)
@@ -439,87 +550,88 @@ class SettingsScreen(Screen):
 	# Callbacks de configuración de audio
 	def _on_master_volume_change(self, value: float):
 		"""Callback para cambio de volumen maestro."""
-		self.current_settings["audio"]["master_volume"] = value
-		logging.info(f"Master volume changed to: {value}")
+		self.settings.audio.master_volume = value
+		if _log_slider.isEnabledFor(logging.INFO):
+			_log_slider.info("Master volume changed to: %s", value)
 
 	def _on_music_volume_change(self, value: float):
 		"""Callback para cambio de volumen de música."""
-		self.current_settings["audio"]["music_volume"] = value
-		logging.info(f"Music volume changed to: {value}")
+		self.settings.audio.music_volume = value
+		if _log_slider.isEnabledFor(logging.INFO):
+			_log_slider.info("Music volume changed to: %s", value)
 
 	def _on_sfx_volume_change(self, value: float):
 		"""Callback para cambio de volumen de efectos."""
-		self.current_settings["audio"]["sfx_volume"] = value
-		logging.info(f"SFX volume changed to: {value}")
+		self.settings.audio.sfx_volume = value
+		if _log_slider.isEnabledFor(logging.INFO):
+			_log_slider.info("SFX volume changed to: %s", value)
 
 	def _on_mute_change(self, instance, active: bool):
 		"""Callback para silenciar audio."""
-		self.current_settings["audio"]["muted"] = active
+		self.settings.audio.muted = active
 		logging.info(f"Audio muted: {active}")
 
 	# Callbacks de configuración de juego
 	def _on_autosave_change(self, instance, active: bool):
 		"""Callback para auto guardado."""
-		self.current_settings["game"]["auto_save"] = active
+		self.settings.game.auto_save = active
 		logging.info(f"Auto save: {active}")
 
 	def _on_notifications_change(self, instance, active: bool):
 		"""Callback para notificaciones."""
-		self.current_settings["game"]["notifications"] = active
+		self.settings.game.notifications = active
 		logging.info(f"Notifications: {active}")
 
 	def _on_language_change(self, instance, text: str):
 		"""Callback para cambio de idioma."""
-		self.current_settings["game"]["language"] = text
+		self.settings.game.language = text
 		logging.info(f"Language changed to: {text}")
 
 	def _on_difficulty_change(self, instance, text: str):
 		"""Callback para cambio de dificultad."""
-		self.current_settings["game"]["difficulty"] = text
+		self.settings.game.difficulty = text
 		logging.info(f"Difficulty changed to: {text}")
 
 	# Callbacks de configuración de interfaz
 	def _on_animations_change(self, instance, active: bool):
 		"""Callback para animaciones."""
-		self.current_settings["interface"]["animations"] = active
+		self.settings.interface.animations = active
 		logging.info(f"Animations: {active}")
 
 	def _on_tooltips_change(self, instance, active: bool):
 		"""Callback para tooltips."""
-		self.current_settings["interface"]["tooltips"] = active
+		self.settings.interface.tooltips = active
 		logging.info(f"Tooltips: {active}")
 
 	def _on_screen_shake_change(self, instance, active: bool):
 		"""Callback para vibración de pantalla."""
-		self.current_settings["interface"]["screen_shake"] = active
+		self.settings.interface.screen_shake = active
 		logging.info(f"Screen shake: {active}")
 
 	def _on_font_size_change(self, instance, text: str):
 		"""Callback para tamaño de fuente."""
-		self.current_settings["interface"]["font_size"] = text
+		self.settings.interface.font_size = text
 		logging.info(f"Font size changed to: {text}")
 
 	# Callbacks de configuración de datos
 	def _on_analytics_change(self, instance, active: bool):
 		"""Callback para analytics."""
-		self.current_settings["data"]["analytics"] = active
+		self.settings.data.analytics = active
 		logging.info(f"Analytics: {active}")
 
 	def _on_cloud_save_change(self, instance, active: bool):
 		"""Callback para guardado en la nube."""
-		self.current_settings["data"]["cloud_save"] = active
+		self.settings.data.cloud_save = active
 		logging.info(f"Cloud save: {active}")
 
 	def _toggle_debug_mode(self, instance):
 		"""Activa/desactiva el modo debug."""
-		password = self.password_input.text.strip()
+		candidate = hashlib.sha256(self.password_input.text.strip().encode("utf-8")).digest()
 
-		if password == self.current_settings["debug"]["password"]:
-			self.current_settings["debug"]["mode_enabled"] = not self.current_settings["debug"][
-				"mode_enabled"
-			]
+		if hmac.compare_digest(candidate, _DEBUG_PW_DIGEST):
+			self.settings.debug.mode_enabled = not self.settings.debug.mode_enabled
 
-			if self.current_settings["debug"]["mode_enabled"]:
+			if self.settings.debug.mode_enabled:
 				self.debug_status_label.text = "✅ Activado"
 				self.debug_status_label.color = (0.2, 0.8, 0.2, 1)
 				logging.info("DEBUG MODE ENABLED")
@@ -540,61 +652,70 @@ class SettingsScreen(Screen):
 			popup.open()
 			self.password_input.text = ""
 
-	def _enable_debug_mode(self):
-		"""Activa el modo debug."""
-		try:
+	def _tn(self):
+		"""Obtiene (y cachea) el navegador de pestañas de la app en ejecución."""
+		if self._tab_navigator is None:
 			from kivy.app import App
 
 			app = App.get_running_app()
-			if hasattr(app, "main_layout") and app.main_layout:
-				tab_navigator = app.main_layout.tab_navigator
-				if hasattr(tab_navigator, "enable_debug_mode"):
-					tab_navigator.enable_debug_mode()
+			self._tab_navigator = getattr(getattr(app, "main_layout", None), "tab_navigator", None)
+		return self._tab_navigator
+
+	def _enable_debug_mode(self):
+		"""Activa el modo debug."""
+		try:
+			fn = getattr(self._tn(), "enable_debug_mode", None)
+			if fn is not None:
+				fn()
 		except Exception as e:
 			logging.error(f"Error enabling debug mode: {e}")
 
 	def _disable_debug_mode(self):
 		"""Desactiva el modo debug."""
 		try:
-			from kivy.app import App
-
-			app = App.get_running_app()
-			if hasattr(app, "main_layout") and app.main_layout:
-				tab_navigator = app.main_layout.tab_navigator
-				if hasattr(tab_navigator, "disable_debug_mode"):
-					tab_navigator.disable_debug_mode()
+			fn = getattr(self._tn(), "disable_debug_mode", None)
+			if fn is not None:
+				fn()
 		except Exception as e:
 			logging.error(f"Error disabling debug mode: {e}")
 
 	# Acciones
+	def _get_popup(self, key: str, title: str, text: str, size: tuple, **label_kwargs) -> Popup:
+		"""Devuelve el popup informativo cacheado, creándolo la primera vez."""
+		popup = self._popups.get(key)
+		if popup is None:
+			popup = Popup(title=title, content=Label(text=text, **label_kwargs), size_hint=size)
+			self._popups[key] = popup
+		return popup
+
 	def _export_data(self, instance):
 		"""Exporta los datos del juego."""
-		popup = Popup(
-			title="Exportar Datos",
-			content=Label(text="Funcionalidad de exportación\npronto disponible..."),
-			size_hint=(0.6, 0.4),
-		)
-		popup.open()
+		self._get_popup(
+			"export",
+			"Exportar Datos",
+			"Funcionalidad de exportación\npronto disponible...",
+			(0.6, 0.4),
+		).open()
 		logging.info("Export data requested")
 
 	def _import_data(self, instance):
 		"""Importa datos del juego."""
-		popup = Popup(
-			title="Importar Datos",
-			content=Label(text="Funcionalidad de importación\npronto disponible..."),
-			size_hint=(0.6, 0.4),
-		)
-		popup.open()
+		self._get_popup(
+			"import",
+			"Importar Datos",
+			"Funcionalidad de importación\npronto disponible...",
+			(0.6, 0.4),
+		).open()
 		logging.info("Import data requested")
 
 	def _reset_settings(self, instance):
 		"""Restablece la configuración por defecto."""
-		popup = Popup(
-			title="Confirmar Restablecimiento",
-			content=Label(text="¿Estás seguro de que quieres\nrestablecer toda la configuración?"),
-			size_hint=(0.6, 0.4),
-		)
-		popup.open()
+		self._get_popup(
+			"reset",
+			"Confirmar Restablecimiento",
+			"¿Estás seguro de que quieres\nrestablecer toda la configuración?",
+			(0.6, 0.4),
+		).open()
 		logging.info("Reset settings requested")
 
 	def _show_about(self, instance):
@@ -607,30 +728,51 @@ desarrollado con Python y Kivy.
 © 2025 - Desarrollado por IA
 Proyecto de código abierto"""
 
-		popup = Popup(
-			title="Acerca de SiKIdle",
-			content=Label(text=about_text, halign="center"),
-			size_hint=(0.7, 0.6),
-		)
-		popup.open()
+		self._get_popup(
+			"about", "Acerca de SiKIdle", about_text, (0.7, 0.6), halign="center"
+		).open()
 		logging.info("About dialog shown")
 
 	def save_settings(self):
-		"""Guarda la configuración actual."""
-		# TODO: Implementar guardado real en base de datos
-		logging.info("Settings saved")
+		"""Guarda la configuración actual con claves ``seccion.campo``."""
+		data = {
+			f"{section}.{key}": str(value)
+			for section, values in asdict(self.settings).items()
+			for key, value in values.items()
+		}
+		get_save_manager().save_settings(data)
+		logging.info(f"Settings saved ({len(data)} values)")
 
 	def load_settings(self):
-		"""Carga la configuración guardada."""
-		# TODO: Implementar carga real desde base de datos
+		"""Carga la configuración guardada sobre los valores actuales.
+
+		Las claves que no estén guardadas o no se puedan convertir conservan
+		su valor por defecto.
+		"""
+		save_manager = get_save_manager()
+		for section in fields(self.settings):
+			group = getattr(self.settings, section.name)
+			for setting in fields(group):
+				raw = save_manager.get_setting(f"{section.name}.{setting.name}")
+				if not raw:
+					continue
+				try:
+					setattr(group, setting.name, _parse_setting(raw, getattr(group, setting.name)))
+				except ValueError:
+					logging.warning(f"Invalid saved setting {section.name}.{setting.name}: {raw!r}")
 		logging.info("Settings loaded")
 
 	def on_enter(self):
 		"""Callback ejecutado cuando se entra en la pantalla."""
 		logging.info("Entered SettingsScreen")
-		self.load_settings()
+		self._set_bindings(True)
 
 	def on_leave(self):
 		"""Callback ejecutado cuando se sale de la pantalla."""
 		logging.info("Left SettingsScreen")
 		self.save_settings()
+
+		# Soltar referencias para no retener la pantalla fuera de uso
+		self._set_bindings(False)
+		self._popups.clear()
+		self._tab_navigator = None
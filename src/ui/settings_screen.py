@@ -7,6 +7,7 @@ idioma, sonido, vibración y otras opciones.
 import logging
 from typing import Any
 
+from kivy.clock import Clock  # type: ignore
 from kivy.uix.boxlayout import BoxLayout  # type: ignore
 from kivy.uix.button import Button  # type: ignore
 from kivy.uix.label import Label  # type: ignore
@@ -29,6 +30,10 @@ class SettingsScreen(SiKIdleScreen):
 		self.sound_switch = None
 		self.vibration_switch = None
 
+		# Cambios pendientes de guardar (se escriben juntos tras un debounce)
+		self._dirty: dict[str, str] = {}
+		self._flush_ev = None
+
 		self.build_ui()
 
 	def build_ui(self):
@@ -167,7 +172,7 @@ class SettingsScreen(SiKIdleScreen):
 		# Switch
 		switch = Switch(
 			size_hint=(0.3, 1),
-			active=self.save_manager.get_setting(setting_key, 'true') == 'true'
+			active=self._read_setting(setting_key) == 'true'
 		)
 		switch.bind(active=lambda instance, value: self.on_setting_changed(setting_key, value))
 		main_row.add_widget(switch)
@@ -255,9 +260,35 @@ class SettingsScreen(SiKIdleScreen):
 			setting_key: Clave de la configuración
 			value: Nuevo valor
 		"""
-		self.save_manager.save_setting(setting_key, 'true' if value else 'false')
+		self._dirty[setting_key] = 'true' if value else 'false'
+		if self._flush_ev is None:
+			self._flush_ev = Clock.schedule_once(self._flush_settings, 0.5)
 		logging.info(f"Configuración cambiada: {setting_key} = {value}")
 
+	def _read_setting(self, setting_key: str) -> str:
+		"""Lee una configuración teniendo en cuenta los cambios sin guardar.
+		
+		Args:
+			setting_key: Clave de la configuración
+			
+		Returns:
+			Valor pendiente si existe, o el guardado en base de datos
+		"""
+		pending = self._dirty.get(setting_key)
+		if pending is not None:
+			return pending
+		return self.save_manager.get_setting(setting_key, 'true')
+
+	def _flush_settings(self, dt: float = 0) -> None:
+		"""Escribe en una sola transacción todos los cambios pendientes."""
+		if self._flush_ev is not None:
+			self._flush_ev.cancel()
+			self._flush_ev = None
+		if not self._dirty:
+			return
+		self.save_manager.save_settings(self._dirty)
+		self._dirty = {}
+
 	def on_language_button(self, instance: Button):
 		"""Maneja el clic en el botón de idioma.
 		
@@ -295,8 +326,13 @@ class SettingsScreen(SiKIdleScreen):
 
 		# Actualizar switches con valores actuales
 		if self.sound_switch:
-			self.sound_switch.active = self.save_manager.get_setting('sound_enabled', 'true') == 'true'
+			self.sound_switch.active = self._read_setting('sound_enabled') == 'true'
 		if self.vibration_switch:
-			self.vibration_switch.active = self.save_manager.get_setting('vibration_enabled', 'true') == 'true'
+			self.vibration_switch.active = self._read_setting('vibration_enabled') == 'true'
 
 		logging.info("Entrada a pantalla de configuración")
+
+	def on_leave(self, *args):
+		"""Método llamado cuando se sale de la pantalla."""
+		super().on_leave(*args)
+		self._flush_settings()
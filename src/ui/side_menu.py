@@ -4,16 +4,119 @@ Sistema de navegación expandido con múltiples categorías de contenido.
 """
 
 import logging
+import os
 from typing import Any, Optional
 
 from kivy.animation import Animation  # type: ignore
+from kivy.clock import Clock  # type: ignore
+from kivy.graphics import (  # type: ignore
+	Color,
+	InstructionGroup,
+	PopMatrix,
+	PushMatrix,
+	Rectangle,
+	Translate,
+)
+from kivy.lang import Builder  # type: ignore
+from kivy.metrics import dp  # type: ignore
+from kivy.properties import (  # type: ignore
+	ListProperty,
+	NumericProperty,
+	ObjectProperty,
+	StringProperty,
+)
 from kivy.uix.boxlayout import BoxLayout  # type: ignore
 from kivy.uix.button import Button  # type: ignore
 from kivy.uix.label import Label  # type: ignore
+from kivy.uix.recycleboxlayout import RecycleBoxLayout  # type: ignore
+from kivy.uix.recycleview import RecycleView  # type: ignore
 from kivy.uix.widget import Widget  # type: ignore
 
 from ui.screen_manager import SiKIdleScreenManager
 
+Builder.load_string("""
+<CategoryRow>:
+    orientation: 'vertical'
+    BoxLayout:
+        orientation: 'horizontal'
+        size_hint: 1, None
+        height: '60dp'
+        spacing: 10
+        Image:
+            source: root.icon_source
+            size_hint: None, 1
+            width: self.height * 0.6 if root.icon_source else 0
+            opacity: 1 if root.icon_source else 0
+        Button:
+            text: root.name
+            font_size: '16sp'
+            size_hint: 0.8, 1
+            background_color: 0.2, 0.3, 0.5, 1
+            halign: 'left'
+            text_size: self.width - 20, None
+            on_press: root.dispatch('on_select')
+        Label:
+            text: '●'
+            font_size: '20sp'
+            size_hint: 0.2, 1
+            color: root.status_color
+    Label:
+        text: root.desc
+        font_size: '12sp'
+        size_hint: 1, None
+        height: '25dp' if root.desc else 0
+        opacity: 1 if root.desc else 0
+        color: 0.7, 0.7, 0.7, 1
+        text_size: self.width, None
+        halign: 'left'
+""")
+
+# Iconos de categoría pre-renderizados en un atlas (atlas://assets/icons/<pantalla>).
+# Evitan meter emojis en el texto de los botones, que obligan a rasterizar
+# glifos con una fuente de respaldo en cada render. Mientras el atlas no
+# exista se mantiene el emoji en el texto.
+_ICON_ATLAS_URI = 'atlas://assets/icons/'
+_HAS_ICON_ATLAS = os.path.exists(os.path.join('assets', 'icons.atlas'))
+
+
+def _category_row_data(category: "SideMenuCategory") -> dict[str, str]:
+	"""Devuelve el icono y el texto de la fila de una categoría.
+	
+	Args:
+		category: Categoría del menú
+		
+	Returns:
+		Diccionario con ``icon_source`` (URI ``atlas://`` o ``''``) y ``name``
+	"""
+	if _HAS_ICON_ATLAS:
+		return {'icon_source': _ICON_ATLAS_URI + category.screen_name, 'name': category.name}
+	return {'icon_source': '', 'name': f"{category.icon} {category.name}"}
+
+
+class CategoryRow(BoxLayout):
+	"""Fila de categoría del menú lateral (definida en la regla KV <CategoryRow>).
+
+	Es la viewclass del RecycleView del menú: sus propiedades llegan desde
+	los diccionarios de ``data`` y la instancia se reutiliza entre categorías.
+	"""
+
+	icon_source = StringProperty("")
+	name = StringProperty("")
+	desc = StringProperty("")
+	screen = StringProperty("")
+	status_color = ListProperty([0.5, 0.8, 0.3, 1])  # Verde por defecto
+	select_callback = ObjectProperty(None, allownone=True)
+
+	def __init__(self, **kwargs: Any):
+		"""Inicializa la fila de categoría."""
+		self.register_event_type('on_select')
+		super().__init__(**kwargs)
+
+	def on_select(self, *args):
+		"""Evento disparado al pulsar el botón de la categoría."""
+		if self.select_callback is not None:
+			self.select_callback(self)
+
 
 class SideMenuCategory:
 	"""Representa una categoría del menú lateral."""
@@ -36,6 +139,9 @@ class SideMenuCategory:
 class SideMenu(Widget):
 	"""Menú lateral deslizable con categorías expandidas."""
 	
+	# Desplazamiento horizontal del panel (se aplica con un Translate en el canvas)
+	panel_offset = NumericProperty(0)
+	
 	def __init__(self, **kwargs: Any):
 		"""Inicializa el menú lateral."""
 		super().__init__(**kwargs)
@@ -43,6 +149,12 @@ class SideMenu(Widget):
 		self.manager_ref: Optional[SiKIdleScreenManager] = None
 		self.is_open = False
 		self.menu_width = 280  # Ancho del menú en píxeles
+		self._categories_built = False
+		self._translate: Optional[Translate] = None
+		
+		# Actualizaciones de canvas agrupadas en una por frame
+		self._bg_trigger = Clock.create_trigger(self._apply_bg, -1)
+		self._lines_trigger = Clock.create_trigger(self._apply_lines, -1)
 		
 		# Definir categorías del menú
 		self.categories = [
@@ -82,21 +194,35 @@ class SideMenu(Widget):
 			orientation='vertical',
 			size_hint=(None, 1),
 			width=self.menu_width,
-			pos=(-self.menu_width, 0),  # Inicialmente oculto
+			pos=(0, 0),
 			padding=[15, 20, 15, 20],
 			spacing=10
 		)
 		
+		# El panel no cambia de pos: se desliza con un Translate en su canvas,
+		# así la animación no provoca relayout de sus hijos
+		with self.menu_panel.canvas.before:
+			PushMatrix()
+			self._translate = Translate(0, 0, 0)
+		with self.menu_panel.canvas.after:
+			PopMatrix()
+		self.panel_offset = -self.menu_width  # Inicialmente oculto
+		
 		# Fondo del panel
 		with self.menu_panel.canvas.before:
-			from kivy.graphics import Color, Rectangle  # type: ignore
 			Color(0.1, 0.1, 0.15, 0.95)  # Azul oscuro semitransparente
 			self.menu_bg = Rectangle(size=self.menu_panel.size, pos=self.menu_panel.pos)
 		
-		self.menu_panel.bind(size=self.update_bg, pos=self.update_bg)
+		self.menu_panel.bind(size=self._bg_trigger, pos=self._bg_trigger)
+		
+		# Líneas separadoras: un único Color y un grupo compartido
+		self.lines_group = InstructionGroup()
+		self.lines_group.add(Color(0.3, 0.3, 0.4, 1))
+		self.menu_panel.canvas.before.add(self.lines_group)
+		self._line_rects: dict[Widget, tuple[Rectangle, Optional[float]]] = {}
 		
 		# Título del menú
-		title_label = Label(
+		self.title_label = title_label = Label(
 			text='🎮 SiKIdle',
 			font_size='24sp',
 			size_hint=(1, None),
@@ -111,17 +237,25 @@ class SideMenu(Widget):
 			size_hint=(1, None),
 			height='2dp'
 		)
-		with separator.canvas:
-			Color(0.3, 0.3, 0.4, 1)
-			self.separator_rect = Rectangle(size=separator.size, pos=separator.pos)
-		separator.bind(size=self.update_separator, pos=self.update_separator)
+		self.add_line(separator)
 		self.menu_panel.add_widget(separator)
 		
-		# Botones de categorías
-		self.create_category_buttons()
+		# Lista de categorías reciclada; sus datos se cargan en la primera apertura
+		self.categories_layout = RecycleBoxLayout(
+			orientation='vertical',
+			default_size=(None, dp(85)),
+			default_size_hint=(1, None),
+			size_hint_y=None,
+			spacing=10
+		)
+		self.categories_layout.bind(minimum_height=self.categories_layout.setter('height'))
+		self.categories_view = RecycleView(size_hint=(1, 1), do_scroll_x=False)
+		self.categories_view.add_widget(self.categories_layout)
+		self.categories_view.viewclass = CategoryRow
+		self.menu_panel.add_widget(self.categories_view)
 		
 		# Botón de cerrar en la parte inferior
-		close_button = Button(
+		self.close_button = close_button = Button(
 			text='❌ Cerrar Menú',
 			font_size='16sp',
 			size_hint=(1, None),
@@ -136,76 +270,144 @@ class SideMenu(Widget):
 		logging.info("Menú lateral construido")
 	
 	def create_category_buttons(self):
-		"""Crea los botones para cada categoría del menú."""
-		for category in self.categories:
-			# Contenedor del botón con información
-			button_container = BoxLayout(
-				orientation='horizontal',
-				size_hint=(1, None),
-				height='60dp',
-				spacing=10
-			)
-			
-			# Botón principal de la categoría
-			category_button = Button(
-				text=f'{category.icon} {category.name}',
-				font_size='16sp',
-				size_hint=(0.8, 1),
-				background_color=[0.2, 0.3, 0.5, 1],
-				halign='left',
-				text_size=(None, None)
-			)
-			
-			# Configurar alineación del texto
-			category_button.bind(size=lambda btn, size: setattr(btn, 'text_size', (size[0] - 20, None)))
-			category_button.bind(on_press=lambda x, cat=category: self.on_category_selected(cat))
-			
-			# Indicador de estado (TODO: implementar lógica de estado)
-			status_indicator = Label(
-				text='●',
-				font_size='20sp',
-				size_hint=(0.2, 1),
-				color=[0.5, 0.8, 0.3, 1]  # Verde por defecto
-			)
-			
-			button_container.add_widget(category_button)
-			button_container.add_widget(status_indicator)
-			
-			self.menu_panel.add_widget(button_container)
-			
-			# Descripción pequeña (opcional)
-			if category.description:
-				desc_label = Label(
-					text=category.description,
-					font_size='12sp',
-					size_hint=(1, None),
-					height='25dp',
-					color=[0.7, 0.7, 0.7, 1],
-					text_size=(self.menu_width - 30, None),
-					halign='left'
-				)
-				self.menu_panel.add_widget(desc_label)
+		"""Carga las categorías en el RecycleView del menú.
+		
+		Solo se instancian las filas visibles; el resto se recicla al hacer scroll.
+		"""
+		self._categories_by_screen = {c.screen_name: c for c in self.categories}
+		self.categories_view.data = [
+			{
+				**_category_row_data(category),
+				'desc': category.description,
+				'screen': category.screen_name,
+				'status_color': [0.5, 0.8, 0.3, 1],
+				'select_callback': self._on_row_selected,
+			}
+			for category in self.categories
+		]
+	
+	def refresh_labels(self, title: Optional[str] = None, close_text: Optional[str] = None):
+		"""Actualiza los textos del menú sin reconstruir sus widgets.
+		
+		Pensado para cambios de idioma: se mutan los textos existentes y los
+		datos del RecycleView, nunca se vacía ``menu_panel``.
+		
+		Args:
+			title: Nuevo título del menú (opcional)
+			close_text: Nuevo texto del botón de cerrar (opcional)
+		"""
+		if title is not None:
+			self.title_label.text = title
+		if close_text is not None:
+			self.close_button.text = close_text
+		
+		if not self._categories_built:
+			return
+		
+		for item, category in zip(self.categories_view.data, self.categories, strict=True):
+			item.update(_category_row_data(category))
+			item['desc'] = category.description
+		self.categories_view.refresh_from_data()
+	
+	def set_category_status(self, screen_name: str, rgba: list):
+		"""Cambia el color del indicador de estado de una categoría.
+		
+		El color se guarda en los datos del RecycleView y llega a la fila
+		mediante la propiedad ``status_color`` enlazada en KV.
+		
+		Args:
+			screen_name: Pantalla de la categoría
+			rgba: Nuevo color del indicador
+		"""
+		if not self._categories_built:
+			return
+		for item in self.categories_view.data:
+			if item['screen'] == screen_name:
+				if item['status_color'] != rgba:
+					item['status_color'] = rgba
+					self.categories_view.refresh_from_data()
+				return
+	
+	def _on_row_selected(self, row: CategoryRow):
+		"""Maneja la pulsación de una fila de categoría.
+		
+		Args:
+			row: Fila pulsada
+		"""
+		category = self._categories_by_screen.get(row.screen)
+		if category is not None:
+			self.on_category_selected(category)
+	
+	def update_bg(self, *args: Any):
+		"""Programa la actualización del fondo del panel para el próximo frame."""
+		self._bg_trigger()
+	
+	def _apply_bg(self, dt: float):
+		"""Copia posición y tamaño del panel a su fondo.
+		
+		Args:
+			dt: Tiempo transcurrido desde el último frame
+		"""
+		self.menu_bg.size = self.menu_panel.size
+		self.menu_bg.pos = self.menu_panel.pos
 	
-	def update_bg(self, instance: Widget, value: Any):
-		"""Actualiza el fondo del panel del menú.
+	def add_line(self, widget: Widget, thickness: Optional[float] = None):
+		"""Registra una línea en el grupo compartido de separadores.
 		
 		Args:
-			instance: Widget que cambió
-			value: Nuevo valor
+			widget: Widget que define la posición de la línea
+			thickness: Grosor de la línea en su borde inferior; None ocupa todo el widget
 		"""
-		self.menu_bg.size = instance.size
-		self.menu_bg.pos = instance.pos
+		rect = Rectangle(size=widget.size, pos=widget.pos)
+		self.lines_group.add(rect)
+		self._line_rects[widget] = (rect, thickness)
+		widget.bind(size=self._lines_trigger, pos=self._lines_trigger)
 	
-	def update_separator(self, instance: Widget, value: Any):
-		"""Actualiza el separador del menú.
+	def update_separator(self, *args: Any):
+		"""Programa la actualización de las líneas separadoras para el próximo frame."""
+		self._lines_trigger()
+	
+	def _apply_lines(self, dt: float):
+		"""Sincroniza todas las líneas separadoras con sus widgets.
 		
 		Args:
-			instance: Widget que cambió
-			value: Nuevo valor
+			dt: Tiempo transcurrido desde el último frame
 		"""
-		if hasattr(self, 'separator_rect'):
-			self.separator_rect.size = instance.size
-			self.separator_rect.pos = instance.pos
+		for widget, (rect, thickness) in self._line_rects.items():
+			rect.pos = widget.pos
+			rect.size = widget.size if thickness is None else (widget.width, thickness)
+	
+	def on_panel_offset(self, instance: Widget, value: float):
+		"""Aplica el desplazamiento del panel a su Translate.
+		
+		Args:
+			instance: Este menú
+			value: Nuevo desplazamiento horizontal
+		"""
+		if self._translate is not None:
+			self._translate.x = value
+	
+	def on_touch_down(self, touch: Any) -> bool:
+		"""Ignora los toques mientras el menú está cerrado.
+		
+		El panel permanece en su posición real aunque se dibuje fuera de pantalla,
+		así que no debe recibir toques cuando está oculto.
+		"""
+		if not self.is_open:
+			return False
+		return super().on_touch_down(touch)
+	
+	def on_touch_move(self, touch: Any) -> bool:
+		"""Ignora los movimientos mientras el menú está cerrado."""
+		if not self.is_open:
+			return False
+		return super().on_touch_move(touch)
+	
+	def on_touch_up(self, touch: Any) -> bool:
+		"""Ignora las liberaciones mientras el menú está cerrado."""
+		if not self.is_open:
+			return False
+		return super().on_touch_up(touch)
 	
 	def on_overlay_touch(self, instance: Widget, touch: Any) -> bool:
 		"""Maneja el toque en el overlay para cerrar el menú.
@@ -229,13 +431,18 @@ class SideMenu(Widget):
 		
 		self.is_open = True
 		
+		if not self._categories_built:
+			self.create_category_buttons()
+			self._categories_built = True
+		
 		# Animar overlay
 		overlay_anim = Animation(opacity=0.5, duration=0.3)
 		overlay_anim.start(self.overlay)
 		
 		# Animar panel
-		panel_anim = Animation(pos=(0, self.menu_panel.pos[1]), duration=0.3, t='out_cubic')
-		panel_anim.start(self.menu_panel)
+		Animation.cancel_all(self, 'panel_offset')
+		panel_anim = Animation(panel_offset=0, duration=0.3, t='out_cubic')
+		panel_anim.start(self)
 		
 		logging.info("Menú lateral abierto")
 	
@@ -255,8 +462,9 @@ class SideMenu(Widget):
 		overlay_anim.start(self.overlay)
 		
 		# Animar panel
-		panel_anim = Animation(pos=(-self.menu_width, self.menu_panel.pos[1]), duration=0.3, t='in_cubic')
-		panel_anim.start(self.menu_panel)
+		Animation.cancel_all(self, 'panel_offset')
+		panel_anim = Animation(panel_offset=-self.menu_width, duration=0.3, t='in_cubic')
+		panel_anim.start(self)
 		
 		logging.info("Menú lateral cerrado")
 	
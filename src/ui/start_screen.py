@@ -23,7 +23,22 @@ class StartScreen(SiKIdleScreen):
 	def __init__(self, **kwargs: Any):
 		"""Inicializa la pantalla de inicio."""
 		super().__init__(**kwargs)
-		self.build_ui()
+
+		# La interfaz se construye al entrar por primera vez (on_pre_enter)
+		self._ui_built = False
+
+		# Popup de salida, construido en el primer uso (ver _exit_popup)
+		self.__popup: Popup | None = None
+
+	def _ensure_ui(self):
+		"""Construye la interfaz si todavía no se ha construido."""
+		if not self._ui_built:
+			self.build_ui()
+			self._ui_built = True
+
+	def on_pre_enter(self, *args):
+		"""Método llamado justo antes de mostrar la pantalla."""
+		self._ensure_ui()
 
 	def build_ui(self):
 		"""Construye la interfaz de la pantalla de inicio."""
@@ -179,6 +194,21 @@ class StartScreen(SiKIdleScreen):
 
 	def show_exit_confirmation(self):
 		"""Muestra un popup de confirmación para salir del juego."""
+		self._exit_popup.open()
+
+	@property
+	def _exit_popup(self) -> Popup:
+		"""Popup de confirmación de salida, construido una sola vez."""
+		if self.__popup is None:
+			self.__popup = self._build_exit_popup()
+		return self.__popup
+
+	def _build_exit_popup(self) -> Popup:
+		"""Construye el popup de confirmación de salida.
+		
+		Returns:
+			Popup listo para abrir
+		"""
 		# Layout del popup
 		popup_layout = BoxLayout(
 			orientation='vertical',
@@ -230,11 +260,19 @@ class StartScreen(SiKIdleScreen):
 			auto_dismiss=False
 		)
 
-		# Vincular eventos
+		# Vincular eventos (una sola vez)
 		cancel_button.bind(on_press=exit_popup.dismiss)
-		confirm_button.bind(on_press=lambda x: self.confirm_exit(exit_popup))
+		confirm_button.bind(on_press=self._on_confirm_exit)
+
+		return exit_popup
 
-		exit_popup.open()
+	def _on_confirm_exit(self, instance: Button):
+		"""Maneja el clic en el botón Salir del popup.
+		
+		Args:
+			instance: Instancia del botón presionado
+		"""
+		self.confirm_exit(self._exit_popup)
 
 	def confirm_exit(self, popup: Popup):
 		"""Confirma la salida del juego.
@@ -253,6 +291,7 @@ class StartScreen(SiKIdleScreen):
 	def on_enter(self, *args):
 		"""Método llamado cuando se entra a la pantalla."""
 		super().on_enter(*args)
+		self._ensure_ui()
 
 		# TODO: AdMob integration here - Cargar banner publicitario
 		# Aquí se cargaría el banner real de AdMob cuando esté integrado
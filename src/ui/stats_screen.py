@@ -4,19 +4,117 @@ Muestra estadísticas detalladas del progreso del jugador
 como clicks totales, tiempo jugado, ingresos, etc.
 """
 
+import functools
 import logging
+import time
 from typing import Any
 
+from kivy.clock import Clock  # type: ignore
+from kivy.graphics import Color, Rectangle  # type: ignore
 from kivy.uix.boxlayout import BoxLayout  # type: ignore
 from kivy.uix.button import Button  # type: ignore
 from kivy.uix.label import Label  # type: ignore
 from kivy.uix.scrollview import ScrollView  # type: ignore
+from kivy.uix.widget import Widget  # type: ignore
 
 from core.game import get_game_state
 from ui.screen_manager import SiKIdleScreen
 from utils.save import get_save_manager
 
 
+# Sufijos numéricos de mayor a menor: (umbral, divisor, sufijo)
+_NUMBER_SUFFIXES = (
+	(1_000_000_000_000, 1e12, 'T'),
+	(1_000_000_000, 1e9, 'B'),
+	(1_000_000, 1e6, 'M'),
+	(1_000, 1e3, 'K'),
+)
+
+# Unidades de tiempo de mayor a menor: (segundos, sufijo, subunidad, sufijo subunidad)
+_TIME_UNITS = (
+	(86400, 'd', 3600, 'h'),
+	(3600, 'h', 60, 'm'),
+	(60, 'm', None, ''),
+)
+
+@functools.lru_cache(maxsize=256)
+def _format_number(number: int) -> str:
+	"""Formatea un número grande con sufijos (memoizado)."""
+	for threshold, divisor, suffix in _NUMBER_SUFFIXES:
+		if number >= threshold:
+			return f"{number/divisor:.1f}{suffix}"
+	return str(number)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_time(seconds: int) -> str:
+	"""Formatea segundos enteros a formato legible (memoizado)."""
+	for unit, unit_suffix, sub_unit, sub_suffix in _TIME_UNITS:
+		if seconds >= unit:
+			major = seconds // unit
+			if sub_unit is None:
+				return f"{major}{unit_suffix}"
+			minor = (seconds % unit) // sub_unit
+			return f"{major}{unit_suffix} {minor}{sub_suffix}"
+	return f"{seconds}s"
+
+
+# Secciones mostradas: (título, ((clave, nombre_mostrar), ...))
+_STATS_SECTIONS = (
+	('🎮 Estadísticas de Juego', (
+		('total_clicks', 'Clicks totales'),
+		('clicks_per_second', 'Clicks por segundo'),
+		('highest_cps', 'Máximo CPS alcanzado'),
+		('total_sessions', 'Sesiones de juego'),
+	)),
+	('💰 Estadísticas Económicas', (
+		('total_coins', 'Monedas totales ganadas'),
+		('current_coins', 'Monedas actuales'),
+		('coins_spent', 'Monedas gastadas'),
+		('highest_balance', 'Balance máximo'),
+	)),
+	('⏰ Estadísticas de Tiempo', (
+		('total_playtime', 'Tiempo total jugado'),
+		('longest_session', 'Sesión más larga'),
+		('days_played', 'Días jugados'),
+		('first_play', 'Primera partida'),
+	)),
+	('🏆 Logros y Bonificaciones', (
+		('ads_watched', 'Anuncios vistos'),
+		('bonuses_earned', 'Bonificaciones ganadas'),
+		('upgrades_bought', 'Mejoras compradas'),
+		('achievements_unlocked', 'Logros desbloqueados'),
+	)),
+)
+
+# Formateador de cada estadística: (pantalla, game_stats, sesiones) -> texto
+_FORMATTERS = {
+	# Estadísticas de juego
+	'total_clicks': lambda screen, s, sessions: str(s.get('total_clicks', 0)),
+	'clicks_per_second': lambda screen, s, sessions: f"{s.get('clicks_per_second', 0):.1f}",
+	'highest_cps': lambda screen, s, sessions: f"{s.get('highest_cps', 0):.1f}",
+	'total_sessions': lambda screen, s, sessions: str(sessions),
+
+	# Estadísticas económicas
+	'total_coins': lambda screen, s, sessions: _format_number(s.get('total_coins_earned', 0)),
+	'current_coins': lambda screen, s, sessions: _format_number(screen.game_state.coins),
+	'coins_spent': lambda screen, s, sessions: _format_number(s.get('total_coins_spent', 0)),
+	'highest_balance': lambda screen, s, sessions: _format_number(s.get('highest_balance', 0)),
+
+	# Estadísticas de tiempo
+	'total_playtime': lambda screen, s, sessions: _format_time(int(s.get('total_playtime', 0))),
+	'longest_session': lambda screen, s, sessions: _format_time(int(s.get('longest_session', 0))),
+	'days_played': lambda screen, s, sessions: str(s.get('days_played', 1)),
+	'first_play': lambda screen, s, sessions: 'Hoy',  # TODO: Implementar fecha real
+
+	# Logros y bonificaciones
+	'ads_watched': lambda screen, s, sessions: str(s.get('ads_watched', 0)),
+	'bonuses_earned': lambda screen, s, sessions: str(s.get('bonuses_earned', 0)),
+	'upgrades_bought': lambda screen, s, sessions: str(s.get('upgrades_bought', 0)),
+	'achievements_unlocked': lambda screen, s, sessions: '0/50',  # TODO: Sistema de logros
+}
+
+
 class StatsScreen(SiKIdleScreen):
 	"""Pantalla de estadísticas del juego."""
 
@@ -27,10 +125,29 @@ class StatsScreen(SiKIdleScreen):
 		self.save_manager = get_save_manager()
 		self.game_state = get_game_state()
 
-		# Referencias a labels de estadísticas para actualización
-		self.stats_labels: dict[str, Label] = {}
+		# Secciones de estadísticas para actualización: (label, [(clave, nombre)])
+		self.stats_sections: list[tuple[Label, tuple]] = []
+
+		# Separadores de sección y su actualización agrupada por frame
+		self._separators: list[tuple[Widget, Rectangle]] = []
+		self._separator_trigger = Clock.create_trigger(self._apply_separators, -1)
+
+		# Refresco periódico solo mientras la pantalla está visible
+		self._tick = None
+		self._last_key: tuple[int, int] | None = None
+
+		# La interfaz se construye al entrar por primera vez (on_pre_enter)
+		self._ui_built = False
 
-		self.build_ui()
+	def _ensure_ui(self):
+		"""Construye la interfaz si todavía no se ha construido."""
+		if not self._ui_built:
+			self.build_ui()
+			self._ui_built = True
+
+	def on_pre_enter(self, *args):
+		"""Método llamado justo antes de mostrar la pantalla."""
+		self._ensure_ui()
 
 	def build_ui(self):
 		"""Construye la interfaz de la pantalla de estadísticas."""
@@ -81,92 +198,23 @@ class StatsScreen(SiKIdleScreen):
 		stats_layout.bind(minimum_height=stats_layout.setter('height'))
 
 		# Crear secciones de estadísticas
-		self.create_gameplay_stats(stats_layout)
-		self.create_economy_stats(stats_layout)
-		self.create_time_stats(stats_layout)
-		self.create_achievement_stats(stats_layout)
+		for title, rows in _STATS_SECTIONS:
+			stats_layout.add_widget(self.create_stats_section(title, rows))
 
 		scroll.add_widget(stats_layout)
 		main_layout.add_widget(scroll)
 
 		self.add_widget(main_layout)
+		self.update_stats()
 
 		logging.info("Pantalla de estadísticas construida")
 
-	def create_gameplay_stats(self, parent: BoxLayout):
-		"""Crea la sección de estadísticas de juego.
-		
-		Args:
-			parent: Layout padre donde agregar la sección
-		"""
-		section = self.create_stats_section(
-			'🎮 Estadísticas de Juego',
-			[
-				('total_clicks', 'Clicks totales'),
-				('clicks_per_second', 'Clicks por segundo'),
-				('highest_cps', 'Máximo CPS alcanzado'),
-				('total_sessions', 'Sesiones de juego'),
-			]
-		)
-		parent.add_widget(section)
-
-	def create_economy_stats(self, parent: BoxLayout):
-		"""Crea la sección de estadísticas económicas.
-		
-		Args:
-			parent: Layout padre donde agregar la sección
-		"""
-		section = self.create_stats_section(
-			'💰 Estadísticas Económicas',
-			[
-				('total_coins', 'Monedas totales ganadas'),
-				('current_coins', 'Monedas actuales'),
-				('coins_spent', 'Monedas gastadas'),
-				('highest_balance', 'Balance máximo'),
-			]
-		)
-		parent.add_widget(section)
-
-	def create_time_stats(self, parent: BoxLayout):
-		"""Crea la sección de estadísticas de tiempo.
-		
-		Args:
-			parent: Layout padre donde agregar la sección
-		"""
-		section = self.create_stats_section(
-			'⏰ Estadísticas de Tiempo',
-			[
-				('total_playtime', 'Tiempo total jugado'),
-				('longest_session', 'Sesión más larga'),
-				('days_played', 'Días jugados'),
-				('first_play', 'Primera partida'),
-			]
-		)
-		parent.add_widget(section)
-
-	def create_achievement_stats(self, parent: BoxLayout):
-		"""Crea la sección de estadísticas de logros.
-		
-		Args:
-			parent: Layout padre donde agregar la sección
-		"""
-		section = self.create_stats_section(
-			'🏆 Logros y Bonificaciones',
-			[
-				('ads_watched', 'Anuncios vistos'),
-				('bonuses_earned', 'Bonificaciones ganadas'),
-				('upgrades_bought', 'Mejoras compradas'),
-				('achievements_unlocked', 'Logros desbloqueados'),
-			]
-		)
-		parent.add_widget(section)
-
-	def create_stats_section(self, title: str, stats: list) -> BoxLayout:
+	def create_stats_section(self, title: str, stats: tuple) -> BoxLayout:
 		"""Crea una sección de estadísticas.
 		
 		Args:
 			title: Título de la sección
-			stats: Lista de tuplas (clave, nombre_mostrar)
+			stats: Tupla de pares (clave, nombre_mostrar)
 			
 		Returns:
 			BoxLayout con la sección de estadísticas
@@ -192,68 +240,58 @@ class StatsScreen(SiKIdleScreen):
 		title_label.text_size = (400, None)
 		section.add_widget(title_label)
 
-		# Estadísticas individuales
-		for stat_key, display_name in stats:
-			stat_row = self.create_stat_row(stat_key, display_name)
-			section.add_widget(stat_row)
+		# Estadísticas de la sección en una sola etiqueta multilínea
+		stats_label = Label(
+			text='',
+			markup=True,
+			font_size='16sp',
+			size_hint=(1, None),
+			height=f'{35 * len(stats)}dp',
+			halign='left',
+			valign='center',
+			line_height=1.4
+		)
+		stats_label.bind(size=lambda label, size: setattr(label, 'text_size', size))
+		section.add_widget(stats_label)
+
+		# Guardar referencia para actualización
+		self.stats_sections.append((stats_label, stats))
 
-		# Separador
-		separator = Label(
-			text='─' * 40,
-			font_size='14sp',
+		# Separador: una línea de 2px dibujada en el canvas
+		separator = Widget(
 			size_hint=(1, None),
-			height='20dp',
-			color=[0.4, 0.4, 0.4, 1]
+			height='2dp'
 		)
+		with separator.canvas:
+			Color(0.4, 0.4, 0.4, 1)
+			separator_rect = Rectangle(pos=separator.pos, size=separator.size)
+		self._separators.append((separator, separator_rect))
+		separator.bind(pos=self._separator_trigger, size=self._separator_trigger)
 		section.add_widget(separator)
 
 		return section
 
-	def create_stat_row(self, stat_key: str, display_name: str) -> BoxLayout:
-		"""Crea una fila de estadística individual.
+	def _apply_separators(self, dt: float):
+		"""Sincroniza los rectángulos de los separadores con sus widgets."""
+		for separator, rect in self._separators:
+			rect.pos = separator.pos
+			rect.size = separator.size
+
+	def format_stats_text(self, stats: tuple, game_stats: dict, sessions: int) -> str:
+		"""Construye el texto con markup de una sección de estadísticas.
 		
 		Args:
-			stat_key: Clave de la estadística
-			display_name: Nombre a mostrar
+			stats: Tupla de pares (clave, nombre_mostrar)
+			game_stats: Instantánea de get_game_stats()
+			sessions: Número de sesiones guardado
 			
 		Returns:
-			BoxLayout con la fila de estadística
+			Texto multilínea con una estadística por línea
 		"""
-		row = BoxLayout(
-			orientation='horizontal',
-			size_hint=(1, None),
-			height='35dp'
-		)
-
-		# Nombre de la estadística
-		name_label = Label(
-			text=display_name + ':',
-			font_size='16sp',
-			size_hint=(0.6, 1),
-			halign='left',
-			valign='center',
-			color=[0.8, 0.8, 0.8, 1]
+		return "\n".join(
+			f"[color=cccccc]{display_name}:[/color] [b][color=e6e6ff]{self._compute_value(stat_key, game_stats, sessions)}[/color][/b]"
+			for stat_key, display_name in stats
 		)
-		name_label.text_size = (None, None)
-		row.add_widget(name_label)
-
-		# Valor de la estadística
-		value_label = Label(
-			text=self.get_stat_value(stat_key),
-			font_size='16sp',
-			size_hint=(0.4, 1),
-			halign='right',
-			valign='center',
-			color=[0.9, 0.9, 1, 1],
-			bold=True
-		)
-		value_label.text_size = (None, None)
-		row.add_widget(value_label)
-
-		# Guardar referencia para actualización
-		self.stats_labels[stat_key] = value_label
-
-		return row
 
 	def get_stat_value(self, stat_key: str) -> str:
 		"""Obtiene el valor formateado de una estadística.
@@ -264,37 +302,27 @@ class StatsScreen(SiKIdleScreen):
 		Returns:
 			Valor formateado como string
 		"""
-		# Obtener estadísticas del juego
-		game_stats = self.game_state.get_game_stats()
+		return self._compute_value(
+			stat_key,
+			self.game_state.get_game_stats(),
+			self.save_manager.get_stat('total_sessions', 1)
+		)
 
-		# Mapeo de estadísticas
-		stat_mapping = {
-			# Estadísticas de juego
-			'total_clicks': game_stats.get('total_clicks', 0),
-			'clicks_per_second': f"{game_stats.get('clicks_per_second', 0):.1f}",
-			'highest_cps': f"{game_stats.get('highest_cps', 0):.1f}",
-			'total_sessions': self.save_manager.get_stat('total_sessions', 1),
-
-			# Estadísticas económicas
-			'total_coins': self.format_number(game_stats.get('total_coins_earned', 0)),
-			'current_coins': self.format_number(self.game_state.coins),
-			'coins_spent': self.format_number(game_stats.get('total_coins_spent', 0)),
-			'highest_balance': self.format_number(game_stats.get('highest_balance', 0)),
-
-			# Estadísticas de tiempo
-			'total_playtime': self.format_time(game_stats.get('total_playtime', 0)),
-			'longest_session': self.format_time(game_stats.get('longest_session', 0)),
-			'days_played': game_stats.get('days_played', 1),
-			'first_play': 'Hoy',  # TODO: Implementar fecha real
-
-			# Logros y bonificaciones
-			'ads_watched': game_stats.get('ads_watched', 0),
-			'bonuses_earned': game_stats.get('bonuses_earned', 0),
-			'upgrades_bought': game_stats.get('upgrades_bought', 0),
-			'achievements_unlocked': '0/50',  # TODO: Sistema de logros
-		}
-
-		return str(stat_mapping.get(stat_key, '---'))
+	def _compute_value(self, stat_key: str, game_stats: dict, sessions: int) -> str:
+		"""Formatea una estadística a partir de una instantánea ya obtenida.
+		
+		Args:
+			stat_key: Clave de la estadística
+			game_stats: Instantánea de get_game_stats()
+			sessions: Número de sesiones guardado
+			
+		Returns:
+			Valor formateado como string
+		"""
+		formatter = _FORMATTERS.get(stat_key)
+		if formatter is None:
+			return '---'
+		return formatter(self, game_stats, sessions)
 
 	def format_number(self, number: int) -> str:
 		"""Formatea un número grande con sufijos.
@@ -305,16 +333,7 @@ class StatsScreen(SiKIdleScreen):
 		Returns:
 			Número formateado con sufijos (K, M, B, etc.)
 		"""
-		if number < 1000:
-			return str(number)
-		elif number < 1000000:
-			return f"{number/1000:.1f}K"
-		elif number < 1000000000:
-			return f"{number/1000000:.1f}M"
-		elif number < 1000000000000:
-			return f"{number/1000000000:.1f}B"
-		else:
-			return f"{number/1000000000000:.1f}T"
+		return _format_number(number)
 
 	def format_time(self, seconds: float) -> str:
 		"""Formatea tiempo en segundos a formato legible.
@@ -325,27 +344,42 @@ class StatsScreen(SiKIdleScreen):
 		Returns:
 			Tiempo formateado como string
 		"""
-		if seconds < 60:
-			return f"{int(seconds)}s"
-		elif seconds < 3600:
-			minutes = int(seconds // 60)
-			return f"{minutes}m"
-		elif seconds < 86400:
-			hours = int(seconds // 3600)
-			minutes = int((seconds % 3600) // 60)
-			return f"{hours}h {minutes}m"
-		else:
-			days = int(seconds // 86400)
-			hours = int((seconds % 86400) // 3600)
-			return f"{days}d {hours}h"
+		return _format_time(int(seconds))
 
 	def update_stats(self):
 		"""Actualiza todas las estadísticas mostradas."""
-		for stat_key, label in self.stats_labels.items():
-			label.text = self.get_stat_value(stat_key)
+		self._last_key = self._refresh_key()
+
+		# Una sola lectura de estadísticas por actualización
+		game_stats = self.game_state.get_game_stats()
+		sessions = self.save_manager.get_stat('total_sessions', 1)
+
+		for label, stats in self.stats_sections:
+			text = self.format_stats_text(stats, game_stats, sessions)
+			if label.text != text:
+				label.text = text
 
 		logging.debug("Estadísticas actualizadas")
 
+	def _refresh_key(self) -> tuple[int, int]:
+		"""Clave que cambia cuando hay algo nuevo que mostrar.
+		
+		Combina la versión de estadísticas del juego con el segundo actual,
+		ya que el tiempo jugado y los clicks por segundo avanzan aunque el
+		jugador no haga nada.
+		"""
+		return getattr(self.game_state, 'stats_version', -1), int(time.time())
+
+	def _maybe_update(self, dt: float):
+		"""Refresca las estadísticas solo si la clave de refresco ha cambiado.
+		
+		Args:
+			dt: Tiempo transcurrido desde la última llamada
+		"""
+		if self._refresh_key() == self._last_key:
+			return
+		self.update_stats()
+
 	def on_back_button(self, instance: Button):
 		"""Maneja el clic en el botón de volver.
 		
@@ -358,8 +392,23 @@ class StatsScreen(SiKIdleScreen):
 	def on_enter(self, *args):
 		"""Método llamado cuando se entra a la pantalla."""
 		super().on_enter(*args)
+		self._ensure_ui()
 
-		# Actualizar estadísticas al entrar
+		# Actualizar estadísticas al entrar y mientras la pantalla sea visible
 		self.update_stats()
+		if self._tick is None:
+			self._tick = Clock.schedule_interval(self._maybe_update, 0.5)
 
 		logging.info("Entrada a pantalla de estadísticas")
+
+	def on_leave(self, *args):
+		"""Método llamado cuando se sale de la pantalla."""
+		super().on_leave(*args)
+
+		if self._tick is not None:
+			self._tick.cancel()
+			self._tick = None
+
+		# Limitar la memoria de los formateadores memoizados
+		_format_number.cache_clear()
+		_format_time.cache_clear()
@@ -5,10 +5,33 @@ para un acceso más eficiente a las diferentes pantallas del juego.
 """
 
 import logging
+from dataclasses import dataclass
+from typing import Callable
 
+from kivy.graphics import Color, Rectangle  # type: ignore
 from kivy.uix.boxlayout import BoxLayout  # type: ignore
 from kivy.uix.button import Button  # type: ignore
-from kivy.uix.widget import Widget  # type: ignore
+
+
+# Colores (fondo, texto) por estado: inactiva, con notificación, activa
+_TAB_COLORS = (
+	([0.4, 0.4, 0.4, 0.8], [0.8, 0.8, 0.8, 1]),  # Inactiva normal - color neutro
+	([1, 0.5, 0, 0.9], [1, 1, 1, 1]),  # Tiene notificación - color de alerta
+	([0.2, 0.7, 0.9, 1.0], [1, 1, 1, 1]),  # Pestaña activa - color primario
+)
+
+
+@dataclass(slots=True)
+class _TabState:
+	"""Estado de una pestaña, separado del widget para no inflar su __dict__."""
+
+	tab_id: str
+	tab_text: str
+	tab_icon: str
+	callback: Callable[[str], None] | None = None
+	nav_callback: Callable[[], None] | None = None
+	is_active: bool = False
+	has_notification: bool = False
 
 
 class TabButton(Button):
@@ -23,28 +46,24 @@ class TabButton(Button):
 			icon: Icono emoji de la pestaña
 			callback: Función a llamar cuando se toque la pestaña
 		"""
-		super().__init__(**kwargs)
+		# El evento se conecta en el constructor (evita un bind() posterior)
+		super().__init__(on_press=self._on_press, **kwargs)
 
-		self.tab_id = tab_id
-		self.tab_text = text
-		self.tab_icon = icon
-		self.callback = callback
-		self.is_active = False
-		self.has_notification = False
+		# nav_callback lo fija TabbedNavigationSystem al registrar la pestaña
+		self.tab_state = _TabState(tab_id, text, icon, callback)
 
-		# Configuración visual base
-		self.text = f"{icon}\n{text}"
+		# Configuración visual base (el texto base no cambia; solo el indicador)
+		self._base_text = f"{icon}\n{text}"
+		self.text = self._base_text
 		self.font_size = "12sp"
 		self.size_hint = (1, 1)
-		self.background_color = [0.4, 0.4, 0.4, 0.8]  # Inactivo por defecto
-
-		# Bind del evento de toque
-		self.bind(on_press=self._on_press)
+		self._update_visual_state()  # Inactivo por defecto
 
 	def _on_press(self, instance):
 		"""Maneja el evento de toque en la pestaña."""
-		if self.callback:
-			self.callback(self.tab_id)
+		state = self.tab_state
+		if state.callback:
+			state.callback(state.tab_id)
 
 	def set_active(self, active: bool):
 		"""Establece el estado activo/inactivo de la pestaña.
@@ -52,7 +71,9 @@ class TabButton(Button):
 		Args:
 			active: True si la pestaña está activa
 		"""
-		self.is_active = active
+		if active == self.tab_state.is_active:
+			return
+		self.tab_state.is_active = active
 		self._update_visual_state()
 
 	def set_notification(self, has_notification: bool):
@@ -61,27 +82,23 @@ class TabButton(Button):
 		Args:
 			has_notification: True si hay notificaciones pendientes
 		"""
-		self.has_notification = has_notification
+		if has_notification == self.tab_state.has_notification:
+			return
+		self.tab_state.has_notification = has_notification
 		self._update_visual_state()
 
 	def _update_visual_state(self):
 		"""Actualiza el estado visual según el estado de la pestaña."""
-		if self.is_active:
-			# Pestaña activa - color primario
-			self.background_color = [0.2, 0.7, 0.9, 1.0]
-			self.color = [1, 1, 1, 1]
-		elif self.has_notification:
-			# Tiene notificación - color de alerta
-			self.background_color = [1, 0.5, 0, 0.9]
-			self.color = [1, 1, 1, 1]
-		else:
-			# Inactiva normal - color neutro
-			self.background_color = [0.4, 0.4, 0.4, 0.8]
-			self.color = [0.8, 0.8, 0.8, 1]
+		is_active = self.tab_state.is_active
+		has_notification = self.tab_state.has_notification
+		index = 2 if is_active else (1 if has_notification else 0)
+		self.background_color, self.color = _TAB_COLORS[index]
 
 		# Actualizar texto con indicador de notificación
-		notification_indicator = " 🔴" if self.has_notification and not self.is_active else ""
-		self.text = f"{self.tab_icon}\n{self.tab_text}{notification_indicator}"
+		if has_notification and not is_active:
+			self.text = self._base_text + " 🔴"
+		else:
+			self.text = self._base_text
 
 
 class TabBar(BoxLayout):
@@ -103,10 +120,7 @@ class TabBar(BoxLayout):
 		self.on_tab_change = None
 
 		# Configuración visual de la barra
-		self.canvas.before.clear()
 		with self.canvas.before:
-			from kivy.graphics import Color, Rectangle  # type: ignore
-
 			Color(0.2, 0.2, 0.2, 0.95)  # Fondo semi-transparente
 			self.bg_rect = Rectangle(size=self.size, pos=self.pos)
 
@@ -159,7 +173,17 @@ class TabBar(BoxLayout):
 		old_tab = self.active_tab
 		self.set_active_tab(tab_id)
 
-		# Llamar callback de cambio
+		# Navegar directamente con el callback guardado en el botón
+		nav_callback = self.tabs[tab_id].tab_state.nav_callback
+		if nav_callback:
+			try:
+				nav_callback()
+			except Exception as e:
+				logging.error(f"Error ejecutando callback para pestaña '{tab_id}': {e}")
+		else:
+			logging.warning(f"No hay callback registrado para pestaña '{tab_id}'")
+
+		# Llamar callback de cambio (observadores externos)
 		if self.on_tab_change:
 			self.on_tab_change(tab_id)
 
@@ -210,10 +234,11 @@ class TabBar(BoxLayout):
 class TabbedNavigationSystem:
 	"""Sistema completo de navegación por pestañas."""
 
+	__slots__ = ("tab_bar",)
+
 	def __init__(self):
 		"""Inicializa el sistema de navegación."""
 		self.tab_bar = None
-		self.navigation_callbacks = {}
 
 	def setup(self, tab_bar):
 		"""Configura el sistema con los componentes necesarios.
@@ -223,9 +248,6 @@ class TabbedNavigationSystem:
 		"""
 		self.tab_bar = tab_bar
 
-		# Conectar callback de cambio de pestaña
-		self.tab_bar.on_tab_change = self._handle_tab_change
-
 		logging.info("Sistema de navegación por pestañas configurado")
 
 	def register_tab(self, tab_id: str, text: str, icon: str, navigation_callback):
@@ -241,28 +263,12 @@ class TabbedNavigationSystem:
 			logging.error("Sistema no configurado - llamar setup() primero")
 			return
 
-		# Registrar callback
-		self.navigation_callbacks[tab_id] = navigation_callback
-
-		# Añadir pestaña a la barra
-		self.tab_bar.add_tab(tab_id, text, icon)
+		# Añadir pestaña a la barra con su callback de navegación
+		tab_button = self.tab_bar.add_tab(tab_id, text, icon)
+		tab_button.tab_state.nav_callback = navigation_callback
 
 		logging.info(f"Pestaña '{tab_id}' registrada en el sistema")
 
-	def _handle_tab_change(self, tab_id: str):
-		"""Maneja el cambio de pestaña ejecutando el callback apropiado.
-
-		Args:
-			tab_id: ID de la pestaña seleccionada
-		"""
-		if tab_id in self.navigation_callbacks:
-			try:
-				self.navigation_callbacks[tab_id]()
-			except Exception as e:
-				logging.error(f"Error ejecutando callback para pestaña '{tab_id}': {e}")
-		else:
-			logging.warning(f"No hay callback registrado para pestaña '{tab_id}'")
-
 	def navigate_to_tab(self, tab_id: str):
 		"""Navega programáticamente a una pestaña específica.
 
@@ -5,26 +5,167 @@ Este módulo proporciona la interfaz visual para la gestión del árbol de talen
 permitiendo a los jugadores ver, desbloquear y gestionar sus especializaciones de combate.
 """
 
+from functools import partial
+
+from kivy.clock import Clock
+from kivy.lang import Builder
+from kivy.properties import ObjectProperty
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.label import Label
 from kivy.uix.button import Button
 from kivy.uix.scrollview import ScrollView
 from kivy.uix.popup import Popup
-from kivy.graphics import Color, RoundedRectangle
-from typing import Optional, Dict, List
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.graphics import ClearBuffers, ClearColor, Color, Fbo, RoundedRectangle
+from typing import Callable, Optional, Dict, List, Tuple
+import weakref
 
 from src.core.talents import TalentManager, TalentBranch, TalentType, TalentInfo
 
 
-class TalentCard(BoxLayout):
+# Fondo del card como 9-patch: la textura compartida se elige según el estado
+Builder.load_string("""
+<TalentCard>:
+    canvas.before:
+        BorderImage:
+            texture: self.bg_texture
+            pos: self.pos
+            size: self.size
+            border: (8, 8, 8, 8)
+""")
+
+# Información de cabecera por rama
+_BRANCH_INFO = {
+	TalentBranch.WARRIOR: {
+		'emoji': '🗡️',
+		'name': 'Guerrero',
+		'description': 'Especialización en daño físico y combate cuerpo a cuerpo'
+	},
+	TalentBranch.EXPLORER: {
+		'emoji': '🏹',
+		'name': 'Explorador',
+		'description': 'Maestro del loot y la exploración de mazmorras'
+	},
+	TalentBranch.MAGE: {
+		'emoji': '🔮',
+		'name': 'Mago',
+		'description': 'Poder arcano y habilidades mágicas devastadoras'
+	},
+	TalentBranch.TANK: {
+		'emoji': '🛡️',
+		'name': 'Tanque',
+		'description': 'Defensa impenetrable y resistencia suprema'
+	}
+}
+
+# Orden de las ramas en el árbol y emoji por nombre de rama
+_BRANCHES = (TalentBranch.WARRIOR, TalentBranch.EXPLORER, TalentBranch.MAGE, TalentBranch.TANK)
+_BRANCH_EMOJI = {branch.name: info['emoji'] for branch, info in _BRANCH_INFO.items()}
+
+# Talentos agrupados por rama, calculados una vez por gestor
+_talents_by_branch_cache: "weakref.WeakKeyDictionary[TalentManager, Dict[TalentBranch, List[Tuple[TalentType, TalentInfo]]]]" = (
+	weakref.WeakKeyDictionary()
+)
+
+
+def _get_talents_for_branch(manager: TalentManager, branch: TalentBranch) -> List[Tuple[TalentType, TalentInfo]]:
+	"""Devuelve los talentos de una rama ordenados por tier y nombre.
+	
+	La primera llamada para un gestor agrupa todas las ramas en una sola
+	pasada sobre ``talent_info``; las siguientes son una búsqueda en caché.
+	
+	Args:
+		manager: Gestor de talentos
+		branch: Rama a consultar
+		
+	Returns:
+		Lista de pares (tipo, info) de la rama
+	"""
+	by_branch = _talents_by_branch_cache.get(manager)
+	if by_branch is None:
+		by_branch = {}
+		for talent_type, talent_info in manager.talent_info.items():
+			by_branch.setdefault(talent_info.branch, []).append((talent_type, talent_info))
+		for talents in by_branch.values():
+			talents.sort(key=lambda t: (t[1].tier.value, t[1].name))
+		_talents_by_branch_cache[manager] = by_branch
+	return by_branch.get(branch, [])
+
+
+# Plantilla del coste del siguiente nivel
+_COST_TMPL = "Costo: {} pts"
+
+# Color de fondo por estado del talento
+_CARD_COLORS = {
+	'locked': (0.3, 0.3, 0.3, 0.3),     # Gris bloqueado
+	'available': (0.2, 0.4, 0.8, 0.3),  # Azul disponible
+	'partial': (0.2, 0.7, 0.3, 0.4),    # Verde mejorado
+	'max': (0.8, 0.6, 0.2, 0.4),        # Dorado máximo
+}
+
+# Estado visual del card según (sin desbloquear, al máximo, mejorable):
+# (fondo, texto del botón, botón deshabilitado)
+_UPGRADE = ("⬆️ Mejorar", False)
+_LOCKED = ("🔒 Bloqueado", True)
+_MAXED = ("✅ MAX", True)
+_CARD_STATES = {
+	(True, False, True): ('available', *_UPGRADE),
+	(True, False, False): ('locked', *_LOCKED),
+	(True, True, True): ('available', *_MAXED),
+	(True, True, False): ('locked', *_MAXED),
+	(False, True, True): ('max', *_MAXED),
+	(False, True, False): ('max', *_MAXED),
+	(False, False, True): ('partial', *_UPGRADE),
+	(False, False, False): ('partial', *_LOCKED),
+}
+
+# Fbo por estado; se renderizan una vez (requiere contexto GL, por eso es perezoso)
+_CARD_BG: Dict[str, Fbo] = {}
+
+
+def _card_background(state: str):
+	"""Devuelve la textura redondeada compartida para un estado del card.
+	
+	Args:
+		state: Clave de ``_CARD_COLORS``
+		
+	Returns:
+		Textura de 32x32 con el rectángulo redondeado
+	"""
+	fbo = _CARD_BG.get(state)
+	if fbo is None:
+		fbo = Fbo(size=(32, 32))
+		with fbo:
+			ClearColor(0, 0, 0, 0)
+			ClearBuffers()
+			Color(*_CARD_COLORS[state])
+			RoundedRectangle(pos=(0, 0), size=(32, 32), radius=[8])
+		fbo.draw()
+		_CARD_BG[state] = fbo
+	return fbo.texture
+
+
+class TalentCard(RecycleDataViewBehavior, BoxLayout):
 	"""
 	Widget individual para mostrar un talento específico.
 	
 	Muestra información del talento, estado actual y permite upgrades.
+	Es la viewclass del RecycleView de cada rama: los widgets internos se
+	crean una vez y ``refresh_view_attrs`` los reapunta al talento recibido.
 	"""
 	
-	def __init__(self, talent_type: TalentType, talent_manager: TalentManager, **kwargs):
+	bg_texture = ObjectProperty(None, allownone=True)
+	
+	def __init__(
+		self,
+		talent_type: Optional[TalentType] = None,
+		talent_manager: Optional[TalentManager] = None,
+		on_upgraded: Optional[Callable[[], None]] = None,
+		**kwargs,
+	):
 		super().__init__(**kwargs)
 		self.orientation = 'vertical'
 		self.size_hint_y = None
@@ -32,34 +173,48 @@ class TalentCard(BoxLayout):
 		self.spacing = 5
 		self.padding = [10, 5]
 		
-		self.talent_type = talent_type
-		self.talent_manager = talent_manager
-		self.talent_info = talent_manager.talent_info[talent_type]
+		self.talent_type = None
+		self.talent_manager = None
+		self.talent_info = None
+		self.current_level = 0
+		self.can_upgrade = False
+		self._on_upgraded = on_upgraded
+		self._last_state = None
 		
-		# Obtener nivel actual del talento
-		self.current_level = talent_manager.get_talent_level(talent_type)
-		self.can_upgrade = talent_manager.can_upgrade_talent(talent_type)
-		
-		self._setup_visual_style()
 		self._create_widgets()
-		self._update_visual_state()
-	
-	def _setup_visual_style(self):
-		"""Configura el estilo visual del card según el estado del talento."""
-		with self.canvas.before:
-			self.color_instruction = Color()
-			self.rect_instruction = RoundedRectangle(
-				pos=self.pos,
-				size=self.size,
-				radius=[8]
-			)
 		
-		self.bind(pos=self._update_graphics, size=self._update_graphics)
+		if talent_type is not None and talent_manager is not None:
+			self.set_talent(talent_type, talent_manager)
+	
+	def refresh_view_attrs(self, rv, index, data):
+		"""Reutiliza el card para el talento indicado en ``data``.
+		
+		Args:
+			rv: RecycleView propietario
+			index: Índice del elemento en ``rv.data``
+			data: Diccionario con ``talent_type``, ``talent_manager`` y
+				opcionalmente ``on_upgraded``
+		"""
+		self._on_upgraded = data.get('on_upgraded')
+		self.set_talent(data['talent_type'], data['talent_manager'])
+		return super().refresh_view_attrs(rv, index, data)
 	
-	def _update_graphics(self, *args):
-		"""Actualiza las instrucciones gráficas cuando cambia posición/tamaño."""
-		self.rect_instruction.pos = self.pos
-		self.rect_instruction.size = self.size
+	def set_talent(self, talent_type: TalentType, talent_manager: TalentManager):
+		"""Apunta el card a un talento y refresca sus textos.
+		
+		Args:
+			talent_type: Talento a mostrar
+			talent_manager: Gestor de talentos
+		"""
+		self.talent_type = talent_type
+		self.talent_manager = talent_manager
+		self.talent_info = talent_manager.talent_info[talent_type]
+		self._talent = talent_manager.talents[talent_type]
+		# El nivel máximo no cambia: se fija una vez en la plantilla
+		self._level_tmpl = f"Nv. {{}}/{self.talent_info.max_level}"
+		self.name_label.text = f"{self.talent_info.emoji} {self.talent_info.name}"
+		self.description_label.text = self.talent_info.description
+		self.refresh_state()
 	
 	def _create_widgets(self):
 		"""Crea los widgets internos del card."""
@@ -68,7 +223,7 @@ class TalentCard(BoxLayout):
 		
 		# Emoji e información básica
 		self.name_label = Label(
-			text=f"{self.talent_info.emoji} {self.talent_info.name}",
+			text="",
 			font_size='14sp',
 			bold=True,
 			text_size=(None, None),
@@ -78,7 +233,7 @@ class TalentCard(BoxLayout):
 		
 		# Nivel actual
 		self.level_label = Label(
-			text=f"Nv. {self.current_level}/{self.talent_info.max_level}",
+			text="",
 			font_size='12sp',
 			size_hint_x=0.3,
 			halign='right'
@@ -89,7 +244,7 @@ class TalentCard(BoxLayout):
 		
 		# Descripción del talento
 		self.description_label = Label(
-			text=self.talent_info.description,
+			text="",
 			font_size='11sp',
 			text_size=(None, None),
 			halign='left',
@@ -102,19 +257,11 @@ class TalentCard(BoxLayout):
 		footer_layout = BoxLayout(orientation='horizontal', size_hint_y=0.3)
 		
 		# Información de costo
-		if self.current_level < self.talent_info.max_level:
-			next_cost = self.talent_manager.talents[self.talent_type].get_upgrade_cost()
-			self.cost_label = Label(
-				text=f"Costo: {next_cost} pts",
-				font_size='10sp',
-				size_hint_x=0.6
-			)
-		else:
-			self.cost_label = Label(
-				text="MAX",
-				font_size='10sp',
-				size_hint_x=0.6
-			)
+		self.cost_label = Label(
+			text="",
+			font_size='10sp',
+			size_hint_x=0.6
+		)
 		footer_layout.add_widget(self.cost_label)
 		
 		# Botón de upgrade
@@ -123,70 +270,52 @@ class TalentCard(BoxLayout):
 			size_hint_x=0.4,
 			font_size='11sp'
 		)
-		self.upgrade_button.bind(on_press=self._on_upgrade_pressed)
+		self.upgrade_button.fbind('on_press', self._on_upgrade_pressed)
 		footer_layout.add_widget(self.upgrade_button)
 		
 		self.add_widget(footer_layout)
 	
 	def _update_visual_state(self):
 		"""Actualiza el estado visual según disponibilidad y nivel."""
-		# Determinar color de fondo
-		if self.current_level == 0:
-			# Talento no desbloqueado
-			if self.can_upgrade:
-				self.color_instruction.rgba = (0.2, 0.4, 0.8, 0.3)  # Azul disponible
-			else:
-				self.color_instruction.rgba = (0.3, 0.3, 0.3, 0.3)  # Gris bloqueado
-		elif self.current_level == self.talent_info.max_level:
-			# Talento al máximo
-			self.color_instruction.rgba = (0.8, 0.6, 0.2, 0.4)  # Dorado máximo
-		else:
-			# Talento parcialmente mejorado
-			self.color_instruction.rgba = (0.2, 0.7, 0.3, 0.4)  # Verde mejorado
-		
-		# Actualizar estado del botón
-		if self.current_level == self.talent_info.max_level:
-			self.upgrade_button.text = "✅ MAX"
-			self.upgrade_button.disabled = True
-		elif self.can_upgrade:
-			self.upgrade_button.text = "⬆️ Mejorar"
-			self.upgrade_button.disabled = False
-		else:
-			self.upgrade_button.text = "🔒 Bloqueado"
-			self.upgrade_button.disabled = True
+		bg_state, button_text, disabled = _CARD_STATES[(
+			self.current_level == 0,
+			self.current_level == self.talent_info.max_level,
+			self.can_upgrade,
+		)]
+		self.bg_texture = _card_background(bg_state)
+		self.upgrade_button.text = button_text
+		self.upgrade_button.disabled = disabled
 	
 	def _on_upgrade_pressed(self, button):
 		"""Maneja el clic en el botón de upgrade."""
 		if self.talent_manager.can_upgrade_talent(self.talent_type):
 			success = self.talent_manager.upgrade_talent(self.talent_type)
 			if success:
-				# Actualizar información local
-				self.current_level = self.talent_manager.get_talent_level(self.talent_type)
-				self.can_upgrade = self.talent_manager.can_upgrade_talent(self.talent_type)
-				
-				# Actualizar UI
-				self.level_label.text = f"Nv. {self.current_level}/{self.talent_info.max_level}"
-				if self.current_level < self.talent_info.max_level:
-					next_cost = self.talent_manager.talents[self.talent_type].get_upgrade_cost()
-					self.cost_label.text = f"Costo: {next_cost} pts"
-				else:
-					self.cost_label.text = "MAX"
+				# Actualizar información local y UI
+				self.refresh_state()
 				
-				self._update_visual_state()
-				
-				# Notificar a la pantalla padre para actualizar puntos disponibles
-				if hasattr(self.parent.parent.parent, 'update_talent_points_display'):
-					self.parent.parent.parent.update_talent_points_display()
+				# Notificar a la pantalla para actualizar puntos disponibles
+				if self._on_upgraded:
+					self._on_upgraded()
 	
 	def refresh_state(self):
-		"""Refresca el estado del talento desde el manager."""
+		"""Refresca el estado del talento desde el manager.
+		
+		Si el talento, su nivel y su disponibilidad no han cambiado desde el
+		último refresco no se toca ningún widget.
+		"""
 		self.current_level = self.talent_manager.get_talent_level(self.talent_type)
 		self.can_upgrade = self.talent_manager.can_upgrade_talent(self.talent_type)
 		
-		self.level_label.text = f"Nv. {self.current_level}/{self.talent_info.max_level}"
+		state = (self.talent_type, self.current_level, self.can_upgrade)
+		if state == self._last_state:
+			return
+		self._last_state = state
+		
+		self.level_label.text = self._level_tmpl.format(self.current_level)
 		if self.current_level < self.talent_info.max_level:
-			next_cost = self.talent_manager.talents[self.talent_type].get_upgrade_cost()
-			self.cost_label.text = f"Costo: {next_cost} pts"
+			next_cost = self._talent.get_upgrade_cost()
+			self.cost_label.text = _COST_TMPL.format(next_cost)
 		else:
 			self.cost_label.text = "MAX"
 		
@@ -198,7 +327,13 @@ class TalentBranchSection(BoxLayout):
 	Sección que muestra todos los talentos de una rama específica.
 	"""
 	
-	def __init__(self, branch: TalentBranch, talent_manager: TalentManager, **kwargs):
+	def __init__(
+		self,
+		branch: TalentBranch,
+		talent_manager: TalentManager,
+		on_upgraded: Optional[Callable[[], None]] = None,
+		**kwargs,
+	):
 		super().__init__(**kwargs)
 		self.orientation = 'vertical'
 		self.spacing = 10
@@ -206,37 +341,14 @@ class TalentBranchSection(BoxLayout):
 		
 		self.branch = branch
 		self.talent_manager = talent_manager
+		self.on_upgraded = on_upgraded
 		
 		self._create_branch_header()
 		self._create_talent_cards()
 	
 	def _create_branch_header(self):
 		"""Crea el header de la rama con título y descripción."""
-		# Mapeo de información por rama
-		branch_info = {
-			TalentBranch.WARRIOR: {
-				'emoji': '🗡️',
-				'name': 'Guerrero',
-				'description': 'Especialización en daño físico y combate cuerpo a cuerpo'
-			},
-			TalentBranch.EXPLORER: {
-				'emoji': '🏹',
-				'name': 'Explorador',
-				'description': 'Maestro del loot y la exploración de mazmorras'
-			},
-			TalentBranch.MAGE: {
-				'emoji': '🔮',
-				'name': 'Mago',
-				'description': 'Poder arcano y habilidades mágicas devastadoras'
-			},
-			TalentBranch.TANK: {
-				'emoji': '🛡️',
-				'name': 'Tanque',
-				'description': 'Defensa impenetrable y resistencia suprema'
-			}
-		}
-		
-		info = branch_info[self.branch]
+		info = _BRANCH_INFO[self.branch]
 		
 		# Título de la rama
 		title_label = Label(
@@ -263,101 +375,92 @@ class TalentBranchSection(BoxLayout):
 	
 	def _create_talent_cards(self):
 		"""Crea los cards de talentos para esta rama."""
-		# Obtener talentos de la rama
-		branch_talents = [
-			(talent_type, talent_info) for talent_type, talent_info in self.talent_manager.talent_info.items()
-			if talent_info.branch == self.branch
+		# Obtener talentos de la rama (ya ordenados por tier y nombre)
+		branch_talents = _get_talents_for_branch(self.talent_manager, self.branch)
+		
+		# Lista reciclada: solo se instancian los cards visibles
+		cards_layout = RecycleBoxLayout(
+			orientation='vertical',
+			default_size=(None, 120),
+			default_size_hint=(1, None),
+			size_hint_y=None,
+			spacing=10
+		)
+		cards_layout.bind(minimum_height=cards_layout.setter('height'))
+		self.talents_view = RecycleView(do_scroll_x=False)
+		self.talents_view.add_widget(cards_layout)
+		self.talents_view.viewclass = TalentCard
+		self.talents_view.data = [
+			{
+				'talent_type': talent_type,
+				'talent_manager': self.talent_manager,
+				'on_upgraded': self.on_upgraded,
+			}
+			for talent_type, talent_info in branch_talents
 		]
-		
-		# Ordenar por tier y luego por nombre
-		branch_talents.sort(key=lambda t: (t[1].tier.value, t[1].name))
-		
-		# Crear cards
-		self.talent_cards: List[TalentCard] = []
-		for talent_type, talent_info in branch_talents:
-			card = TalentCard(talent_type, self.talent_manager)
-			self.talent_cards.append(card)
-			self.add_widget(card)
+		self.add_widget(self.talents_view)
 	
 	def refresh_all_cards(self):
-		"""Refresca el estado de todos los cards de esta rama."""
-		for card in self.talent_cards:
-			card.refresh_state()
+		"""Refresca el estado de los cards visibles de esta rama."""
+		self.talents_view.refresh_from_data()
 
 
 class TalentInfoPopup(Popup):
 	"""
 	Popup que muestra información detallada de un talento específico.
+	
+	Los widgets se crean una sola vez; ``set_talent`` solo cambia sus textos,
+	así que la misma instancia puede reutilizarse para cualquier talento.
 	"""
 	
 	def __init__(self, talent_type: TalentType, talent_manager: TalentManager, **kwargs):
-		self.talent_type = talent_type
 		self.talent_manager = talent_manager
-		self.talent_info = talent_manager.talent_info[talent_type]
 		
 		super().__init__(**kwargs)
-		self.title = f"{self.talent_info.emoji} {self.talent_info.name}"
 		self.size_hint = (0.8, 0.7)
 		
 		self._create_content()
+		self.set_talent(talent_type)
 	
 	def _create_content(self):
 		"""Crea el contenido del popup."""
 		layout = BoxLayout(orientation='vertical', spacing=15, padding=20)
 		
 		# Descripción detallada
-		desc_label = Label(
-			text=self.talent_info.description,
+		self.desc_label = Label(
 			text_size=(None, None),
 			halign='center',
 			font_size='14sp'
 		)
-		layout.add_widget(desc_label)
+		layout.add_widget(self.desc_label)
 		
 		# Información de nivel actual
-		current_level = self.talent_manager.get_talent_level(self.talent_type)
-		level_info = Label(
-			text=f"Nivel Actual: {current_level}/{self.talent_info.max_level}",
+		self.level_label = Label(
 			font_size='16sp',
 			bold=True
 		)
-		layout.add_widget(level_info)
+		layout.add_widget(self.level_label)
 		
 		# Efectos por nivel
-		if current_level > 0:
-			current_effect = self.talent_manager.get_talent_effect(self.talent_type)
-			effect_label = Label(
-				text=f"Efecto Actual: {current_effect:.2f}",
-				font_size='14sp',
-				color=(0.3, 0.8, 0.3, 1)
-			)
-			layout.add_widget(effect_label)
+		self.effect_label = Label(
+			font_size='14sp',
+			color=(0.3, 0.8, 0.3, 1)
+		)
+		layout.add_widget(self.effect_label)
 		
 		# Costo del siguiente nivel
-		if current_level < self.talent_info.max_level:
-			next_cost = self.talent_manager.talents[self.talent_type].get_upgrade_cost()
-			cost_label = Label(
-				text=f"Costo Siguiente Nivel: {next_cost} puntos",
-				font_size='14sp'
-			)
-			layout.add_widget(cost_label)
+		self.cost_label = Label(
+			font_size='14sp'
+		)
+		layout.add_widget(self.cost_label)
 		
 		# Requisitos
-		if self.talent_info.prerequisites:
-			req_text = "Requisitos:\n"
-			for req_talent in self.talent_info.prerequisites:
-				req_level = self.talent_manager.get_talent_level(req_talent)
-				req_info = self.talent_manager.talent_info[req_talent]
-				status = "✅" if req_level > 0 else "❌"
-				req_text += f"{status} {req_info.name} (Nivel {req_level})\n"
-			
-			req_label = Label(
-				text=req_text,
-				text_size=(None, None),
-				halign='center',
-				font_size='12sp'
-			)
-			layout.add_widget(req_label)
+		self.req_label = Label(
+			text_size=(None, None),
+			halign='center',
+			font_size='12sp'
+		)
+		layout.add_widget(self.req_label)
 		
 		# Botón de cerrar
 		close_button = Button(
@@ -365,10 +468,57 @@ class TalentInfoPopup(Popup):
 			size_hint_y=None,
 			height=50
 		)
-		close_button.bind(on_press=self.dismiss)
+		close_button.fbind('on_press', self.dismiss)
 		layout.add_widget(close_button)
 		
 		self.content = layout
+	
+	@staticmethod
+	def _set_visible(label: Label, visible: bool):
+		"""Muestra u oculta una etiqueta sin sacarla del layout."""
+		label.opacity = 1 if visible else 0
+		label.size_hint_y = 1 if visible else None
+		if not visible:
+			label.height = 0
+	
+	def set_talent(self, talent_type: TalentType):
+		"""Muestra la información de un talento reutilizando los widgets.
+		
+		Args:
+			talent_type: Talento a mostrar
+		"""
+		self.talent_type = talent_type
+		self.talent_info = self.talent_manager.talent_info[talent_type]
+		self._talent = self.talent_manager.talents[talent_type]
+		self.title = f"{self.talent_info.emoji} {self.talent_info.name}"
+		
+		self.desc_label.text = self.talent_info.description
+		
+		current_level = self.talent_manager.get_talent_level(talent_type)
+		self.level_label.text = f"Nivel Actual: {current_level}/{self.talent_info.max_level}"
+		
+		has_effect = current_level > 0
+		if has_effect:
+			current_effect = self.talent_manager.get_talent_effect(talent_type)
+			self.effect_label.text = f"Efecto Actual: {current_effect:.2f}"
+		self._set_visible(self.effect_label, has_effect)
+		
+		has_next = current_level < self.talent_info.max_level
+		if has_next:
+			next_cost = self._talent.get_upgrade_cost()
+			self.cost_label.text = f"Costo Siguiente Nivel: {next_cost} puntos"
+		self._set_visible(self.cost_label, has_next)
+		
+		has_reqs = bool(self.talent_info.prerequisites)
+		if has_reqs:
+			req_text = "Requisitos:\n"
+			for req_talent in self.talent_info.prerequisites:
+				req_level = self.talent_manager.get_talent_level(req_talent)
+				req_info = self.talent_manager.talent_info[req_talent]
+				status = "✅" if req_level > 0 else "❌"
+				req_text += f"{status} {req_info.name} (Nivel {req_level})\n"
+			self.req_label.text = req_text
+		self._set_visible(self.req_label, has_reqs)
 
 
 class TalentsScreen(BoxLayout):
@@ -388,12 +538,22 @@ class TalentsScreen(BoxLayout):
 		self.talent_manager = talent_manager
 		self.branch_sections: Dict[TalentBranch, TalentBranchSection] = {}
 		
+		# Popups reutilizables, construidos en su primer uso
+		self._stats_popup: Optional[Popup] = None
+		self._reset_popup: Optional[Popup] = None
+		self._no_talents_popup: Optional[Popup] = None
+		
+		# Varias peticiones de refresco en el mismo frame se agrupan en una
+		self._refresh_trigger = Clock.create_trigger(self._do_refresh_points, 0)
+		self._last_points = -1
+		self._force_refresh = True
+		
 		self._create_header()
 		self._create_talent_tree()
 		self._create_footer()
 		
 		# Actualizar display inicial
-		self.update_talent_points_display()
+		self._do_refresh_points()
 	
 	def _create_header(self):
 		"""Crea el header con información general."""
@@ -439,10 +599,11 @@ class TalentsScreen(BoxLayout):
 		main_layout.bind(minimum_height=main_layout.setter('height'))
 		
 		# Crear secciones por rama
-		branches = [TalentBranch.WARRIOR, TalentBranch.EXPLORER, TalentBranch.MAGE, TalentBranch.TANK]
-		
-		for branch in branches:
-			section = TalentBranchSection(branch, self.talent_manager)
+		for branch in _BRANCHES:
+			section = TalentBranchSection(
+				branch, self.talent_manager,
+				on_upgraded=partial(self.update_talent_points_display, force=True)
+			)
 			section.size_hint_y = None
 			section.height = 600  # Altura fija para cada sección
 			
@@ -466,7 +627,7 @@ class TalentsScreen(BoxLayout):
 			text="🔄 Reset Talentos",
 			size_hint_x=0.5
 		)
-		reset_button.bind(on_press=self._show_reset_confirmation)
+		reset_button.fbind('on_press', self._show_reset_confirmation)
 		footer_layout.add_widget(reset_button)
 		
 		# Información de estadísticas
@@ -474,15 +635,31 @@ class TalentsScreen(BoxLayout):
 			text="📊 Ver Estadísticas",
 			size_hint_x=0.5
 		)
-		stats_button.bind(on_press=self._show_talent_stats)
+		stats_button.fbind('on_press', self._show_talent_stats)
 		footer_layout.add_widget(stats_button)
 		
 		self.add_widget(footer_layout)
 	
-	def update_talent_points_display(self):
-		"""Actualiza el display de puntos disponibles."""
+	def update_talent_points_display(self, force: bool = False):
+		"""Programa la actualización del display de puntos para el próximo frame.
+		
+		Args:
+			force: Refrescar los cards aunque los puntos no hayan cambiado
+		"""
+		if force:
+			self._force_refresh = True
+		self._refresh_trigger()
+	
+	def _do_refresh_points(self, *args):
+		"""Actualiza el display de puntos disponibles y los cards."""
 		available_points = self.talent_manager.talent_points
-		self.points_label.text = f"Puntos: {available_points}"
+		if available_points == self._last_points and not self._force_refresh:
+			return
+		self._force_refresh = False
+		
+		if available_points != self._last_points:
+			self._last_points = available_points
+			self.points_label.text = f"Puntos: {available_points}"
 		
 		# Refrescar todos los cards
 		for section in self.branch_sections.values():
@@ -498,23 +675,31 @@ class TalentsScreen(BoxLayout):
 		
 		if total_spent == 0:
 			# No hay talentos para resetear
-			popup = Popup(
-				title="Sin Talentos",
-				content=Label(text="No tienes talentos para resetear."),
-				size_hint=(0.6, 0.4)
-			)
-			popup.open()
+			if self._no_talents_popup is None:
+				self._no_talents_popup = Popup(
+					title="Sin Talentos",
+					content=Label(text="No tienes talentos para resetear."),
+					size_hint=(0.6, 0.4)
+				)
+			self._no_talents_popup.open()
 			return
 		
-		# Popup de confirmación
+		if self._reset_popup is None:
+			self._build_reset_popup()
+		self._reset_info_label.text = (
+			f"¿Resetear todos los talentos?\n\nRecuperarás {total_spent} puntos de talento."
+		)
+		self._reset_popup.open()
+	
+	def _build_reset_popup(self):
+		"""Construye el popup de confirmación de reset."""
 		layout = BoxLayout(orientation='vertical', spacing=15, padding=20)
 		
-		info_label = Label(
-			text=f"¿Resetear todos los talentos?\n\nRecuperarás {total_spent} puntos de talento.",
+		self._reset_info_label = Label(
 			text_size=(None, None),
 			halign='center'
 		)
-		layout.add_widget(info_label)
+		layout.add_widget(self._reset_info_label)
 		
 		button_layout = BoxLayout(orientation='horizontal', spacing=10, size_hint_y=None, height=50)
 		
@@ -525,49 +710,28 @@ class TalentsScreen(BoxLayout):
 		button_layout.add_widget(cancel_button)
 		layout.add_widget(button_layout)
 		
-		popup = Popup(
+		self._reset_popup = Popup(
 			title="Confirmar Reset",
 			content=layout,
 			size_hint=(0.7, 0.5)
 		)
 		
-		def do_reset(btn):
-			self.talent_manager.reset_all_talents()
-			self.update_talent_points_display()
-			popup.dismiss()
-		
-		confirm_button.bind(on_press=do_reset)
-		cancel_button.bind(on_press=popup.dismiss)
-		
-		popup.open()
+		confirm_button.fbind('on_press', self._do_reset)
+		cancel_button.fbind('on_press', self._reset_popup.dismiss)
+	
+	def _do_reset(self, button):
+		"""Resetea los talentos tras la confirmación."""
+		self.talent_manager.reset_all_talents()
+		self.update_talent_points_display(force=True)
+		self._reset_popup.dismiss()
 	
 	def _show_talent_stats(self, button):
 		"""Muestra estadísticas detalladas de talentos."""
-		layout = BoxLayout(orientation='vertical', spacing=10, padding=20)
+		if self._stats_popup is None:
+			self._build_stats_popup()
 		
-		# Calcular estadísticas
-		total_levels = sum(
-			self.talent_manager.get_talent_level(talent_type) 
-			for talent_type in TalentType
-		)
-		
-		talents_unlocked = sum(
-			1 for talent_type in TalentType
-			if self.talent_manager.get_talent_level(talent_type) > 0
-		)
-		
-		# Estadísticas por rama
-		branch_stats = {}
-		for branch in TalentBranch:
-			branch_talents = [
-				talent for talent in self.talent_manager.talents.values()
-				if talent.branch == branch
-			]
-			branch_levels = sum(
-				self.talent_manager.get_talent_level(talent.talent_type)
-				for talent in branch_talents
-			)
-			branch_stats[branch] = branch_levels
+		# Calcular estadísticas (una sola pasada, memoizada en el gestor)
+		total_levels, talents_unlocked, branch_stats = self.talent_manager.summarize()
 		
 		# Labels informativos
 		stats_text = f"📊 Estadísticas de Talentos\n\n"
@@ -577,16 +741,21 @@ class TalentsScreen(BoxLayout):
 		
 		stats_text += "Por Rama:\n"
 		for branch, levels in branch_stats.items():
-			branch_emoji = {'WARRIOR': '🗡️', 'EXPLORER': '🏹', 'MAGE': '🔮', 'TANK': '🛡️'}
-			emoji = branch_emoji.get(branch.name, '⭐')
+			emoji = _BRANCH_EMOJI.get(branch.name, '⭐')
 			stats_text += f"{emoji} {branch.name.title()}: {levels} niveles\n"
 		
-		stats_label = Label(
-			text=stats_text,
+		self._stats_label.text = stats_text
+		self._stats_popup.open()
+	
+	def _build_stats_popup(self):
+		"""Construye el popup de estadísticas de talentos."""
+		layout = BoxLayout(orientation='vertical', spacing=10, padding=20)
+		
+		self._stats_label = Label(
 			text_size=(None, None),
 			halign='center'
 		)
-		layout.add_widget(stats_label)
+		layout.add_widget(self._stats_label)
 		
 		close_button = Button(
 			text="Cerrar",
@@ -595,14 +764,13 @@ class TalentsScreen(BoxLayout):
 		)
 		layout.add_widget(close_button)
 		
-		popup = Popup(
+		self._stats_popup = Popup(
 			title="Estadísticas de Talentos",
 			content=layout,
 			size_hint=(0.8, 0.8)
 		)
 		
-		close_button.bind(on_press=popup.dismiss)
-		popup.open()
+		close_button.fbind('on_press', self._stats_popup.dismiss)
 	
 	def add_talent_points(self, points: int):
 		"""Añade puntos de talento y actualiza la UI."""
@@ -11,83 +11,180 @@ NOTA: Los edificios se han movido completamente a HomeScreen
 """
 
 import logging
-from typing import Any
-from kivy.uix.gridlayout import GridLayout  # type: ignore
+from functools import partial
+from typing import Any, Callable
 from kivy.uix.tabbedpanel import TabbedPanel, TabbedPanelItem  # type: ignore
 from kivy.clock import Clock  # type: ignore
+from kivy.lang import Builder  # type: ignore
+from kivy.properties import (  # type: ignore
+	BooleanProperty,
+	ListProperty,
+	NumericProperty,
+	ObjectProperty,
+	StringProperty,
+)
 from kivy.uix.boxlayout import BoxLayout  # type: ignore
 from kivy.uix.label import Label  # type: ignore
-from kivy.uix.button import Button  # type: ignore
-from kivy.uix.scrollview import ScrollView  # type: ignore
+from kivy.uix.recycleboxlayout import RecycleBoxLayout  # type: ignore
+from kivy.uix.recycleview import RecycleView  # type: ignore
 
-from core.game import get_game_state, GameState
-from core.upgrades import UpgradeType, UpgradeCategory, UpgradeInfo
+from core.game import get_game_state
 from ui.screen_manager import SiKIdleScreen
 
+logger = logging.getLogger(__name__)
 
-class UpgradeButton(Button):
-	"""Botón personalizado para representar una mejora."""
-	
-	def __init__(self, upgrade_type: UpgradeType, upgrade_info: UpgradeInfo, game_state: GameState, **kwargs: Any):
+
+Builder.load_string("""
+<PurchaseRow>:
+    orientation: 'horizontal'
+    spacing: 8
+    padding: 4, 4, 4, 4
+    BoxLayout:
+        orientation: 'vertical'
+        size_hint_x: 0.7
+        Label:
+            text: root.title
+            font_size: '14sp'
+            bold: True
+            size_hint_y: 0.6
+            halign: 'left'
+            valign: 'center'
+            text_size: self.size
+        Label:
+            text: root.desc
+            font_size: '11sp'
+            color: 0.7, 0.7, 0.7, 1
+            size_hint_y: 0.4
+            halign: 'left'
+            valign: 'center'
+            text_size: self.size
+    Button:
+        text: root.button_text
+        font_size: '12sp'
+        size_hint_x: 0.3
+        background_color: root.affordable_color if root.affordable else (0.8, 0.2, 0.2, 1)
+        disabled: not root.affordable
+        on_press: root.dispatch('on_buy')
+""")
+
+
+class PurchaseRow(BoxLayout):
+	"""Fila de mejora permanente o power-up (definida en la regla KV <PurchaseRow>).
+
+	Es la viewclass de los RecycleView de las pestañas: sus propiedades llegan
+	desde los diccionarios de ``data`` y la instancia se reutiliza al hacer scroll.
+	"""
+
+	item_id = StringProperty("")
+	title = StringProperty("")
+	desc = StringProperty("")
+	button_text = StringProperty("")
+	cost = NumericProperty(0)
+	duration = NumericProperty(0)
+	affordable = BooleanProperty(False)
+	affordable_color = ListProperty([0.2, 0.8, 0.2, 1])
+	buy_callback = ObjectProperty(None, allownone=True)
+
+	def __init__(self, **kwargs: Any):
+		"""Inicializa la fila de compra."""
+		self.register_event_type('on_buy')
 		super().__init__(**kwargs)
-		self.upgrade_type = upgrade_type
-		self.upgrade_info = upgrade_info
-		self.game_state = game_state
-		self.update_display()
-		
-	def update_display(self):
-		"""Actualiza la información mostrada de la mejora."""
-		upgrade = self.game_state.upgrade_manager.get_upgrade(self.upgrade_type)
-		cost = upgrade.get_current_cost(self.upgrade_info)
-		
-		# Verificar si se puede permitir
-		can_afford = True
-		if cost != float('inf'):
-			if self.game_state.resource_manager.get_resource(self.upgrade_info.cost_resource) < cost:
-				can_afford = False
-		else:
-			can_afford = False
-		
-		# Configurar texto del botón
-		if cost == float('inf'):
-			cost_text = "MAX"
-		else:
-			cost_text = f"{cost:,.0f}"
-		
-		total_effect = upgrade.get_total_effect(self.upgrade_info)
-		effect_text = f"+{total_effect * 100:.1f}%" if self.upgrade_info.upgrade_type.value.endswith(('income', 'chance', 'reduction')) else f"+{total_effect:.1f}x"
-		
-		self.text = (f"{self.upgrade_info.emoji} {self.upgrade_info.name}\n"
-					f"Nivel: {upgrade.level}/{self.upgrade_info.max_level if self.upgrade_info.max_level > 0 else '∞'}\n"
-					f"Efecto: {effect_text}\n"
-					f"Costo: {cost_text}")
-		
-		# Configurar colores
-		if can_afford and cost != float('inf'):
-			self.background_color = [0.2, 0.8, 0.2, 1]  # Verde si se puede permitir
-		elif cost == float('inf'):
-			self.background_color = [0.8, 0.8, 0.2, 1]  # Amarillo si está al máximo
-		else:
-			self.background_color = [0.8, 0.2, 0.2, 1]  # Rojo si no se puede permitir
-			
-		# Desactivar si no se puede permitir
-		self.disabled = not can_afford or cost == float('inf')
 
+	def on_buy(self, *args):
+		"""Evento disparado al pulsar el botón de compra/activación."""
+		if self.buy_callback is not None:
+			self.buy_callback(self)
+
+
+# Mejoras específicas para idle clicker: (id, nombre, descripción, coste)
+_IDLE_UPGRADES = (
+	('click_power', '👆 Poder de Clic', 'Aumenta monedas por clic', 10),
+	('building_efficiency', '🏗️ Eficiencia', 'Mejora producción de edificios', 50),
+	('offline_earnings', '💤 Ingresos Offline', 'Gana mientras no juegas', 100),
+	('auto_clicker', '🤖 Auto-Clic', 'Clics automáticos por segundo', 500),
+)
+
+# Mejoras específicas para combate: (id, nombre, descripción, coste)
+_COMBAT_UPGRADES = (
+	('damage_boost', '⚔️ Daño', 'Aumenta daño en combate', 25),
+	('critical_chance', '🍀 Crítico', 'Probabilidad de golpe crítico', 75),
+	('health_regen', '❤️ Regeneración', 'Recupera HP automáticamente', 40),
+	('combat_speed', '⚡ Velocidad', 'Ataques más rápidos', 60),
+)
+
+# Mejoras que afectan ambos sistemas: (id, nombre, descripción, coste)
+_MIXED_UPGRADES = (
+	('global_multiplier', '🌟 Multiplicador Global', 'Bonifica todo el progreso', 200),
+	('prestige_bonus', '💎 Bonus Prestigio', 'Mejora cristales de prestigio', 150),
+	('luck_factor', '🍀 Factor Suerte', 'Mejora todas las probabilidades', 100),
+	('experience_boost', '📚 Boost XP', 'Más experiencia en todo', 80),
+)
+
+# Power-ups temporales: (id, nombre, descripción, coste, duración en segundos)
+_POWERUPS = (
+	('double_coins', '💰x2', '2x monedas por 1 hora', 50, 3600),
+	('triple_click', '👆x3', '3x poder de clic por 30min', 30, 1800),
+	('speed_boost', '⚡x5', '5x velocidad por 15min', 75, 900),
+	('mega_luck', '🍀x10', '10x suerte por 10min', 100, 600),
+)
+
+# Formateador del panel de estadísticas (se crea una vez, no por tick)
+_format_stats = "💰 Gastado: {:,.0f}    ⚡ Activas: {}".format
 
 class UpgradesScreen(SiKIdleScreen):
 	"""Pantalla principal de gestión de mejoras."""
 	
+	# Texto del panel de estadísticas (la StringProperty ignora valores iguales)
+	stats_text = StringProperty("💰 Gastado: 0    ⚡ Activas: 0")
+	
 	def __init__(self, **kwargs: Any):
 		super().__init__(**kwargs)
 		self.game_state = get_game_state()
-		self.upgrade_buttons: dict[UpgradeType, UpgradeButton] = {}
-		self.stats_labels: dict[str, Label] = {}
-		self.update_event = None
 		
-		self.build_ui()
+		# Refresco solo por eventos: los cambios de monedas/mejoras disparan este
+		# trigger (varios cambios en un frame se agrupan en un solo update_ui).
+		# No hay intervalo de sondeo: sin cambios la pantalla no hace trabajo
+		self._ui_trigger = Clock.create_trigger(self.update_ui)
+		
+		# Listas recicladas de compra/activación (una por pestaña construida)
+		self._purchase_views: list[RecycleView] = []
+		
+		# Monedas con las que se calculó la asequibilidad (None = recalcular todo)
+		self._last_coins: int | None = None
 		
+		# Monedas del último update_ui; si no cambian no hay nada que redibujar
+		self._last_ui_state: int | None = None
+		
+		# Pestañas cuyo contenido aún no se ha construido: pestaña → (contenedor, constructor)
+		self._pending_tabs: dict[TabbedPanelItem, tuple[BoxLayout, Callable[[], Any]]] = {}
+		
+		# La interfaz se construye una sola vez, al entrar por primera vez
+		self._ui_built = False
+		
+		# True solo mientras la pantalla se muestra (update_ui no hace nada fuera)
+		self._visible = False
+		
+	def _ensure_ui(self):
+		"""Construye la interfaz si todavía no se ha construido."""
+		if not self._ui_built:
+			self.build_ui()
+			self._ui_built = True
+	
+	def on_pre_enter(self, *args):
+		"""Método llamado justo antes de mostrar la pantalla."""
+		self._visible = True
+		self._ensure_ui()
+	
+	def on_pre_leave(self, *args):
+		"""Método llamado justo antes de ocultar la pantalla."""
+		self._visible = False
+	
 	def build_ui(self):
-		"""Construye la interfaz de usuario de la pantalla de mejoras."""
+		"""Construye la interfaz de usuario de la pantalla de mejoras.
+		
+		Se llama una única vez (ver _ensure_ui); al volver a la pantalla solo
+		se refrescan los widgets existentes.
+		"""
 		# Layout principal optimizado para móvil
 		main_layout = BoxLayout(orientation='vertical', padding=[8, 8, 8, 8], spacing=8)
 		
@@ -112,19 +209,13 @@ class UpgradesScreen(SiKIdleScreen):
 			spacing=5
 		)
 		
-		self.stats_labels['total_spent'] = Label(
-			text="💰 Gastado: 0",
-			font_size='12sp',
-			size_hint_x=0.5
-		)
-		self.stats_labels['active_upgrades'] = Label(
-			text="⚡ Activas: 0",
-			font_size='12sp',
-			size_hint_x=0.5
+		# Una sola etiqueta enlazada a stats_text (una escritura por actualización)
+		stats_label = Label(
+			text=self.stats_text,
+			font_size='12sp'
 		)
-		
-		for label in self.stats_labels.values():
-			stats_layout.add_widget(label)
+		self.bind(stats_text=stats_label.setter('text'))
+		stats_layout.add_widget(stats_label)
 		
 		# Crear panel con sub-pestañas específicas para idle clicker
 		tab_panel = TabbedPanel(do_default_tab=False, tab_width=80, tab_height=40)
@@ -135,6 +226,11 @@ class UpgradesScreen(SiKIdleScreen):
 		self._create_mixed_tab(tab_panel)
 		self._create_powerups_tab(tab_panel)
 		
+		# El contenido de cada pestaña se construye al activarla por primera vez
+		tab_panel.bind(current_tab=self._ensure_tab_built)
+		if tab_panel.current_tab is not None:
+			self._ensure_tab_built(tab_panel, tab_panel.current_tab)
+		
 		# Ensamblar layout principal
 		main_layout.add_widget(header_layout)
 		main_layout.add_widget(stats_layout)
@@ -145,296 +241,207 @@ class UpgradesScreen(SiKIdleScreen):
 	def _create_idle_tab(self, tab_panel):
 		"""Crea la pestaña de mejoras para idle clicker."""
 		idle_tab = TabbedPanelItem(text="🏠 Idle")
-		idle_content = self._create_upgrade_content([
-			# Mejoras específicas para idle clicker
-			('click_power', '👆 Poder de Clic', 'Aumenta monedas por clic', 10),
-			('building_efficiency', '🏗️ Eficiencia', 'Mejora producción de edificios', 50),
-			('offline_earnings', '💤 Ingresos Offline', 'Gana mientras no juegas', 100),
-			('auto_clicker', '🤖 Auto-Clic', 'Clics automáticos por segundo', 500)
-		])
-		idle_tab.add_widget(idle_content)
-		tab_panel.add_widget(idle_tab)
+		self._add_lazy_tab(tab_panel, idle_tab, partial(self._create_upgrade_content, _IDLE_UPGRADES))
 	
 	def _create_combat_tab(self, tab_panel):
 		"""Crea la pestaña de mejoras para combate."""
 		combat_tab = TabbedPanelItem(text="⚔️ Combat")
-		combat_content = self._create_upgrade_content([
-			# Mejoras específicas para combate
-			('damage_boost', '⚔️ Daño', 'Aumenta daño en combate', 25),
-			('critical_chance', '🍀 Crítico', 'Probabilidad de golpe crítico', 75),
-			('health_regen', '❤️ Regeneración', 'Recupera HP automáticamente', 40),
-			('combat_speed', '⚡ Velocidad', 'Ataques más rápidos', 60)
-		])
-		combat_tab.add_widget(combat_content)
-		tab_panel.add_widget(combat_tab)
+		self._add_lazy_tab(tab_panel, combat_tab, partial(self._create_upgrade_content, _COMBAT_UPGRADES))
 	
 	def _create_mixed_tab(self, tab_panel):
 		"""Crea la pestaña de mejoras mixtas."""
 		mixed_tab = TabbedPanelItem(text="🌟 Mixtos")
-		mixed_content = self._create_upgrade_content([
-			# Mejoras que afectan ambos sistemas
-			('global_multiplier', '🌟 Multiplicador Global', 'Bonifica todo el progreso', 200),
-			('prestige_bonus', '💎 Bonus Prestigio', 'Mejora cristales de prestigio', 150),
-			('luck_factor', '🍀 Factor Suerte', 'Mejora todas las probabilidades', 100),
-			('experience_boost', '📚 Boost XP', 'Más experiencia en todo', 80)
-		])
-		mixed_tab.add_widget(mixed_content)
-		tab_panel.add_widget(mixed_tab)
+		self._add_lazy_tab(tab_panel, mixed_tab, partial(self._create_upgrade_content, _MIXED_UPGRADES))
 	
 	def _create_powerups_tab(self, tab_panel):
 		"""Crea la pestaña de power-ups temporales."""
 		powerups_tab = TabbedPanelItem(text="⏰ PowerUps")
-		powerups_content = self._create_powerup_content([
-			# Power-ups temporales
-			('double_coins', '💰x2', '2x monedas por 1 hora', 50, 3600),
-			('triple_click', '👆x3', '3x poder de clic por 30min', 30, 1800),
-			('speed_boost', '⚡x5', '5x velocidad por 15min', 75, 900),
-			('mega_luck', '🍀x10', '10x suerte por 10min', 100, 600)
-		])
-		powerups_tab.add_widget(powerups_content)
-		tab_panel.add_widget(powerups_tab)
+		self._add_lazy_tab(tab_panel, powerups_tab, partial(self._create_powerup_content, _POWERUPS))
 	
-	def _create_upgrade_content(self, upgrades_data):
-		"""Crea contenido para mejoras permanentes."""
-		scroll = ScrollView()
-		upgrades_layout = GridLayout(
-			cols=1,
-			spacing=5,
+	def _add_lazy_tab(self, tab_panel, tab, build_content):
+		"""Añade una pestaña cuyo contenido se construye al activarla.
+		
+		Args:
+			tab_panel: Panel de pestañas
+			tab: Pestaña a añadir
+			build_content: Función sin argumentos que crea el contenido
+		"""
+		# El contenedor vacío es el contenido fijo de la pestaña; el contenido
+		# real se añade dentro, así no importa el orden en que TabbedPanel
+		# cambia current_tab y monta el contenido
+		container = BoxLayout()
+		tab.add_widget(container)
+		tab_panel.add_widget(tab)
+		self._pending_tabs[tab] = (container, build_content)
+	
+	def _ensure_tab_built(self, tab_panel, tab):
+		"""Construye el contenido de una pestaña la primera vez que se activa."""
+		pending = self._pending_tabs.pop(tab, None)
+		if pending is None:
+			return
+		container, build_content = pending
+		container.add_widget(build_content())
+	
+	def _create_purchase_view(self, data: list[dict]) -> RecycleView:
+		"""Crea una lista reciclada de filas de compra.
+		
+		Solo se instancian las filas visibles; el resto se recicla al hacer scroll.
+		
+		Args:
+			data: Diccionarios con las propiedades de cada PurchaseRow
+			
+		Returns:
+			RecycleView con las filas
+		"""
+		rows_layout = RecycleBoxLayout(
+			orientation='vertical',
+			default_size=(None, 60),
+			default_size_hint=(1, None),
 			size_hint_y=None,
+			spacing=5,
 			padding=[5, 5, 5, 5]
 		)
-		upgrades_layout.bind(minimum_height=upgrades_layout.setter('height'))
-		
-		for upgrade_id, name, desc, cost in upgrades_data:
-			upgrade_widget = self._create_upgrade_widget(upgrade_id, name, desc, cost)
-			upgrades_layout.add_widget(upgrade_widget)
-		
-		scroll.add_widget(upgrades_layout)
-		return scroll
+		rows_layout.bind(minimum_height=rows_layout.setter('height'))
+		view = RecycleView(do_scroll_x=False)
+		view.add_widget(rows_layout)
+		view.viewclass = PurchaseRow
+		view.data = data
+		self._purchase_views.append(view)
+		self._last_coins = None  # La nueva lista se revisa entera en el próximo refresco
+		self._last_ui_state = None
+		return view
+	
+	def _create_upgrade_content(self, upgrades_data):
+		"""Crea contenido para mejoras permanentes."""
+		coins = self.game_state.coins
+		return self._create_purchase_view([
+			{
+				'item_id': upgrade_id,
+				'title': name,
+				'desc': desc,
+				'button_text': f"💰 {cost}",
+				'cost': cost,
+				'affordable': coins >= cost,
+				'affordable_color': [0.2, 0.8, 0.2, 1],
+				'buy_callback': self._on_buy_upgrade,
+			}
+			for upgrade_id, name, desc, cost in upgrades_data
+		])
 	
 	def _create_powerup_content(self, powerups_data):
 		"""Crea contenido para power-ups temporales."""
-		scroll = ScrollView()
-		powerups_layout = GridLayout(
-			cols=1,
-			spacing=5,
-			size_hint_y=None,
-			padding=[5, 5, 5, 5]
-		)
-		powerups_layout.bind(minimum_height=powerups_layout.setter('height'))
-		
-		for powerup_id, name, desc, cost, duration in powerups_data:
-			powerup_widget = self._create_powerup_widget(powerup_id, name, desc, cost, duration)
-			powerups_layout.add_widget(powerup_widget)
-		
-		scroll.add_widget(powerups_layout)
-		return scroll
+		coins = self.game_state.coins
+		return self._create_purchase_view([
+			{
+				'item_id': powerup_id,
+				'title': f"{name} ({duration//60}min)",
+				'desc': desc,
+				'button_text': f"⚡ {cost}",
+				'cost': cost,
+				'duration': duration,
+				'affordable': coins >= cost,
+				'affordable_color': [0.8, 0.6, 0.2, 1],
+				'buy_callback': self._on_activate_powerup,
+			}
+			for powerup_id, name, desc, cost, duration in powerups_data
+		])
 	
-	def _create_upgrade_widget(self, upgrade_id, name, desc, cost):
-		"""Crea widget para mejora permanente."""
-		widget = BoxLayout(
-			orientation='horizontal',
-			size_hint_y=None,
-			height=60,
-			spacing=8,
-			padding=[4, 4, 4, 4]
-		)
-		
-		# Información de la mejora
-		info_layout = BoxLayout(orientation='vertical', size_hint_x=0.7)
-		
-		name_label = Label(
-			text=name,
-			font_size='14sp',
-			bold=True,
-			size_hint_y=0.6,
-			halign='left',
-			valign='center'
-		)
-		name_label.bind(texture_size=name_label.setter('text_size'))
-		
-		desc_label = Label(
-			text=desc,
-			font_size='11sp',
-			color=[0.7, 0.7, 0.7, 1],
-			size_hint_y=0.4,
-			halign='left',
-			valign='center'
-		)
-		desc_label.bind(texture_size=desc_label.setter('text_size'))
-		
-		info_layout.add_widget(name_label)
-		info_layout.add_widget(desc_label)
-		
-		# Botón de compra
-		can_afford = self.game_state.coins >= cost
-		buy_button = Button(
-			text=f"💰 {cost}",
-			font_size='12sp',
-			size_hint_x=0.3,
-			background_color=[0.2, 0.8, 0.2, 1] if can_afford else [0.8, 0.2, 0.2, 1]
-		)
-		buy_button.disabled = not can_afford
-		buy_button.bind(on_press=lambda x: self.on_upgrade_purchase(upgrade_id, cost))
-		
-		widget.add_widget(info_layout)
-		widget.add_widget(buy_button)
-		return widget
+	def _on_buy_upgrade(self, row: PurchaseRow):
+		"""Handler común de las filas de compra de mejoras permanentes."""
+		self.on_upgrade_purchase(row.item_id, row.cost)
 	
-	def _create_powerup_widget(self, powerup_id, name, desc, cost, duration):
-		"""Crea widget para power-up temporal."""
-		widget = BoxLayout(
-			orientation='horizontal',
-			size_hint_y=None,
-			height=60,
-			spacing=8,
-			padding=[4, 4, 4, 4]
-		)
-		
-		# Información del power-up
-		info_layout = BoxLayout(orientation='vertical', size_hint_x=0.7)
-		
-		name_label = Label(
-			text=f"{name} ({duration//60}min)",
-			font_size='14sp',
-			bold=True,
-			size_hint_y=0.6,
-			halign='left',
-			valign='center'
-		)
-		name_label.bind(texture_size=name_label.setter('text_size'))
-		
-		desc_label = Label(
-			text=desc,
-			font_size='11sp',
-			color=[0.7, 0.7, 0.7, 1],
-			size_hint_y=0.4,
-			halign='left',
-			valign='center'
-		)
-		desc_label.bind(texture_size=desc_label.setter('text_size'))
-		
-		info_layout.add_widget(name_label)
-		info_layout.add_widget(desc_label)
-		
-		# Botón de activación
-		can_afford = self.game_state.coins >= cost
-		activate_button = Button(
-			text=f"⚡ {cost}",
-			font_size='12sp',
-			size_hint_x=0.3,
-			background_color=[0.8, 0.6, 0.2, 1] if can_afford else [0.8, 0.2, 0.2, 1]
-		)
-		activate_button.disabled = not can_afford
-		activate_button.bind(on_press=lambda x: self.on_powerup_activate(powerup_id, cost, duration))
-		
-		widget.add_widget(info_layout)
-		widget.add_widget(activate_button)
-		return widget
+	def _on_activate_powerup(self, row: PurchaseRow):
+		"""Handler común de las filas de activación de power-ups."""
+		self.on_powerup_activate(row.item_id, row.cost, row.duration)
 	
 	def on_upgrade_purchase(self, upgrade_id, cost):
 		"""Maneja la compra de una mejora permanente."""
 		if self.game_state.coins >= cost:
 			self.game_state.coins -= cost
-			logging.info(f"Mejora {upgrade_id} comprada por {cost} monedas")
-			self.update_ui()
+			logger.info("Mejora %s comprada por %s monedas", upgrade_id, cost)
+			self._ui_trigger()  # Refresco en el próximo frame, fuera del handler
 	
 	def on_powerup_activate(self, powerup_id, cost, duration):
 		"""Maneja la activación de un power-up temporal."""
 		if self.game_state.coins >= cost:
 			self.game_state.coins -= cost
-			logging.info(f"Power-up {powerup_id} activado por {duration} segundos")
+			logger.info("Power-up %s activado por %s segundos", powerup_id, duration)
 			# TODO: Implementar sistema de power-ups temporales
-			self.update_ui()
-	
-	def _get_category_display_name(self, category: UpgradeCategory) -> str:
-		"""Obtiene el nombre para mostrar de una categoría."""
-		names = {
-			UpgradeCategory.ECONOMIC: "💰 Económicas",
-			UpgradeCategory.EFFICIENCY: "⚡ Eficiencia", 
-			UpgradeCategory.CRITICAL: "🍀 Críticos",
-			UpgradeCategory.MULTIPLIER: "🌟 Multiplicadores"
-		}
-		return names.get(category, category.value.title())
-	
-	def _create_category_content(self, category: UpgradeCategory):
-		"""Crea el contenido para una categoría de mejoras."""
-		# Crear scroll view para las mejoras
-		scroll = ScrollView()
-		upgrades_layout = GridLayout(
-			cols=2,
-			spacing=10,
-			size_hint_y=None,
-			padding=[5, 5, 5, 5]
-		)
-		upgrades_layout.bind(minimum_height=upgrades_layout.setter('height'))
-		
-		# Obtener mejoras de esta categoría
-		category_upgrades = self.game_state.upgrade_manager.get_upgrades_by_category(category)
-		
-		# Crear botones para cada mejora en esta categoría
-		for upgrade_type in category_upgrades:
-			upgrade_info = self.game_state.upgrade_manager.get_upgrade_info(upgrade_type)
-			
-			upgrade_button = UpgradeButton(
-				upgrade_type=upgrade_type,
-				upgrade_info=upgrade_info,
-				game_state=self.game_state,
-				size_hint_y=None,
-				height=120,
-				halign='center',
-				valign='middle'
-			)
-			upgrade_button.bind(on_press=self.on_upgrade_button)
-			
-			self.upgrade_buttons[upgrade_type] = upgrade_button
-			upgrades_layout.add_widget(upgrade_button)
-		
-		scroll.add_widget(upgrades_layout)
-		return scroll
-		
-	def on_upgrade_button(self, instance: UpgradeButton):
-		"""Maneja el clic en un botón de mejora para comprarla."""
-		try:
-			success = self.game_state.upgrade_manager.purchase_upgrade(instance.upgrade_type, self.game_state)
-			if success:
-				logging.info(f"Mejora {instance.upgrade_type} comprada exitosamente")
-				self.update_ui()
-			else:
-				logging.warning(f"No se pudo comprar mejora {instance.upgrade_type}")
-		except Exception as e:
-			logging.error(f"Error comprando mejora: {e}")
+			self._ui_trigger()  # Refresco en el próximo frame, fuera del handler
 	
-
+	def _refresh_purchase_views(self):
+		"""Actualiza la asequibilidad de las filas cuyo coste cruzó el saldo.
+		
+		Solo pueden cambiar las filas con coste entre el saldo anterior y el
+		actual; el resto no se toca y las listas sin cambios no se refrescan.
+		"""
+		coins = self.game_state.coins
+		last_coins = self._last_coins
+		if coins == last_coins:
+			return
+		self._last_coins = coins
+		
+		if last_coins is None:
+			low, high = float('-inf'), float('inf')
+		else:
+			low, high = min(last_coins, coins), max(last_coins, coins)
+		
+		for view in self._purchase_views:
+			changed = False
+			for item in view.data:
+				cost = item['cost']
+				if low < cost <= high:
+					can_afford = coins >= cost
+					if can_afford != item['affordable']:
+						item['affordable'] = can_afford
+						changed = True
+			if changed:
+				view.refresh_from_data()
 	
 	def update_ui(self, dt: float = 0):
-		"""Actualiza la interfaz con los datos actuales."""
+		"""Actualiza la interfaz con los datos actuales.
+		
+		No hace nada si la pantalla no es la actual (p. ej. un trigger o
+		intervalo que se dispara durante una transición de salida).
+		"""
+		if not self._visible:
+			return
+		if self.manager and self.manager.current != self.name:
+			return
+		
+		# Sin cambios de monedas desde la última vez: nada que hacer
+		state = self.game_state.coins
+		if state == self._last_ui_state:
+			return
+		self._last_ui_state = state
+		
 		try:
 			# Actualizar estadísticas simplificadas
-			self.stats_labels['total_spent'].text = f"💰 Gastado: {0:,.0f}"  # TODO: Implementar tracking
-			self.stats_labels['active_upgrades'].text = f"⚡ Activas: {0}"  # TODO: Contar mejoras activas
+			# TODO: Implementar tracking de gastado y contar mejoras activas
+			self.stats_text = _format_stats(0, 0)
+			
+			self._refresh_purchase_views()
 			
 		except Exception as e:
-			logging.error(f"Error actualizando UI de mejoras: {e}")
+			logger.error("Error actualizando UI de mejoras: %s", e)
 	
 	def on_enter(self, *args):
 		"""Se ejecuta cuando se entra a la pantalla."""
 		super().on_enter(*args)
-		logging.info("Entrando a pantalla de mejoras rediseñada")
+		logger.info("Entrando a pantalla de mejoras rediseñada")
+		self._ensure_ui()
 		
-		# Actualizar UI inmediatamente
+		# Actualizar UI inmediatamente reutilizando los widgets ya creados
 		self.update_ui()
 		
-		# Programar actualizaciones periódicas
-		if not self.update_event:
-			self.update_event = Clock.schedule_interval(self.update_ui, 2.0)
+		# Refrescar cuando cambien monedas o mejoras
+		self.game_state.add_change_listener(self._ui_trigger)
 	
 	def on_leave(self, *args):
 		"""Se ejecuta cuando se sale de la pantalla."""
 		super().on_leave(*args)
-		logging.info("Saliendo de pantalla de mejoras")
+		logger.info("Saliendo de pantalla de mejoras")
 		
-		# Cancelar actualizaciones periódicas
-		if self.update_event:
-			Clock.unschedule(self.update_event)
-			self.update_event = None
+		# Dejar de escuchar cambios y cancelar un refresco pendiente
+		self.game_state.remove_change_listener(self._ui_trigger)
+		self._ui_trigger.cancel()
@@ -6,20 +6,39 @@ Inspirado en los mejores idle clickers del mercado.
 
 import logging
 import random
+from math import cos, sin, tau
 from typing import Dict, List, Optional, Tuple
 
 from kivy.uix.widget import Widget
 from kivy.uix.image import Image
 from kivy.uix.label import Label
-from kivy.graphics import Color, Ellipse, Line, Rectangle
+from kivy.graphics import Color, Ellipse, InstructionGroup, Line, Rectangle
 from kivy.animation import Animation
 from kivy.clock import Clock
-from kivy.vector import Vector
+from kivy.core.image import Image as CoreImage
+from kivy.graphics.texture import Texture
 
 from core.visual_assets import VisualAssetManager, EffectType
 
 logger = logging.getLogger(__name__)
 
+# Partículas de LevelUpEffect y duración de su explosión (segundos)
+_PARTICLE_COUNT = 20
+_PARTICLE_DURATION = 2.0
+
+# Máximo de DamageNumberEffect guardados para reutilizar
+_DAMAGE_POOL_SIZE = 64
+
+# Textos de los daños pequeños (los más frecuentes), creados una sola vez
+_DAMAGE_STR = tuple(str(i) for i in range(1024))
+
+
+def _damage_text(damage: int) -> str:
+	"""Devuelve el texto de un daño, usando la tabla para enteros pequeños."""
+	if type(damage) is int and 0 <= damage < 1024:
+		return _DAMAGE_STR[damage]
+	return str(damage)
+
 
 class VisualEffect(Widget):
 	"""Clase base para efectos visuales."""
@@ -28,14 +47,33 @@ class VisualEffect(Widget):
 		super().__init__(**kwargs)
 		self.duration = duration
 		self.visual_manager = VisualAssetManager()
+		# Callbacks y animaciones en curso, para poder cancelarlos en stop()
+		self._scheduled: List = []
+		self._anims: List[Tuple[Animation, object]] = []
 
 	def play(self, callback=None):
 		"""Reproduce el efecto visual."""
 		raise NotImplementedError
 
+	def _schedule_once(self, callback, timeout: float):
+		"""Programa un callback que stop() cancelará si sigue pendiente."""
+		event = Clock.schedule_once(callback, timeout)
+		self._scheduled.append(event)
+		return event
+
+	def _start_animation(self, anim: Animation, target):
+		"""Inicia una animación que stop() cancelará si sigue activa."""
+		anim.start(target)
+		self._anims.append((anim, target))
+
 	def stop(self):
-		"""Detiene el efecto visual."""
-		pass
+		"""Detiene el efecto visual: cancela callbacks pendientes y animaciones."""
+		for event in self._scheduled:
+			event.cancel()
+		for anim, target in self._anims:
+			anim.cancel(target)
+		self._scheduled.clear()
+		self._anims.clear()
 
 
 class DamageNumberEffect(VisualEffect):
@@ -43,24 +81,42 @@ class DamageNumberEffect(VisualEffect):
 
 	def __init__(self, damage: int, is_critical: bool = False, **kwargs):
 		super().__init__(duration=1.5, **kwargs)
-		self.damage = damage
-		self.is_critical = is_critical
 
 		# Configurar el label de daño
 		self.damage_label = Label(
-			text=str(damage),
-			font_size="20sp" if not is_critical else "28sp",
 			bold=True,
-			color=(1, 1, 1, 1) if not is_critical else (1, 1, 0, 1),
 			size_hint=(None, None),
 			size=(100, 50),
 		)
+		self.add_widget(self.damage_label)
 
-		if is_critical:
-			self.damage_label.text = f"CRÍTICO!\n{damage}"
-			self.damage_label.color = (1, 0.8, 0, 1)  # Dorado
+		self.reset(damage, is_critical)
 
-		self.add_widget(self.damage_label)
+	def reset(self, damage: int, is_critical: bool = False):
+		"""Prepara el efecto para mostrar un nuevo daño (permite reutilizarlo desde un pool).
+
+		Args:
+			damage: Daño a mostrar
+			is_critical: True si es un golpe crítico
+		"""
+		self.damage = damage
+		self.is_critical = is_critical
+
+		# Detener animaciones de un uso anterior y restaurar el estado inicial
+		Animation.cancel_all(self)
+		Animation.cancel_all(self.damage_label)
+		self.opacity = 1
+		self.damage_label.size = (100, 50)
+
+		label = self.damage_label
+		if is_critical:
+			label.text = "CRÍTICO!\n" + _damage_text(damage)
+			label.font_size = "28sp"
+			label.color = (1, 0.8, 0, 1)  # Dorado
+		else:
+			label.text = _damage_text(damage)
+			label.font_size = "20sp"
+			label.color = (1, 1, 1, 1)
 
 	def play(self, start_pos: Tuple[float, float], callback=None):
 		"""Reproduce el efecto de número de daño."""
@@ -78,16 +134,17 @@ class DamageNumberEffect(VisualEffect):
 			scale_anim = Animation(size=(120, 60), duration=0.2, transition="out_back") + Animation(
 				size=(100, 50), duration=0.3, transition="in_back"
 			)
-			scale_anim.start(self.damage_label)
+			self._start_animation(scale_anim, self.damage_label)
 
-		move_anim.start(self)
-		fade_anim.start(self)
+		self._start_animation(move_anim, self)
+		self._start_animation(fade_anim, self)
 
 		# Remover el efecto después de la animación
-		Clock.schedule_once(lambda dt: self._cleanup(callback), self.duration)
+		self._schedule_once(lambda dt: self._cleanup(callback), self.duration)
 
 	def _cleanup(self, callback):
 		"""Limpia el efecto y ejecuta callback."""
+		self.stop()
 		if self.parent:
 			self.parent.remove_widget(self)
 		if callback:
@@ -97,7 +154,7 @@ class DamageNumberEffect(VisualEffect):
 class EnemyEffectRing(VisualEffect):
 	"""Efecto de anillo alrededor de enemigos."""
 
-	def __init__(self, effect_type: EffectType, **kwargs):
+	def __init__(self, effect_type: EffectType, texture: Optional[Texture] = None, **kwargs):
 		super().__init__(duration=2.0, **kwargs)
 		self.effect_type = effect_type
 
@@ -112,12 +169,16 @@ class EnemyEffectRing(VisualEffect):
 			rotation=0,
 		)
 
-		# Crear imagen del efecto
-		self.effect_image = Image(
-			source=self.visual_manager.get_effect_path(effect_type),
-			size_hint=(1, 1),
-			allow_stretch=True,
-		)
+		# Crear imagen del efecto (con la textura compartida si se proporciona,
+		# para no decodificar el PNG en cada anillo)
+		if texture is not None:
+			self.effect_image = Image(texture=texture, size_hint=(1, 1), allow_stretch=True)
+		else:
+			self.effect_image = Image(
+				source=self.visual_manager.get_effect_path(effect_type),
+				size_hint=(1, 1),
+				allow_stretch=True,
+			)
 
 		self.effect_scatter.add_widget(self.effect_image)
 		self.add_widget(self.effect_scatter)
@@ -139,14 +200,15 @@ class EnemyEffectRing(VisualEffect):
 		)
 		pulse_anim.repeat = True
 
-		rotation_anim.start(self.effect_scatter)
-		pulse_anim.start(self.effect_scatter)
+		self._start_animation(rotation_anim, self.effect_scatter)
+		self._start_animation(pulse_anim, self.effect_scatter)
 
 		# Programar limpieza
-		Clock.schedule_once(lambda dt: self._cleanup(callback), self.duration)
+		self._schedule_once(lambda dt: self._cleanup(callback), self.duration)
 
 	def _cleanup(self, callback):
 		"""Limpia el efecto."""
+		self.stop()
 		if self.parent:
 			self.parent.remove_widget(self)
 		if callback:
@@ -184,15 +246,29 @@ class LevelUpEffect(VisualEffect):
 		self.level_label.text_size = self.level_label.size
 		self.add_widget(self.level_label)
 
-		# Partículas de celebración
-		self.particles = []
-		for i in range(20):
-			particle = Widget(size=(10, 10))
-			with particle.canvas:
-				Color(random.random(), random.random(), 1, 1)
-				Ellipse(pos=particle.pos, size=particle.size)
-			self.particles.append(particle)
-			self.add_widget(particle)
+		# Partículas de celebración: instrucciones en un solo grupo del canvas
+		# (sin un widget por partícula); _step_particles mueve las elipses y
+		# ajusta la transparencia de sus colores
+		self._particle_colors: List[Color] = []
+		self._particle_shapes: List[Ellipse] = []
+		particle_group = InstructionGroup()
+		for i in range(_PARTICLE_COUNT):
+			color = Color(random.random(), random.random(), 1, 1)
+			shape = Ellipse(pos=(0, 0), size=(10, 10))
+			particle_group.add(color)
+			particle_group.add(shape)
+			self._particle_colors.append(color)
+			self._particle_shapes.append(shape)
+		self.canvas.after.add(particle_group)  # Encima del texto, como antes
+
+		# Estado de las partículas en listas paralelas (origen y desplazamiento
+		# total por eje), avanzado por un único callback de Clock
+		self._start_x: List[float] = []
+		self._start_y: List[float] = []
+		self._delta_x: List[float] = []
+		self._delta_y: List[float] = []
+		self._particle_elapsed = 0.0
+		self._particle_event = None
 
 	def play(self, center_pos: Tuple[float, float], callback=None):
 		"""Reproduce el efecto de subida de nivel."""
@@ -208,30 +284,64 @@ class LevelUpEffect(VisualEffect):
 			+ Animation(font_size="36sp", duration=0.5, transition="in_back")
 			+ Animation(opacity=0, duration=1.0, transition="out_quad")
 		)
-		text_anim.start(self.level_label)
-
-		# Animación de partículas
-		for i, particle in enumerate(self.particles):
-			# Posición inicial en el centro
-			particle.pos = center_pos
-
-			# Dirección aleatoria
-			angle = random.uniform(0, 360)
-			distance = random.uniform(100, 200)
-			end_pos = (
-				center_pos[0] + distance * Vector(1, 0).rotate(angle).x,
-				center_pos[1] + distance * Vector(1, 0).rotate(angle).y,
-			)
-
-			# Animación de explosión
-			particle_anim = Animation(pos=end_pos, opacity=0, duration=2.0, transition="out_quad")
-			particle_anim.start(particle)
+		self._start_animation(text_anim, self.level_label)
+
+		# Explosión de partículas: todas parten del centro en direcciones aleatorias
+		self._start_x = [center_pos[0]] * _PARTICLE_COUNT
+		self._start_y = [center_pos[1]] * _PARTICLE_COUNT
+		uniform = random.uniform
+		angles = [uniform(0, tau) for _ in range(_PARTICLE_COUNT)]
+		distances = [uniform(100, 200) for _ in range(_PARTICLE_COUNT)]
+		self._delta_x = [d * cos(a) for d, a in zip(distances, angles, strict=True)]
+		self._delta_y = [d * sin(a) for d, a in zip(distances, angles, strict=True)]
+
+		# Un solo callback por frame para todas las partículas (en lugar de una
+		# Animation por partícula)
+		self._particle_elapsed = 0.0
+		self._step_particles(0)
+		self._particle_event = Clock.schedule_interval(self._step_particles, 0)
 
 		# Programar limpieza
-		Clock.schedule_once(lambda dt: self._cleanup(callback), self.duration)
+		self._schedule_once(lambda dt: self._cleanup(callback), self.duration)
+
+	def _step_particles(self, dt: float):
+		"""Avanza todas las partículas un frame (equivale a out_quad sobre pos y opacidad)."""
+		self._particle_elapsed += dt
+		t = min(self._particle_elapsed / _PARTICLE_DURATION, 1.0)
+		progress = -t * (t - 2.0)  # Transición out_quad
+		opacity = 1.0 - progress
+
+		for color, shape, x, y, dx, dy in zip(
+			self._particle_colors,
+			self._particle_shapes,
+			self._start_x,
+			self._start_y,
+			self._delta_x,
+			self._delta_y,
+			strict=True,
+		):
+			shape.pos = (x + dx * progress, y + dy * progress)
+			color.a = opacity
+
+		if t >= 1.0:
+			self._stop_particles()
+			return False
+		return True
+
+	def _stop_particles(self):
+		"""Cancela el callback de partículas si sigue activo."""
+		if self._particle_event is not None:
+			self._particle_event.cancel()
+			self._particle_event = None
+
+	def stop(self):
+		"""Detiene el efecto, incluido el callback de partículas."""
+		super().stop()
+		self._stop_particles()
 
 	def _cleanup(self, callback):
 		"""Limpia el efecto."""
+		self.stop()
 		if self.parent:
 			self.parent.remove_widget(self)
 		if callback:
@@ -284,7 +394,7 @@ class WorldTransitionEffect(VisualEffect):
 
 		full_anim = fade_in + hold + fade_out
 		full_anim.bind(on_complete=lambda *args: self._cleanup(callback))
-		full_anim.start(self.overlay)
+		self._start_animation(full_anim, self.overlay)
 
 		# Animación del texto
 		text_anim = (
@@ -293,10 +403,11 @@ class WorldTransitionEffect(VisualEffect):
 			+ Animation(opacity=1, duration=1.0)
 			+ Animation(opacity=0, duration=0.5)
 		)
-		text_anim.start(self.transition_label)
+		self._start_animation(text_anim, self.transition_label)
 
 	def _cleanup(self, callback):
 		"""Limpia el efecto."""
+		self.stop()
 		if self.parent:
 			self.parent.remove_widget(self)
 		if callback:
@@ -311,12 +422,20 @@ class VisualEffectsManager:
 		self.parent_widget = parent_widget
 		self.active_effects: List[VisualEffect] = []
 		self.visual_manager = VisualAssetManager()
+		# Números de daño terminados, listos para reutilizar (evita crear widgets por clic)
+		self._damage_pool: List[DamageNumberEffect] = []
+		# Texturas de efectos ya cargadas (None si el archivo no se pudo cargar)
+		self._texture_cache: Dict[EffectType, Optional[Texture]] = {}
 
 		logger.info("VisualEffectsManager inicializado")
 
 	def show_damage_number(self, damage: int, pos: Tuple[float, float], is_critical: bool = False):
 		"""Muestra un número de daño flotante."""
-		effect = DamageNumberEffect(damage, is_critical)
+		if self._damage_pool:
+			effect = self._damage_pool.pop()
+			effect.reset(damage, is_critical)
+		else:
+			effect = DamageNumberEffect(damage, is_critical)
 		self.parent_widget.add_widget(effect)
 		self.active_effects.append(effect)
 
@@ -324,12 +443,23 @@ class VisualEffectsManager:
 
 	def show_enemy_effect(self, effect_type: EffectType, enemy_pos: Tuple[float, float]):
 		"""Muestra un efecto alrededor de un enemigo."""
-		effect = EnemyEffectRing(effect_type)
+		effect = EnemyEffectRing(effect_type, texture=self._get_effect_texture(effect_type))
 		self.parent_widget.add_widget(effect)
 		self.active_effects.append(effect)
 
 		effect.play(enemy_pos, lambda: self._remove_effect(effect))
 
+	def _get_effect_texture(self, effect_type: EffectType) -> Optional[Texture]:
+		"""Obtiene la textura de un efecto, cargándola solo la primera vez."""
+		if effect_type not in self._texture_cache:
+			try:
+				texture = CoreImage(self.visual_manager.get_effect_path(effect_type)).texture
+			except Exception as e:
+				logger.warning(f"No se pudo cargar la textura del efecto {effect_type.value}: {e}")
+				texture = None
+			self._texture_cache[effect_type] = texture
+		return self._texture_cache[effect_type]
+
 	def show_level_up(self, new_level: int, center_pos: Tuple[float, float]):
 		"""Muestra el efecto de subida de nivel."""
 		effect = LevelUpEffect(new_level)
@@ -354,6 +484,10 @@ class VisualEffectsManager:
 		if effect in self.active_effects:
 			self.active_effects.remove(effect)
 
+		# Devolver los números de daño al pool (ya fuera del árbol de widgets)
+		if isinstance(effect, DamageNumberEffect) and len(self._damage_pool) < _DAMAGE_POOL_SIZE:
+			self._damage_pool.append(effect)
+
 	def clear_all_effects(self):
 		"""Limpia todos los efectos activos."""
 		for effect in self.active_effects[:]:
@@ -9,12 +9,13 @@ from typing import Dict, List, Optional
 
 from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.gridlayout import GridLayout
 from kivy.uix.button import Button
 from kivy.uix.label import Label
 from kivy.uix.image import Image
 from kivy.uix.progressbar import ProgressBar
-from kivy.uix.scrollview import ScrollView
+from kivy.uix.recyclegridlayout import RecycleGridLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
 from kivy.graphics import Color, Rectangle, RoundedRectangle
 from kivy.animation import Animation
 from kivy.clock import Clock
@@ -26,14 +27,16 @@ from core.worlds import WorldType
 logger = logging.getLogger(__name__)
 
 
-class PremiumWorldCard(BoxLayout):
-	"""Tarjeta visual premium para mostrar información de un mundo."""
+class PremiumWorldCard(RecycleDataViewBehavior, BoxLayout):
+	"""Tarjeta visual premium para mostrar información de un mundo.
 
-	def __init__(self, world_info: Dict, **kwargs):
+	Es la viewclass del RecycleView de mundos: los widgets se crean una vez y
+	refresh_view_attrs los rellena con el mundo que toque al hacer scroll.
+	"""
+
+	def __init__(self, world_info: Optional[Dict] = None, **kwargs):
 		super().__init__(**kwargs)
 		self.orientation = "vertical"
-		self.size_hint = (None, None)
-		self.size = (320, 450)
 		self.spacing = 12
 		self.padding = 20
 
@@ -42,6 +45,10 @@ class PremiumWorldCard(BoxLayout):
 		self.is_unlocked = False
 		self.is_completed = False
 
+		# Referencias cacheadas para no repetir la búsqueda en cada refresco
+		self.game_state = get_game_state()
+		self.world_manager = getattr(self.game_state, "world_manager", None)
+
 		# Configurar fondo de la tarjeta con gradiente
 		with self.canvas.before:
 			# Fondo principal
@@ -59,7 +66,6 @@ class PremiumWorldCard(BoxLayout):
 		self.bind(pos=self._update_bg, size=self._update_bg)
 
 		self._build_card()
-		self._setup_animations()
 
 	def _update_bg(self, *args):
 		"""Actualiza el fondo de la tarjeta."""
@@ -68,22 +74,10 @@ class PremiumWorldCard(BoxLayout):
 		self.border_rect.pos = (self.pos[0] - 3, self.pos[1] - 3)
 		self.border_rect.size = (self.size[0] + 6, self.size[1] + 6)
 
-	def _setup_animations(self):
-		"""Configura animaciones de la tarjeta."""
-		# Animación de hover sutil
-		self.hover_anim = Animation(
-			opacity=0.95, duration=3.0, transition="in_out_sine"
-		) + Animation(opacity=1.0, duration=3.0, transition="in_out_sine")
-		self.hover_anim.repeat = True
-		self.hover_anim.start(self)
-
 	def _build_card(self):
 		"""Construye el contenido visual de la tarjeta."""
 		# Imagen de preview del mundo
 		self.world_image = Image(
-			source=self.visual_manager.get_background_path(
-				BackgroundType(self.world_info["background"])
-			),
 			size_hint=(1, 0.5),
 			allow_stretch=True,
 			keep_ratio=False,
@@ -94,8 +88,7 @@ class PremiumWorldCard(BoxLayout):
 		info_layout = BoxLayout(orientation="vertical", size_hint=(1, 0.3), spacing=5)
 
 		# Nombre del mundo
-		name_label = Label(
-			text=self.world_info["name"],
+		self.name_label = name_label = Label(
 			font_size="18sp",
 			bold=True,
 			color=(1, 1, 1, 1),
@@ -106,8 +99,7 @@ class PremiumWorldCard(BoxLayout):
 		info_layout.add_widget(name_label)
 
 		# Descripción
-		desc_label = Label(
-			text=self.world_info["description"],
+		self.desc_label = desc_label = Label(
 			font_size="12sp",
 			color=(0.8, 0.8, 0.8, 1),
 			size_hint=(1, None),
@@ -123,7 +115,7 @@ class PremiumWorldCard(BoxLayout):
 			orientation="vertical", size_hint=(1, None), height=40, spacing=2
 		)
 
-		progress_label = Label(
+		self.progress_label = progress_label = Label(
 			text="Progreso: 0/50",
 			font_size="10sp",
 			color=(0.7, 0.7, 0.7, 1),
@@ -150,17 +142,48 @@ class PremiumWorldCard(BoxLayout):
 		self.action_button.bind(on_press=self._on_action_button_press)
 		self.add_widget(self.action_button)
 
-		# Actualizar estado inicial
+		# Rellenar si se creó con un mundo concreto
+		if self.world_info is not None:
+			self._apply_world_info()
+
+	def refresh_view_attrs(self, rv, index, data):
+		"""Reutiliza la tarjeta para el mundo en la posición ``index``."""
+		super().refresh_view_attrs(rv, index, data)
+		self._apply_world_info()
+
+	def _apply_world_info(self):
+		"""Vuelca la información estática del mundo en los widgets."""
+		self.world_image.texture = self.visual_manager.get_background_texture(
+			BackgroundType(self.world_info["background"])
+		)
+		self.name_label.text = self.world_info["name"]
+		self.desc_label.text = self.world_info["description"]
+
+		self._reset_card_state()
 		self._update_card_state()
 
+	def _reset_card_state(self):
+		"""Vuelve progreso y botón a su estado inicial.
+
+		La tarjeta se recicla entre mundos: sin esto, un mundo bloqueado
+		heredaría el progreso y el botón del mundo mostrado antes.
+		"""
+		self.progress_label.text = "Progreso: 0/50"
+		self.progress_bar.max = 50
+		self.progress_bar.value = 0
+		self.action_button.text = "🔒 BLOQUEADO"
+		self.action_button.background_color = (0.3, 0.3, 0.3, 1)
+		self.action_button.color = (0.6, 0.6, 0.6, 1)
+
 	def _update_card_state(self):
 		"""Actualiza el estado visual de la tarjeta."""
-		game_state = get_game_state()
+		if self.world_info is None:
+			return
 		world_id = self.world_info["id"]
 
 		# Obtener información de progreso del mundo
-		if hasattr(game_state, "world_manager"):
-			progress_info = game_state.world_manager.get_world_progress_info(world_id)
+		if self.world_manager is not None:
+			progress_info = self.world_manager.get_world_progress_info(world_id)
 
 			if progress_info.get("unlocked", True):  # Por defecto desbloqueado
 				# Mundo desbloqueado
@@ -171,22 +194,15 @@ class PremiumWorldCard(BoxLayout):
 				# Actualizar progreso
 				current_level = progress_info.get("current_level", 1)
 				max_level = progress_info.get("level_range", [1, 50])[1]
-				self.progress_bar.value = current_level
 				self.progress_bar.max = max_level
+				self.progress_bar.value = current_level
 
 				# Actualizar texto de progreso
 				progress_text = f"Progreso: {current_level}/{max_level}"
 				if progress_info.get("completed", False):
 					progress_text += " ✅"
 
-				for child in self.children:
-					if isinstance(child, BoxLayout):
-						for subchild in child.children:
-							if isinstance(subchild, BoxLayout):
-								for label in subchild.children:
-									if isinstance(label, Label) and "Progreso:" in label.text:
-										label.text = progress_text
-										break
+				self.progress_label.text = progress_text
 			else:
 				# Mundo bloqueado
 				self.action_button.text = "🔒 BLOQUEADO"
@@ -195,22 +211,21 @@ class PremiumWorldCard(BoxLayout):
 
 				# Mostrar requisitos
 				unlock_level = progress_info.get("unlock_level", 1)
-				player_level = game_state.player_stats.get_level()
+				player_level = self.game_state.player_stats.get_level()
 
 				if player_level < unlock_level:
 					self.action_button.text = f"🔒 Nivel {unlock_level} requerido"
 
 	def _on_action_button_press(self, button):
 		"""Maneja el clic en el botón de acción."""
-		game_state = get_game_state()
 		world_id = self.world_info["id"]
 
-		if hasattr(game_state, "world_manager"):
-			progress_info = game_state.world_manager.get_world_progress_info(world_id)
+		if self.world_manager is not None:
+			progress_info = self.world_manager.get_world_progress_info(world_id)
 
 			if progress_info.get("unlocked", True):
 				# Cambiar al mundo seleccionado
-				if game_state.world_manager.set_active_world(WorldType(world_id)):
+				if self.world_manager.set_active_world(WorldType(world_id)):
 					# Navegar a la pantalla de combate
 					from ui.navigation import get_navigation_manager
 
@@ -220,7 +235,7 @@ class PremiumWorldCard(BoxLayout):
 						logger.info(f"Navegando al mundo: {self.world_info['name']}")
 			else:
 				# Intentar desbloquear el mundo
-				result = game_state.attempt_world_unlock(WorldType(world_id))
+				result = self.game_state.attempt_world_unlock(WorldType(world_id))
 				if result.get("success"):
 					self._update_card_state()
 					# Animación de desbloqueo
@@ -283,17 +298,20 @@ class WorldSelectionScreen(Screen):
 		)
 		main_layout.add_widget(title_label)
 
-		# Scroll view para las tarjetas de mundos
-		scroll = ScrollView(size_hint=(1, 1), do_scroll_x=False, do_scroll_y=True)
-
-		# Grid layout para las tarjetas
-		self.worlds_grid = GridLayout(
-			cols=2, spacing=20, size_hint_y=None, row_default_height=420, row_force_default=True
+		# Lista reciclada de tarjetas: solo se instancian las visibles
+		self.worlds_grid = RecycleGridLayout(
+			cols=2,
+			spacing=20,
+			default_size=(None, 420),
+			default_size_hint=(1, None),
+			size_hint_y=None,
 		)
 		self.worlds_grid.bind(minimum_height=self.worlds_grid.setter("height"))
 
-		scroll.add_widget(self.worlds_grid)
-		main_layout.add_widget(scroll)
+		self.worlds_view = RecycleView(size_hint=(1, 1), do_scroll_x=False, do_scroll_y=True)
+		self.worlds_view.add_widget(self.worlds_grid)
+		self.worlds_view.viewclass = PremiumWorldCard
+		main_layout.add_widget(self.worlds_view)
 
 		# Botón de regreso
 		back_button = Button(
@@ -313,12 +331,10 @@ class WorldSelectionScreen(Screen):
 		self._load_worlds()
 
 	def _load_worlds(self):
-		"""Carga y muestra las tarjetas de todos los mundos."""
+		"""Carga los mundos en el RecycleView de tarjetas."""
+		self.visual_manager.preload_background_textures()
 		worlds = self.visual_manager.get_all_available_worlds()
-
-		for world_info in worlds:
-			world_card = PremiumWorldCard(world_info)
-			self.worlds_grid.add_widget(world_card)
+		self.worlds_view.data = [{"world_info": world_info} for world_info in worlds]
 
 		logger.info(f"Cargados {len(worlds)} mundos en la interfaz")
 
@@ -332,10 +348,8 @@ class WorldSelectionScreen(Screen):
 
 	def on_enter(self):
 		"""Se ejecuta cuando se entra a la pantalla."""
-		# Actualizar estado de todas las tarjetas
-		for child in self.worlds_grid.children:
-			if isinstance(child, PremiumWorldCard):
-				child._update_card_state()
+		# Actualizar estado de las tarjetas visibles
+		self.worlds_view.refresh_from_data()
 
 		# Precargar assets del mundo activo
 		game_state = get_game_state()
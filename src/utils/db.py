@@ -4,14 +4,87 @@ Gestiona la conexión SQLite y las operaciones básicas de base de datos.
 Utiliza rutas del sistema de usuario para persistencia cross-platform.
 """
 
+import atexit
 import logging
 import sqlite3
+import threading
+from collections import defaultdict
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
 from utils.paths import get_user_data_dir
 
+# PRAGMAs aplicados a la conexión persistente: WAL agrupa escrituras sin
+# bloquear lecturas y synchronous=NORMAL evita un fsync por transacción
+_CONNECTION_PRAGMAS = (
+	"PRAGMA journal_mode=WAL",
+	"PRAGMA synchronous=NORMAL",
+	"PRAGMA temp_store=MEMORY",
+	"PRAGMA cache_size=-8000",
+	"PRAGMA mmap_size=67108864",  # Lecturas por mmap (64 MB) en vez de read()
+)
+
+_STAT_ADD_SQL = (
+	"INSERT INTO stats (key, value) VALUES (?, ?) "
+	"ON CONFLICT(key) DO UPDATE SET value = value + excluded.value"
+)
+_STAT_SET_SQL = (
+	"INSERT INTO stats (key, value) VALUES (?, ?) "
+	"ON CONFLICT(key) DO UPDATE SET value = excluded.value"
+)
+_SETTING_SET_SQL = (
+	"INSERT INTO settings (key, value) VALUES (?, ?) "
+	"ON CONFLICT(key) DO UPDATE SET value = excluded.value"
+)
+_UPGRADE_LEVEL_SET_SQL = (
+	"INSERT INTO upgrades (upgrade_id, name, base_cost, level) VALUES (?, ?, ?, ?) "
+	"ON CONFLICT(upgrade_id) DO UPDATE SET level = excluded.level"
+)
+_PLAYER_UPDATE_SQL = (
+	"UPDATE player SET coins = ?, total_clicks = ?, multiplier = ?, total_playtime = ?, "
+	"last_saved = CURRENT_TIMESTAMP WHERE id = 1"
+)
+
+# Esquema completo, ejecutado con una sola llamada a executescript
+SCHEMA_SQL = """
+-- Tabla del jugador (monedas, progreso general)
+CREATE TABLE IF NOT EXISTS player (
+	id INTEGER PRIMARY KEY CHECK (id = 1),
+	coins INTEGER DEFAULT 0,
+	total_clicks INTEGER DEFAULT 0,
+	multiplier REAL DEFAULT 1.0,
+	last_saved TEXT DEFAULT CURRENT_TIMESTAMP,
+	total_playtime INTEGER DEFAULT 0
+);
+
+-- Tabla de mejoras disponibles y sus niveles
+CREATE TABLE IF NOT EXISTS upgrades (
+	upgrade_id TEXT PRIMARY KEY,
+	name TEXT NOT NULL,
+	level INTEGER DEFAULT 0,
+	base_cost INTEGER NOT NULL,
+	current_cost INTEGER,
+	unlocked BOOLEAN DEFAULT 0,
+	description TEXT
+);
+
+-- Tabla de configuración del usuario
+CREATE TABLE IF NOT EXISTS settings (
+	key TEXT PRIMARY KEY,
+	value TEXT NOT NULL
+);
+
+-- Tabla de estadísticas del juego
+CREATE TABLE IF NOT EXISTS stats (
+	key TEXT PRIMARY KEY,
+	value INTEGER DEFAULT 0
+);
+
+-- Jugador por defecto
+INSERT OR IGNORE INTO player (id) VALUES (1);
+"""
+
 
 class DatabaseManager:
 	"""Gestiona la conexión y operaciones de la base de datos SQLite."""
@@ -19,8 +92,93 @@ class DatabaseManager:
 	def __init__(self):
 		"""Inicializa el gestor de base de datos."""
 		self.db_path = self._get_database_path()
+
+		# Una única conexión para toda la vida del proceso (abrir una por
+		# consulta cuesta un open del archivo y la lectura del esquema). El
+		# guardado automático usa otro hilo, así que el acceso va con un lock
+		self._lock = threading.RLock()
+		self._conn: sqlite3.Connection | None = self._open_connection()
+		atexit.register(self.close)
+
+		# Escrituras frecuentes pendientes, volcadas juntas por flush()
+		self._stat_deltas: defaultdict[str, int] = defaultdict(int)
+		self._player_dirty: tuple | None = None
+
 		self._ensure_database_exists()
 
+		# Copias en memoria de las tablas clave-valor: las lecturas no tocan
+		# SQLite y cada escritura actualiza la copia y la base de datos
+		self._settings: dict[str, str] = {}
+		self._stats: dict[str, int] = {}
+		self._upgrade_levels: dict[str, int] = {}
+		self._load_caches()
+
+	def _load_caches(self) -> None:
+		"""Carga configuración, estadísticas y niveles de mejoras con una consulta por tabla.
+
+		Si una tabla no se puede leer (p. ej. una migración fallida) su copia
+		queda vacía y se registra el error, sin impedir que arranque el juego.
+		"""
+		self._settings = self._load_table("SELECT key, value FROM settings")
+		self._stats = self._load_table("SELECT key, value FROM stats")
+		self._upgrade_levels = self._load_table("SELECT upgrade_id, level FROM upgrades")
+
+	def _load_table(self, query: str) -> dict:
+		"""Lee una tabla de dos columnas como diccionario clave -> valor.
+
+		Args:
+			query: Consulta SELECT de dos columnas
+
+		Returns:
+			Diccionario con los resultados (vacío si la consulta falla)
+		"""
+		try:
+			return dict(self.execute_query(query))
+		except sqlite3.Error as e:
+			logging.error(f"Error cargando caché de base de datos ({query}): {e}")
+			return {}
+
+	def _open_connection(self) -> sqlite3.Connection:
+		"""Abre la conexión persistente y la configura.
+
+		Returns:
+			sqlite3.Connection: Conexión en modo autocommit con los PRAGMAs aplicados
+		"""
+		conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+		conn.row_factory = sqlite3.Row  # Permite acceso por nombre de columna
+		for pragma in _CONNECTION_PRAGMAS:
+			conn.execute(pragma)
+		return conn
+
+	def close(self) -> None:
+		"""Vuelca las escrituras pendientes y cierra la conexión (se llama automáticamente al salir)."""
+		with self._lock:
+			if self._conn is not None:
+				try:
+					self.flush()
+				finally:
+					self._conn.close()
+					self._conn = None
+
+	def flush(self) -> None:
+		"""Escribe en una sola transacción los incrementos de estadísticas y
+		datos del jugador acumulados desde el último volcado."""
+		with self._lock:
+			if not self._stat_deltas and self._player_dirty is None:
+				return
+			deltas = list(self._stat_deltas.items())
+			player = self._player_dirty
+			with self.get_connection() as conn:
+				conn.execute("BEGIN IMMEDIATE")
+				if deltas:
+					conn.executemany(_STAT_ADD_SQL, deltas)
+				if player is not None:
+					conn.execute(_PLAYER_UPDATE_SQL, player)
+				conn.commit()
+			# Solo se descartan tras confirmar la transacción
+			self._stat_deltas.clear()
+			self._player_dirty = None
+
 	def _get_database_path(self) -> Path:
 		"""Obtiene la ruta completa del archivo de base de datos.
 
@@ -59,6 +217,10 @@ class DatabaseManager:
 			if "id" in columns and "upgrade_id" not in columns:
 				logging.info("Migrando tabla upgrades: id -> upgrade_id")
 
+				# Transacción explícita: la conexión está en autocommit y un fallo
+				# entre el DROP y el RENAME dejaría la base de datos sin upgrades
+				cursor.execute("BEGIN")
+
 				# Crear tabla temporal con el nuevo esquema
 				cursor.execute("""
 					CREATE TABLE upgrades_new (
@@ -87,6 +249,8 @@ class DatabaseManager:
 				logging.info("Migración de upgrades completada exitosamente")
 
 		except Exception as e:
+			if conn.in_transaction:
+				conn.rollback()
 			logging.error(f"Error en migración de upgrades: {e}")
 			# Si falla la migración, continuar con el esquema existente
 			pass
@@ -97,77 +261,26 @@ class DatabaseManager:
 		Args:
 			conn: Conexión a la base de datos
 		"""
-		cursor = conn.cursor()
-
-		# Tabla del jugador (monedas, progreso general)
-		cursor.execute("""
-			CREATE TABLE IF NOT EXISTS player (
-				id INTEGER PRIMARY KEY CHECK (id = 1),
-				coins INTEGER DEFAULT 0,
-				total_clicks INTEGER DEFAULT 0,
-				multiplier REAL DEFAULT 1.0,
-				last_saved TEXT DEFAULT CURRENT_TIMESTAMP,
-				total_playtime INTEGER DEFAULT 0
-			)
-		""")
-
-		# Tabla de mejoras disponibles y sus niveles
-		cursor.execute("""
-			CREATE TABLE IF NOT EXISTS upgrades (
-				upgrade_id TEXT PRIMARY KEY,
-				name TEXT NOT NULL,
-				level INTEGER DEFAULT 0,
-				base_cost INTEGER NOT NULL,
-				current_cost INTEGER,
-				unlocked BOOLEAN DEFAULT 0,
-				description TEXT
-			)
-		""")
-
-		# Tabla de configuración del usuario
-		cursor.execute("""
-			CREATE TABLE IF NOT EXISTS settings (
-				key TEXT PRIMARY KEY,
-				value TEXT NOT NULL
-			)
-		""")
-
-		# Tabla de estadísticas del juego
-		cursor.execute("""
-			CREATE TABLE IF NOT EXISTS stats (
-				key TEXT PRIMARY KEY,
-				value INTEGER DEFAULT 0
-			)
-		""")
-
-		conn.commit()
-
-		# Insertar jugador por defecto si no existe
-		cursor.execute("SELECT COUNT(*) FROM player")
-		if cursor.fetchone()[0] == 0:
-			cursor.execute("INSERT INTO player (id) VALUES (1)")
-			conn.commit()
+		conn.executescript(SCHEMA_SQL)
 
 	@contextmanager
 	def get_connection(self):
-		"""Context manager para obtener conexión a la base de datos.
+		"""Context manager para usar la conexión persistente en exclusiva.
 
 		Yields:
 			sqlite3.Connection: Conexión a la base de datos
 		"""
-		conn = None
-		try:
-			conn = sqlite3.connect(self.db_path)
-			conn.row_factory = sqlite3.Row  # Permite acceso por nombre de columna
-			yield conn
-		except Exception as e:
-			if conn:
-				conn.rollback()
-			logging.error(f"Error en operación de base de datos: {e}")
-			raise
-		finally:
-			if conn:
-				conn.close()
+		with self._lock:
+			conn = self._conn
+			if conn is None:
+				raise sqlite3.ProgrammingError("La conexión a la base de datos está cerrada")
+			try:
+				yield conn
+			except Exception as e:
+				if conn.in_transaction:
+					conn.rollback()
+				logging.error(f"Error en operación de base de datos: {e}")
+				raise
 
 	def execute_query(self, query: str, params: tuple = ()) -> list:
 		"""Ejecuta una consulta SELECT y retorna los resultados.
@@ -224,6 +337,7 @@ class DatabaseManager:
 		Returns:
 			Diccionario con los datos del jugador
 		"""
+		self.flush()
 		result = self.execute_query("SELECT * FROM player WHERE id = 1")
 		if result:
 			row = result[0]
@@ -247,16 +361,17 @@ class DatabaseManager:
 	) -> None:
 		"""Actualiza los datos principales del jugador.
 
+		La escritura queda pendiente hasta el próximo flush(); solo se conserva
+		la última llamada.
+
 		Args:
 			coins: Cantidad de monedas
 			total_clicks: Total de clics realizados
 			multiplier: Multiplicador actual
 			total_playtime: Tiempo total jugado en segundos
 		"""
-		self.execute_update(
-			"UPDATE player SET coins = ?, total_clicks = ?, multiplier = ?, total_playtime = ?, last_saved = CURRENT_TIMESTAMP WHERE id = 1",
-			(coins, total_clicks, multiplier, total_playtime),
-		)
+		with self._lock:
+			self._player_dirty = (coins, total_clicks, multiplier, total_playtime)
 
 	def get_setting(self, key: str, default: str = "") -> str:
 		"""Obtiene un valor de configuración.
@@ -268,8 +383,7 @@ class DatabaseManager:
 		Returns:
 			Valor de la configuración
 		"""
-		result = self.execute_query("SELECT value FROM settings WHERE key = ?", (key,))
-		return result[0]["value"] if result else default
+		return self._settings.get(key, default)
 
 	def set_setting(self, key: str, value: str) -> None:
 		"""Establece un valor de configuración.
@@ -278,9 +392,24 @@ class DatabaseManager:
 			key: Clave de la configuración
 			value: Valor a establecer
 		"""
-		self.execute_update(
-			"INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", (key, value)
-		)
+		with self._lock:
+			self.execute_update(_SETTING_SET_SQL, (key, value))
+			self._settings[key] = value
+
+	def set_settings(self, items: dict[str, str]) -> None:
+		"""Establece varios valores de configuración en una única transacción.
+
+		Args:
+			items: Diccionario clave -> valor a establecer
+		"""
+		if not items:
+			return
+		with self.get_connection() as conn:
+			# Transacción explícita: en autocommit cada fila sería una transacción
+			conn.execute("BEGIN")
+			conn.executemany(_SETTING_SET_SQL, list(items.items()))
+			conn.commit()
+			self._settings.update(items)
 
 	def get_stat(self, key: str) -> int:
 		"""Obtiene una estadística del juego.
@@ -291,8 +420,7 @@ class DatabaseManager:
 		Returns:
 			Valor de la estadística
 		"""
-		result = self.execute_query("SELECT value FROM stats WHERE key = ?", (key,))
-		return result[0]["value"] if result else 0
+		return self._stats.get(key, 0)
 
 	def set_stat(self, key: str, value: int) -> None:
 		"""Establece una estadística del juego.
@@ -301,19 +429,23 @@ class DatabaseManager:
 			key: Clave de la estadística
 			value: Valor a establecer
 		"""
-		self.execute_update("INSERT OR REPLACE INTO stats (key, value) VALUES (?, ?)", (key, value))
+		with self._lock:
+			self._stat_deltas.pop(key, None)  # El valor fijado sustituye a los incrementos pendientes
+			self.execute_update(_STAT_SET_SQL, (key, value))
+			self._stats[key] = value
 
 	def increment_stat(self, key: str, amount: int = 1) -> None:
 		"""Incrementa una estadística del juego.
 
+		El incremento se acumula en memoria y se escribe en el próximo flush().
+
 		Args:
 			key: Clave de la estadística
 			amount: Cantidad a incrementar
 		"""
-		self.execute_update(
-			"INSERT OR REPLACE INTO stats (key, value) VALUES (?, COALESCE((SELECT value FROM stats WHERE key = ?), 0) + ?)",
-			(key, key, amount),
-		)
+		with self._lock:
+			self._stat_deltas[key] += amount
+			self._stats[key] = self._stats.get(key, 0) + amount
 
 	def get_upgrade_level(self, upgrade_id: str) -> int:
 		"""Obtiene el nivel actual de una mejora.
@@ -324,10 +456,7 @@ class DatabaseManager:
 		Returns:
 			Nivel de la mejora (0 si no existe)
 		"""
-		result = self.execute_query(
-			"SELECT level FROM upgrades WHERE upgrade_id = ?", (upgrade_id,)
-		)
-		return result[0]["level"] if result else 0
+		return self._upgrade_levels.get(upgrade_id, 0)
 
 	def set_upgrade_level(self, upgrade_id: str, level: int) -> None:
 		"""Establece el nivel de una mejora.
@@ -336,9 +465,10 @@ class DatabaseManager:
 			upgrade_id: ID de la mejora
 			level: Nuevo nivel
 		"""
-		self.execute_update(
-			"INSERT OR REPLACE INTO upgrades (upgrade_id, level) VALUES (?, ?)", (upgrade_id, level)
-		)
+		with self._lock:
+			# name y base_cost son NOT NULL: una fila nueva usa el id como nombre
+			self.execute_update(_UPGRADE_LEVEL_SET_SQL, (upgrade_id, upgrade_id, 0, level))
+			self._upgrade_levels[upgrade_id] = level
 
 	def get_all_upgrades(self) -> dict[str, int]:
 		"""Obtiene todos los niveles de mejoras.
@@ -346,8 +476,7 @@ class DatabaseManager:
 		Returns:
 			Diccionario con upgrade_id: level
 		"""
-		result = self.execute_query("SELECT upgrade_id, level FROM upgrades")
-		return {row["upgrade_id"]: row["level"] for row in result}
+		return dict(self._upgrade_levels)
 
 
 # Instancia global del gestor de base de datos
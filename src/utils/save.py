@@ -199,6 +199,18 @@ class SaveManager:
 		except Exception as e:
 			logging.error(f"Error guardando configuración {key}: {e}")
 
+	def save_settings(self, settings: dict[str, str]) -> None:
+		"""Guarda varias configuraciones en una sola escritura.
+		
+		Args:
+			settings: Diccionario clave -> valor a guardar
+		"""
+		try:
+			self.db.set_settings(settings)
+			logging.debug(f"Configuraciones guardadas: {len(settings)}")
+		except Exception as e:
+			logging.error(f"Error guardando configuraciones: {e}")
+
 	def get_setting(self, key: str, default: str = "") -> str:
 		"""Obtiene una configuración específica.
 		